@@ -3,12 +3,14 @@ Bets API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 import asyncio
 
-from app.core.database import get_sys_db, get_espn_db
+from app.core.config import settings
+from app.core.database import get_sys_db, get_espn_db, get_async_sys_db, get_async_espn_db
 from app.models.espn_bet import Bet as EspnBet
 from app.schemas.bet import BetResponse, BetCreate, BetUpdate, BetType, BetStatus
 from app.services.bet_service import BetService
@@ -20,6 +22,14 @@ from app.models.user_accounts import UserAccount
 
 router = APIRouter()
 
+async def get_bet_service(async_db: AsyncSession = Depends(get_async_sys_db)):
+    """BetService sobre AsyncSession; si app y espn comparten base de datos usa una sola sesión"""
+    if settings.SHARED_DATABASE:
+        yield BetService(async_db)
+        return
+    async for async_espn_db in get_async_espn_db():
+        yield BetService(async_db, async_espn_db)
+
 async def build_bet_response(bet: EspnBet, espn_db: Session) -> BetResponse:
     """Construir BetResponse con información del juego (usando modelo normalizado)"""
     # Obtener información del juego
@@ -32,12 +42,12 @@ async def build_bet_response(bet: EspnBet, espn_db: Session) -> BetResponse:
         if game_dict:
             game_info = game_dict
         else:
-            # Si no se puede obtener el juego, crear un dict básico
+            # Si no se puede obtener el juego, usar los snapshots guardados en la apuesta
             game_info = {
                 "id": bet.game_id,
-                "home_team": None,
-                "away_team": None,
-                "game_date": None
+                "home_team": bet.home_team_snapshot,
+                "away_team": bet.away_team_snapshot,
+                "game_date": bet.game_date_snapshot
             }
     except Exception as e:
         # Si no se puede obtener el juego, crear un dict básico
@@ -45,9 +55,9 @@ async def build_bet_response(bet: EspnBet, espn_db: Session) -> BetResponse:
         traceback.print_exc()
         game_info = {
             "id": bet.game_id,
-            "home_team": None,
-            "away_team": None,
-            "game_date": None
+            "home_team": bet.home_team_snapshot,
+            "away_team": bet.away_team_snapshot,
+            "game_date": bet.game_date_snapshot
         }
     
     # Obtener información de la selección de la apuesta
@@ -112,7 +122,7 @@ async def build_bet_response(bet: EspnBet, espn_db: Session) -> BetResponse:
         "actual_payout": actual_payout,
         "placed_at": bet.placed_at,
         "settled_at": bet.settled_at,
-        "created_at": bet.created_at,
+        "created_at": bet.placed_at,  # bets ya no tiene created_at; se conserva en la respuesta
         "updated_at": bet.updated_at,
         "game": game_info,
         "selected_team": selected_team_info
@@ -130,18 +140,23 @@ async def get_user_bets(
     status: Optional[str] = Query(None, description="Filter by bet status (pending, won, lost, cancelled)"),
     limit: int = Query(50, description="Number of bets to return"),
     offset: int = Query(0, description="Number of bets to skip"),
+    before: Optional[datetime] = Query(None, description="Cursor: placed_at de la última apuesta de la página anterior"),
+    before_id: Optional[int] = Query(None, description="Cursor: id de la última apuesta de la página anterior"),
     current_user: UserAccount = Depends(get_current_user),
-    db: Session = Depends(get_sys_db),
-    espn_db: Session = Depends(get_espn_db)
+    espn_db: Session = Depends(get_espn_db),  # MatchService (build_bet_response)
+    bet_service: BetService = Depends(get_bet_service)
 ):
-    """Get current user's bets"""
+    """Get current user's bets
+    Paginación por offset o por cursor before/before_id (placed_at, id del último elemento recibido)"""
+    if (before is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before and before_id must be provided together")
     try:
-        bet_service = BetService(db, espn_db)
         bets = await bet_service.get_user_bets(
             user_id=current_user.id,
             status=status,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=(before, before_id) if before is not None else None
         )
         # Construir respuestas con información del juego
         return await asyncio.gather(*[build_bet_response(bet, espn_db) for bet in bets])
@@ -153,12 +168,11 @@ async def place_bet(
     bet: BetCreate,
     current_user: UserAccount = Depends(get_current_user),
     db: Session = Depends(get_sys_db),
-    espn_db: Session = Depends(get_espn_db)
+    espn_db: Session = Depends(get_espn_db),
+    bet_service: BetService = Depends(get_bet_service)
 ):
     """Place a new bet"""
     try:
-        bet_service = BetService(db, espn_db)
-        
         # Validate that user is a client (only clients can place bets)
         from app.services.user_service import UserService
         user_service = UserService(db)
@@ -169,9 +183,9 @@ async def place_bet(
                 detail="Only clients can place bets"
             )
         
-        # Check if user has enough credits
-        user_credits = await user_service.get_user_credits(current_user.id)
-        if user_credits is None or user_credits < bet.bet_amount:
+        # Check if user has enough credits (la fila de clients ya está cargada; el UPDATE con
+        # guarda de saldo en place_bet sigue siendo la comprobación definitiva)
+        if client.credits < bet.bet_amount:
             raise HTTPException(
                 status_code=400, 
                 detail="Insufficient credits for this bet"
@@ -188,7 +202,7 @@ async def place_bet(
         
         # Registrar en auditoría (RF-09)
         audit_service = AuditService(db)
-        await audit_service.log_action(
+        audit_service.log_action(
             action="bet.placed",
             actor_user_id=current_user.id,
             resource_type="bet",
@@ -222,14 +236,11 @@ async def place_bet(
         try:
             from app.services.queue_service import queue_service
             from app.tasks.email_tasks import send_notification_email_task
-            from app.services.user_service import UserService
-            user_service = UserService(db)
-            user = await user_service.get_user_by_id(current_user.id)
-            if user and user.email:
+            if current_user.email:
                 # Queue email notification (non-blocking)
                 queue_service.enqueue(
                     send_notification_email_task,
-                    user.email,
+                    current_user.email,
                     f"Apuesta Confirmada - ${bet.bet_amount}",
                     f"<p>Tu apuesta de ${bet.bet_amount} ha sido confirmada. ID: {new_bet.id}</p>",
                     queue_name='default'
@@ -258,12 +269,10 @@ async def place_bet(
 @router.get("/stats/summary")
 async def get_betting_stats(
     current_user: UserAccount = Depends(get_current_user),
-    db: Session = Depends(get_sys_db),
-    espn_db: Session = Depends(get_espn_db)
+    bet_service: BetService = Depends(get_bet_service)
 ):
     """Get user's betting statistics"""
     try:
-        bet_service = BetService(db, espn_db)
         stats = await bet_service.get_user_betting_stats(current_user.id)
         return stats
     except Exception as e:
@@ -281,12 +290,11 @@ async def get_betting_stats(
 async def get_bet(
     bet_id: int,
     current_user: UserAccount = Depends(get_current_user),
-    db: Session = Depends(get_sys_db),
-    espn_db: Session = Depends(get_espn_db)
+    espn_db: Session = Depends(get_espn_db),  # MatchService (build_bet_response)
+    bet_service: BetService = Depends(get_bet_service)
 ):
     """Get a specific bet by ID"""
     try:
-        bet_service = BetService(db, espn_db)
         bet = await bet_service.get_bet_by_id(bet_id, current_user.id)
         if not bet:
             raise HTTPException(status_code=404, detail="Bet not found")
@@ -301,12 +309,11 @@ async def update_bet(
     bet_id: int,
     bet_update: BetUpdate,
     current_user: UserAccount = Depends(get_current_user),
-    db: Session = Depends(get_sys_db),
-    espn_db: Session = Depends(get_espn_db)
+    espn_db: Session = Depends(get_espn_db),  # MatchService (build_bet_response)
+    bet_service: BetService = Depends(get_bet_service)
 ):
     """Update a bet (only if pending)"""
     try:
-        bet_service = BetService(db, espn_db)
         updated_bet = await bet_service.update_bet(bet_id, bet_update, current_user.id)
         if not updated_bet:
             raise HTTPException(status_code=404, detail="Bet not found or cannot be updated")
@@ -320,12 +327,10 @@ async def update_bet(
 async def cancel_bet(
     bet_id: int,
     current_user: UserAccount = Depends(get_current_user),
-    db: Session = Depends(get_sys_db),
-    espn_db: Session = Depends(get_espn_db)
+    bet_service: BetService = Depends(get_bet_service)
 ):
     """Cancel a pending bet"""
     try:
-        bet_service = BetService(db, espn_db)
         success = await bet_service.cancel_bet(bet_id, current_user.id)
         if not success:
             raise HTTPException(status_code=404, detail="Bet not found or cannot be cancelled")
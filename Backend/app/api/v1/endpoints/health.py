@@ -5,11 +5,12 @@ SLOs expuestos (métricas/health) y endpoints de readiness/liveness
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import Dict, Any
 
-from app.core.database import get_sys_db, sys_engine, espn_engine
+from app.core.database import get_sys_db, get_async_sys_db, espn_async_engine
 from app.models import Request, AuditLog, Outbox, Prediction, UserAccount
 from app.services.cache_service import cache_service
 from app.api.v1.endpoints.admin import require_staff_permission
@@ -48,7 +49,7 @@ async def liveness_check():
 
 
 @router.get("/readiness")
-async def readiness_check(db: Session = Depends(get_sys_db)):
+async def readiness_check(db: AsyncSession = Depends(get_async_sys_db)):
     """
     Readiness probe endpoint
     RF-14: Verifica que la aplicación esté lista para recibir tráfico
@@ -60,7 +61,7 @@ async def readiness_check(db: Session = Depends(get_sys_db)):
         
         # Verificar conexión a BD app
         try:
-            db.execute(text("SELECT 1"))
+            await db.execute(text("SELECT 1"))
             checks["database_app"] = "ok"
         except Exception as e:
             checks["database_app"] = f"error: {str(e)}"
@@ -68,8 +69,8 @@ async def readiness_check(db: Session = Depends(get_sys_db)):
         
         # Verificar conexión a BD espn
         try:
-            with espn_engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            async with espn_async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
             checks["database_espn"] = "ok"
         except Exception as e:
             checks["database_espn"] = f"error: {str(e)}"
@@ -101,7 +102,9 @@ async def readiness_check(db: Session = Depends(get_sys_db)):
         # Verificar proveedores activos (opcional)
         try:
             from app.models import Provider
-            active_providers = db.query(Provider).filter(Provider.is_active == True).count()
+            active_providers = await db.scalar(
+                select(func.count()).select_from(Provider).where(Provider.is_active == True)
+            )
             checks["providers"] = f"ok ({active_providers} active)"
         except Exception as e:
             checks["providers"] = f"warning: {str(e)}"
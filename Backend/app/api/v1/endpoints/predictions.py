@@ -2,12 +2,12 @@
 Predictions API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_espn_db, get_sys_db
-from app.schemas.prediction import PredictionResponse, PredictionRequest, MatchupRequest, MatchupResponse
+from app.schemas.prediction import PredictionResponse, PredictionRequest, MatchupRequest, MatchupResponse, PREDICTION_LIST_ADAPTER
 from app.services.prediction_service import PredictionService
 from app.services.feature_extractor import FeaturesNotAvailableError
 from app.services.ml_inference import (
@@ -93,7 +93,7 @@ async def get_prediction(
         if idempotency_data.get("x_idempotency_key"):
             idempotency_service = idempotency_data["idempotency_service"]
             # Serializar correctamente los datetime a ISO format
-            prediction_dict = prediction.model_dump(mode='json') if hasattr(prediction, 'model_dump') else (prediction.dict() if hasattr(prediction, 'dict') else prediction)
+            prediction_dict = prediction.model_dump(mode='json') if isinstance(prediction, PredictionResponse) else prediction
             await idempotency_service.store_response(
                 request_key=idempotency_data["x_idempotency_key"],
                 response_data=prediction_dict
@@ -106,7 +106,7 @@ async def get_prediction(
         # Publicar evento en outbox (RF-08)
         outbox_service = OutboxService(sys_db)
         # Serializar correctamente los datetime a ISO format
-        prediction_dict = prediction.model_dump(mode='json') if hasattr(prediction, 'model_dump') else (prediction.dict() if hasattr(prediction, 'dict') else prediction)
+        prediction_dict = prediction.model_dump(mode='json') if isinstance(prediction, PredictionResponse) else prediction
         await outbox_service.publish_prediction_completed(
             request_id=request_id,
             prediction_data=prediction_dict,
@@ -115,7 +115,7 @@ async def get_prediction(
         
         # Registrar en auditoría (RF-09)
         audit_service = AuditService(sys_db)
-        await audit_service.log_action(
+        audit_service.log_action(
             action="prediction.completed",
             actor_user_id=current_user.id,
             resource_type="prediction",
@@ -229,7 +229,7 @@ async def get_game_prediction(
         # Publicar evento en outbox (RF-08)
         outbox_service = OutboxService(sys_db)
         # Serializar correctamente los datetime a ISO format
-        prediction_dict = prediction.model_dump(mode='json') if hasattr(prediction, 'model_dump') else (prediction.dict() if hasattr(prediction, 'dict') else prediction)
+        prediction_dict = prediction.model_dump(mode='json') if isinstance(prediction, PredictionResponse) else prediction
         await outbox_service.publish_prediction_completed(
             request_id=request_id,
             prediction_data=prediction_dict,
@@ -238,7 +238,7 @@ async def get_game_prediction(
         
         # Registrar en auditoría (RF-09)
         audit_service = AuditService(sys_db)
-        await audit_service.log_action(
+        audit_service.log_action(
             action="prediction.requested",
             actor_user_id=current_user.id,
             resource_type="request",
@@ -251,7 +251,7 @@ async def get_game_prediction(
             },
             commit=True
         )
-        await audit_service.log_action(
+        audit_service.log_action(
             action="prediction.completed",
             actor_user_id=current_user.id,
             resource_type="prediction",
@@ -294,17 +294,20 @@ async def get_upcoming_predictions(
     try:
         # Las predicciones de partidos próximos son iguales para todos los
         # usuarios → caché compartido (no incluye user_id en la clave).
-        cache_key = cache_service._generate_key("predictions_upcoming", days=days)
+        # v2: el valor cacheado es el JSON serializado (antes, la lista de dicts)
+        cache_key = cache_service._generate_key("predictions_upcoming:v2", days=days)
 
         async def fetch_upcoming():
             # sys_db se usa para cargar el modelo (app.model_versions)
             # db (espn_db) se usa para consultar espn.games en get_upcoming_predictions
             prediction_service = PredictionService(sys_db)
             prediction_service.db = db  # override para que get_upcoming_predictions use espn_db
-            return await prediction_service.get_upcoming_predictions(
+            predictions = await prediction_service.get_upcoming_predictions(
                 days=days,
                 user_id=current_user.id
             )
+            # Se cachea el JSON ya serializado: un hit no vuelve a serializar
+            return PREDICTION_LIST_ADAPTER.dump_json(predictions).decode("utf-8")
 
         predictions = await cache_service.get_or_set(
             key=cache_key,
@@ -313,7 +316,7 @@ async def get_upcoming_predictions(
             stale_ttl_seconds=900,  # hasta 15 min stale mientras revalida
             allow_stale=True
         )
-        return predictions
+        return Response(content=predictions, media_type="application/json")
     except ModelNotLoadedError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -95,13 +95,7 @@ async def get_request(
             )
         
         # Cargar metadata si existe
-        request_metadata = None
-        if request.request_metadata:
-            import json
-            try:
-                request_metadata = json.loads(request.request_metadata)
-            except:
-                request_metadata = request.request_metadata
+        request_metadata = request.request_metadata
         
         return {
             "id": request.id,
@@ -157,13 +151,7 @@ async def get_request_by_key(
             )
         
         # Cargar metadata si existe
-        request_metadata = None
-        if request.request_metadata:
-            import json
-            try:
-                request_metadata = json.loads(request.request_metadata)
-            except:
-                request_metadata = request.request_metadata
+        request_metadata = request.request_metadata
         
         # Manejar status como enum o string
         status_value = request.status.value if hasattr(request.status, 'value') else str(request.status)
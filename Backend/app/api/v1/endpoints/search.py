@@ -10,6 +10,7 @@ from datetime import datetime, date
 
 from app.core.database import get_sys_db
 from app.models import Request, IdempotencyKey, AuditLog, Outbox
+from app.services.idempotency_service import request_key_uuid
 from app.services.auth_service import get_current_user
 from app.models.user_accounts import UserAccount
 from app.api.v1.endpoints.admin import require_staff_permission
@@ -97,12 +98,16 @@ async def search_idempotency_keys(
     """
     Buscar idempotency keys
     RF-12: Búsqueda por request_key y rango de fechas
+    La columna guarda el UUID normalizado (request_key_uuid); la clave original
+    se recupera del request asociado y el UUID se devuelve como request_key_uuid
     """
     try:
-        query = db.query(IdempotencyKey)
+        query = db.query(IdempotencyKey, Request.request_key).outerjoin(
+            Request, Request.id == IdempotencyKey.request_id
+        )
         
         if request_key:
-            query = query.filter(IdempotencyKey.request_key == request_key)
+            query = query.filter(IdempotencyKey.request_key == request_key_uuid(request_key))
         
         if date_from:
             query = query.filter(IdempotencyKey.created_at >= datetime.combine(date_from, datetime.min.time()))
@@ -120,12 +125,13 @@ async def search_idempotency_keys(
             "results": [
                 {
                     "id": k.id,
-                    "request_key": k.request_key,
+                    "request_key": original_key,  # X-Idempotency-Key enviada (None si no hay request asociado)
+                    "request_key_uuid": str(k.request_key),
                     "request_id": k.request_id,
                     "created_at": k.created_at.isoformat() if k.created_at else None,
                     "expires_at": k.expires_at.isoformat() if k.expires_at else None
                 }
-                for k in results
+                for k, original_key in results
             ]
         }
     except Exception as e:
@@ -142,55 +148,53 @@ async def search_audit_logs(
     date_to: Optional[date] = Query(None, description="Fecha hasta"),
     limit: int = Query(50, description="Número de resultados"),
     offset: int = Query(0, description="Offset para paginación"),
+    before: Optional[datetime] = Query(None, description="Cursor: created_at del último log de la página anterior"),
+    before_id: Optional[int] = Query(None, description="Cursor: id del último log de la página anterior"),
     admin_user: UserAccount = Depends(require_staff_permission),
     db: Session = Depends(get_sys_db)
 ):
     """
     Buscar logs de auditoría
     RF-12: Búsqueda por múltiples criterios y rango de fechas
+    Paginación por offset (con total) o por cursor before/before_id (sin COUNT, coste constante)
     """
     try:
         from app.services.audit_service import AuditService
         
+        if (before is None) != (before_id is None):
+            raise HTTPException(status_code=400, detail="before and before_id must be provided together")
+        
         audit_service = AuditService(db)
         
         date_from_dt = datetime.combine(date_from, datetime.min.time()) if date_from else None
         date_to_dt = datetime.combine(date_to, datetime.max.time()) if date_to else None
-        
-        # Get total count before pagination
-        from app.models import AuditLog
-        count_query = db.query(AuditLog)
-        
-        if actor_user_id:
-            count_query = count_query.filter(AuditLog.actor_user_id == actor_user_id)
-        if action:
-            count_query = count_query.filter(AuditLog.action == action)
-        if resource_type:
-            count_query = count_query.filter(AuditLog.resource_type == resource_type)
-        if resource_id:
-            count_query = count_query.filter(AuditLog.resource_id == resource_id)
-        if date_from_dt:
-            count_query = count_query.filter(AuditLog.created_at >= date_from_dt)
-        if date_to_dt:
-            count_query = count_query.filter(AuditLog.created_at <= date_to_dt)
-        
-        total_count = count_query.count()
-        
-        results = await audit_service.get_audit_logs(
+        filters = dict(
             actor_user_id=actor_user_id,
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
             date_from=date_from_dt,
             date_to=date_to_dt,
+        )
+        cursor = (before, before_id) if before is not None else None
+        
+        # El total solo se calcula en la paginación por offset
+        total_count = audit_service.count_audit_logs(**filters) if cursor is None else None
+        
+        results, next_cursor = audit_service.get_audit_logs(
+            **filters,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         
         return {
             "total": total_count,
             "limit": limit,
             "offset": offset,
+            "next_cursor": (
+                {"before": next_cursor[0].isoformat(), "before_id": next_cursor[1]} if next_cursor else None
+            ),
             "results": [
                 {
                     "id": log.id,
@@ -206,6 +210,8 @@ async def search_audit_logs(
                 for log in results
             ]
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching audit logs: {str(e)}")
 
@@ -2,10 +2,10 @@
 Users API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import Decimal
 import os
 import shutil
@@ -14,8 +14,9 @@ from pathlib import Path
 
 from app.core.database import get_sys_db
 from app.core.config import settings
-from app.models.user_accounts import UserAccount, Client, Administrator, Operator
+from app.models.user_accounts import UserAccount, Client, Administrator, Operator, load_user_account
 from app.models.role import Role
+from app.models.transaction import Transaction
 from app.schemas.user import (
     UserResponse, UserCreate, UserUpdate, UserLogin, Token,
     SendVerificationCodeRequest, VerifyCodeRequest, RegisterWithVerificationRequest,
@@ -23,7 +24,7 @@ from app.schemas.user import (
     TwoFactorSetupResponse, TwoFactorVerifyRequest, TwoFactorEnableRequest,
     TwoFactorDisableRequest, TwoFactorStatusResponse,
     AvatarUploadResponse, UserSessionResponse, SessionRevokeRequest,
-    DeactivateAccountRequest
+    DeactivateAccountRequest, USER_LIST_ADAPTER
 )
 from app.services.user_service import UserService
 from app.services.auth_service import get_current_user, authenticate_user, create_access_token, get_password_hash, verify_password
@@ -39,32 +40,13 @@ router = APIRouter()
 
 def get_user_avatar_url(db: Session, user_id: int) -> Optional[str]:
     """
-    Helper function to get avatar_url from user's individual table.
+    Helper function to get the user's avatar_url.
     
-    This is a read-only operation. If user doesn't exist in any type table,
-    returns None without modifying the database.
-    
-    Searches directly in all tables to avoid race conditions where the user
-    is moved between tables between determining current_table and querying.
+    Lee la copia en user_accounts.avatar_url (la mantiene el trigger
+    app.sync_user_profile desde la tabla del tipo de usuario): un lookup por PK
+    en lugar de buscar en clients/administrators/operators.
     """
-    # Buscar directamente en todas las tablas sin depender de current_table
-    # Esto evita condiciones de carrera donde el usuario se mueve entre tablas
-    # entre determinar current_table y obtener el registro
-    client = db.query(Client).filter(Client.user_account_id == user_id).first()
-    if client:
-        return client.avatar_url
-    
-    admin = db.query(Administrator).filter(Administrator.user_account_id == user_id).first()
-    if admin:
-        return admin.avatar_url
-    
-    operator = db.query(Operator).filter(Operator.user_account_id == user_id).first()
-    if operator:
-        return operator.avatar_url
-    
-    # If user doesn't exist in any type table, return None
-    # This is a read-only operation - do not modify the database
-    return None
+    return db.query(UserAccount.avatar_url).filter(UserAccount.id == user_id).scalar()
 logger = logging.getLogger(__name__)
 
 
@@ -407,7 +389,7 @@ async def register_user(
             "username": new_user_account.username,
             "email": new_user_account.email,
             "is_active": new_user_account.is_active,
-            "credits": float(client.credits) if client else None,
+            "credits": client.credits if client else None,
             "rol": user_role,
             "created_at": new_user_account.created_at,
             "updated_at": new_user_account.updated_at,
@@ -443,30 +425,19 @@ async def get_current_user_info(
     db: Session = Depends(get_sys_db)
 ):
     """Get current user information"""
-    # Obtener información adicional según el tipo de usuario
-    user_service = UserService(db)
-    client = await user_service.get_client_by_user_id(current_user.id)
-    user_role = await user_service.get_user_role_code(current_user.id)
+    # Usuario + perfil + rol del perfil en un solo SELECT (sentencia precompilada)
+    user_account = load_user_account(db, current_user.id)
+    if user_account is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    # Misma prioridad que UserService.get_user_role_code: client > administrator > operator
+    profile = user_account.client or user_account.administrator or user_account.operator
+    user_role = profile.role.code if profile is not None and profile.role is not None else None
     if not user_role:
         raise HTTPException(status_code=500, detail="User role not found")
     
-    user_dict = {
-        "id": current_user.id,
-        "username": current_user.username,
-        "email": current_user.email,
-        "is_active": current_user.is_active,
-        "credits": float(client.credits) if client else None,
-        "rol": user_role,
-        "created_at": current_user.created_at,
-        "updated_at": current_user.updated_at,
-        "avatar_url": get_user_avatar_url(db, current_user.id),
-        # Include Client profile fields if user is a client
-        "first_name": client.first_name if client else None,
-        "last_name": client.last_name if client else None,
-        "phone": client.phone if client else None,
-        "date_of_birth": client.date_of_birth if client else None,
-    }
-    return user_dict
+    # Datos de la base de datos: sin revalidar (model_construct) y serializados una sola vez
+    user_response = UserResponse.from_orm_fast(user_account, user_role, user_account.client)
+    return Response(content=user_response.model_dump_json(), media_type="application/json")
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
@@ -498,7 +469,7 @@ async def update_current_user(
             "username": updated_user.username,
             "email": updated_user.email,
             "is_active": updated_user.is_active,
-            "credits": float(client.credits) if client else None,
+            "credits": client.credits if client else None,
             "rol": user_role,
             "created_at": updated_user.created_at,
             "updated_at": updated_user.updated_at,
@@ -615,7 +586,7 @@ async def change_password(
             )
             
             audit_service = AuditService(db)
-            await audit_service.log_action(
+            audit_service.log_action(
                 action="password_change_failed",
                 actor_user_id=current_user.id,
                 resource_type="user",
@@ -636,7 +607,7 @@ async def change_password(
         
         # Log password change
         audit_service = AuditService(db)
-        await audit_service.log_action(
+        audit_service.log_action(
             action="password_changed",
             actor_user_id=current_user.id,
             resource_type="user",
@@ -833,6 +804,42 @@ async def get_user_credits(
         "credits": credits
     }
 
+@router.get("/credits/history")
+async def get_credit_history(
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    limit: int = 50,
+    current_user: UserAccount = Depends(get_current_user),
+    db: Session = Depends(get_sys_db)
+):
+    """Get current user's credit movements, newest first (keyset pagination)"""
+    if (before is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before and before_id must be provided together")
+    limit = max(1, min(limit, 200))
+    cursor = (before, before_id) if before is not None else None
+    transactions = Transaction.page(db, current_user.id, cursor=cursor, limit=limit)
+    
+    items = [
+        {
+            "id": tx.id,
+            "bet_id": tx.bet_id,
+            "transaction_type": tx.transaction_type,
+            "amount": float(tx.amount),
+            "balance_before": float(tx.balance_before),
+            "balance_after": float(tx.balance_after),
+            "description": tx.description,
+            "created_at": tx.created_at,
+        }
+        for tx in transactions
+    ]
+    # Siguiente cursor = último elemento de la página (None si no hay más)
+    next_cursor = None
+    if len(transactions) == limit:
+        last = transactions[-1]
+        next_cursor = {"before": last.created_at, "before_id": last.id}
+    
+    return {"items": items, "next_cursor": next_cursor}
+
 @router.post("/credits/add")
 async def add_credits(
     amount: float,
@@ -845,16 +852,15 @@ async def add_credits(
             raise HTTPException(status_code=400, detail="Amount must be positive")
         
         user_service = UserService(db)
-        success = await user_service.add_credits(current_user.id, amount)
+        # UPDATE ... RETURNING: el saldo nuevo sin releer la fila
+        new_balance = await user_service.apply_credit_delta(current_user.id, amount)
         
-        if not success:
+        if new_balance is None:
             raise HTTPException(status_code=404, detail="User is not a client")
         
-        new_balance = await user_service.get_user_credits(current_user.id)
-        
         return {
             "message": f"Added ${amount} credits to your account",
-            "new_balance": new_balance
+            "new_balance": float(new_balance)
         }
     except HTTPException:
         raise
@@ -892,20 +898,10 @@ async def get_all_users(
                 # Si no tiene rol, saltar este usuario o usar un valor por defecto
                 continue
             
-            user_dict = {
-                "id": user_account.id,
-                "username": user_account.username,
-                "email": user_account.email,
-                "is_active": user_account.is_active,
-                "credits": float(client.credits) if client else None,
-                "rol": user_role,
-                "created_at": user_account.created_at,
-                "updated_at": user_account.updated_at,
-                "avatar_url": get_user_avatar_url(db, user_account.id),
-            }
-            result.append(user_dict)
+            # El listado no incluye los campos de perfil
+            result.append(UserResponse.from_orm_fast(user_account, user_role, client, with_profile=False))
         
-        return result
+        return Response(content=USER_LIST_ADAPTER.dump_json(result), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -942,23 +938,8 @@ async def get_user_by_id(
         if not user_role:
             raise HTTPException(status_code=500, detail="User role not found")
         
-        user_dict = {
-            "id": user_account.id,
-            "username": user_account.username,
-            "email": user_account.email,
-            "is_active": user_account.is_active,
-            "credits": float(client.credits) if client else None,
-            "rol": user_role,
-            "created_at": user_account.created_at,
-            "updated_at": user_account.updated_at,
-            "avatar_url": get_user_avatar_url(db, user_account.id),
-            # Include Client profile fields if user is a client
-            "first_name": client.first_name if client else None,
-            "last_name": client.last_name if client else None,
-            "phone": client.phone if client else None,
-            "date_of_birth": client.date_of_birth if client else None,
-        }
-        return user_dict
+        user_response = UserResponse.from_orm_fast(user_account, user_role, client)
+        return Response(content=user_response.model_dump_json(), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -1007,7 +988,7 @@ async def create_user_admin(
             "username": new_user_account.username,
             "email": new_user_account.email,
             "is_active": new_user_account.is_active,
-            "credits": float(client.credits) if client else None,
+            "credits": client.credits if client else None,
             "rol": user_role,
             "created_at": new_user_account.created_at,
             "updated_at": new_user_account.updated_at,
@@ -1189,7 +1170,7 @@ async def update_user_admin(
             "username": updated_user.username,
             "email": updated_user.email,
             "is_active": updated_user.is_active,
-            "credits": float(client.credits) if client else None,
+            "credits": client.credits if client else None,
             "rol": user_role,
             "created_at": updated_user.created_at,
             "updated_at": updated_user.updated_at,
@@ -7,29 +7,30 @@ from functools import wraps
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core import authz_cache
 from app.core.database import get_sys_db
-from app.models import UserAccount, UserRole, Permission, Role
+from app.models import UserAccount, Permission, Role
 from app.services.auth_service import get_current_user
 
 def get_user_permissions(db: Session, user_id: int) -> List[str]:
     """Get all permission codes for a user"""
-    # Obtener roles activos del usuario
-    user_roles = db.query(UserRole).filter(
-        UserRole.user_id == user_id,
-        UserRole.is_active == True
-    ).all()
+    # Roles activos del usuario (caché TTL por user_id, app.core.authz_cache)
+    role_ids = authz_cache.get_user_role_ids(db, user_id)
     
-    if not user_roles:
+    if not role_ids:
         return []
     
-    role_ids = [ur.role_id for ur in user_roles]
+    # Hot path: mapa role_id -> permisos en memoria (app.core.catalog_cache)
+    from app.core import catalog_cache
+    if catalog_cache.is_loaded():
+        return sorted(catalog_cache.get_permissions_for_roles(role_ids))
     
     # Obtener permisos de los roles usando la tabla intermedia role_permissions
     from app.models import RolePermission
     permissions = db.query(Permission).join(
         RolePermission, Permission.id == RolePermission.permission_id
     ).filter(
-        RolePermission.role_id.in_(role_ids)
+        RolePermission.role_id.in_(list(role_ids))
     ).distinct().all()
     
     return [perm.code for perm in permissions]
@@ -0,0 +1,56 @@
+"""
+Caché en proceso de los roles activos de cada usuario (app.user_roles).
+
+get_user_permissions() se ejecuta en cada request autenticado con chequeo de
+permisos. El mapa rol -> permisos ya vive en app.core.catalog_cache (invalidado
+por NOTIFY); aquí se cachea la otra mitad, user_id -> role_ids, con TTL corto y
+tamaño acotado. Los cambios hechos vía ORM sobre UserRole invalidan la entrada
+del usuario al instante; cualquier otro cambio se ve como mucho tras el TTL.
+"""
+
+import threading
+from typing import FrozenSet, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.user_role import UserRole
+
+CACHE_MAXSIZE = 10_000
+CACHE_TTL_SECONDS = 60
+
+_CACHE: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
+# TTLCache no es thread-safe y los endpoints síncronos corren en el threadpool
+_lock = threading.Lock()
+
+
+def get_user_role_ids(db: Session, user_id: int) -> FrozenSet[int]:
+    """IDs de los roles activos del usuario (caché TTL, una consulta en fallo)"""
+    with _lock:
+        role_ids = _CACHE.get(user_id)
+    if role_ids is not None:
+        return role_ids
+
+    role_ids = frozenset(db.scalars(
+        select(UserRole.role_id).where(UserRole.user_id == user_id, UserRole.is_active == True)
+    ))
+    with _lock:
+        _CACHE[user_id] = role_ids
+    return role_ids
+
+
+def invalidate(user_id: Optional[int] = None) -> None:
+    """Invalida un usuario (o toda la caché si user_id es None)"""
+    with _lock:
+        if user_id is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(user_id, None)
+
+
+@event.listens_for(UserRole, "after_insert")
+@event.listens_for(UserRole, "after_update")
+@event.listens_for(UserRole, "after_delete")
+def _invalidate_user_roles(mapper, connection, target) -> None:
+    invalidate(target.user_id)
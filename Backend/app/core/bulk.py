@@ -0,0 +1,118 @@
+"""
+Bulk insert helpers
+COPY ... FROM STDIN para lotes grandes; INSERT multi-VALUES para lotes pequeños.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Por debajo de este número de filas COPY no compensa el overhead
+COPY_THRESHOLD = 100
+
+_NULL = "\\N"
+
+
+def _format_value(value: Any) -> Any:
+    if value is None:
+        return _NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        # Columnas JSONB
+        return json.dumps(value, default=str)
+    return value
+
+
+def bulk_copy(session: Session, model, rows: List[Dict[str, Any]], columns: Sequence[str]) -> int:
+    """
+    Inserta filas con COPY (psycopg2) usando la conexión de la sesión,
+    de modo que participa en la transacción actual.
+    """
+    if not rows:
+        return 0
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t", quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+    for row in rows:
+        writer.writerow([_format_value(row.get(col)) for col in columns])
+    buffer.seek(0)
+
+    table = model.__table__
+    target = f"{table.schema}.{table.name}" if table.schema else table.name
+    column_list = ", ".join(columns)
+
+    raw_conn = session.connection().connection
+    with raw_conn.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {target} ({column_list}) FROM STDIN "
+            f"WITH (FORMAT csv, DELIMITER E'\\t', NULL '{_NULL}')",
+            buffer,
+        )
+    return len(rows)
+
+
+def bulk_insert(
+    session: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    """Inserta un lote: COPY si supera COPY_THRESHOLD, si no INSERT (insertmanyvalues)"""
+    if not rows:
+        return 0
+    columns = list(columns or rows[0].keys())
+    if len(rows) > COPY_THRESHOLD:
+        return bulk_copy(session, model, rows, columns)
+    session.execute(insert(model), [{col: row.get(col) for col in columns} for row in rows])
+    return len(rows)
+
+
+def _encode_record_value(value: Any) -> Any:
+    # asyncpg recibe jsonb como texto; el resto de tipos los codifica el driver
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+async def bulk_copy_async(session: AsyncSession, model, rows: List[Dict[str, Any]], columns: Sequence[str]) -> int:
+    """
+    Inserta filas con el COPY binario nativo de asyncpg (copy_records_to_table)
+    usando la conexión de la AsyncSession (participa en la transacción actual).
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    records = [tuple(_encode_record_value(row.get(col)) for col in columns) for row in rows]
+
+    conn = await session.connection()
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=list(columns),
+        schema_name=table.schema,
+    )
+    return len(rows)
+
+
+async def bulk_insert_async(
+    session: AsyncSession,
+    model,
+    rows: List[Dict[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    """bulk_insert sobre AsyncSession: COPY de asyncpg o INSERT (insertmanyvalues)"""
+    if not rows:
+        return 0
+    columns = list(columns or rows[0].keys())
+    if len(rows) > COPY_THRESHOLD:
+        return await bulk_copy_async(session, model, rows, columns)
+    await session.execute(insert(model), [{col: row.get(col) for col in columns} for row in rows])
+    return len(rows)
@@ -0,0 +1,168 @@
+"""
+Caché en proceso de catálogos inmutables (bet_types, bet_statuses, providers,
+roles -> permisos).
+
+Se cargan completos en el startup y se invalidan con LISTEN/NOTIFY: los
+triggers catalog_changed_notify (attach_catalog_notify_trigger en los modelos;
+migrations/catalog_notify_triggers.sql para bases existentes) emiten
+`NOTIFY catalog_changed, '<tabla>'` en cada INSERT/UPDATE/DELETE.
+
+API cacheada (hot path: colocar apuestas, chequeos de permisos) vs. sin caché
+(RBACService y endpoints de admin siguen leyendo la base de datos).
+"""
+
+import asyncio
+import logging
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import AsyncAppSessionLocal, AsyncEspnSessionLocal
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CHANNEL = "catalog_changed"
+RELOAD_INTERVAL_SECONDS = 300  # Respaldo si LISTEN no está disponible (p.ej. pooler en modo transacción)
+
+# Instancias desacopladas de la sesión (solo lectura)
+BET_TYPES: Dict[str, object] = {}
+BET_STATUSES: Dict[str, object] = {}
+PROVIDERS: Dict[str, object] = {}
+ROLE_PERMISSIONS: Dict[int, FrozenSet[str]] = {}
+
+_loaded = False
+_listener_task: Optional[asyncio.Task] = None
+
+
+async def _load_espn_catalogs() -> None:
+    from app.models.espn_bet import BetType, BetStatus
+
+    # Al cerrar la sesión las instancias quedan desacopladas; los atributos ya cargados siguen accesibles
+    async with AsyncEspnSessionLocal() as db:
+        bet_types = {row.code: row for row in (await db.scalars(select(BetType))).all()}
+        bet_statuses = {row.code: row for row in (await db.scalars(select(BetStatus))).all()}
+    BET_TYPES.clear()
+    BET_TYPES.update(bet_types)
+    BET_STATUSES.clear()
+    BET_STATUSES.update(bet_statuses)
+
+
+async def _load_app_catalogs() -> None:
+    from app.models import Provider, RolePermission, Permission
+
+    async with AsyncAppSessionLocal() as db:
+        providers = {row.code: row for row in (await db.scalars(select(Provider))).all()}  # endpoints: selectin
+        role_permissions: Dict[int, set] = {}
+        rows = await db.execute(
+            select(RolePermission.role_id, Permission.code).join(
+                Permission, Permission.id == RolePermission.permission_id
+            )
+        )
+        for role_id, code in rows:
+            role_permissions.setdefault(role_id, set()).add(code)
+    PROVIDERS.clear()
+    PROVIDERS.update(providers)
+    ROLE_PERMISSIONS.clear()
+    ROLE_PERMISSIONS.update({role_id: frozenset(codes) for role_id, codes in role_permissions.items()})
+
+
+_LOADERS = {
+    "bet_types": _load_espn_catalogs,
+    "bet_statuses": _load_espn_catalogs,
+    "providers": _load_app_catalogs,
+    "provider_endpoints": _load_app_catalogs,
+    "roles": _load_app_catalogs,
+    "permissions": _load_app_catalogs,
+    "role_permissions": _load_app_catalogs,
+}
+
+
+async def load_catalogs() -> None:
+    """Carga (o recarga) todos los catálogos"""
+    global _loaded
+    await _load_espn_catalogs()
+    await _load_app_catalogs()
+    _loaded = True
+
+
+def is_loaded() -> bool:
+    return _loaded
+
+
+def get_bet_type(code: str):
+    return BET_TYPES.get(code)
+
+
+def get_bet_status(code: str):
+    return BET_STATUSES.get(code)
+
+
+def get_provider(code: str):
+    return PROVIDERS.get(code)
+
+
+def get_permissions_for_roles(role_ids: Iterable[int]) -> FrozenSet[str]:
+    """Unión de permisos de los roles dados (O(1) por rol)"""
+    result: FrozenSet[str] = frozenset()
+    for role_id in role_ids:
+        result |= ROLE_PERMISSIONS.get(role_id, frozenset())
+    return result
+
+
+async def _reload(table: str) -> None:
+    loader = _LOADERS.get(table, load_catalogs)
+    try:
+        await loader()
+        logger.info(f"Catalog cache reloaded ({table})")
+    except Exception as e:
+        logger.error(f"Error reloading catalog cache ({table}): {e}", exc_info=True)
+
+
+async def _listen() -> None:
+    """Escucha NOTIFY catalog_changed; si LISTEN falla, recarga periódicamente"""
+    import asyncpg
+
+    loop = asyncio.get_running_loop()
+
+    def on_notify(connection, pid, channel, payload):
+        loop.create_task(_reload(payload))
+
+    dsn = settings.ASYNC_DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(dsn)
+            await conn.add_listener(CATALOG_CHANNEL, on_notify)
+            # Recargar al (re)conectar por si hubo cambios mientras no escuchábamos
+            await _reload("*")
+            while not conn.is_closed():
+                await asyncio.sleep(RELOAD_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Catalog LISTEN unavailable, polling every {RELOAD_INTERVAL_SECONDS}s: {e}")
+            await asyncio.sleep(RELOAD_INTERVAL_SECONDS)
+            await _reload("*")
+        finally:
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+
+
+async def start_catalog_cache() -> None:
+    """Carga inicial + listener de invalidación (startup)"""
+    global _listener_task
+    await load_catalogs()
+    if _listener_task is None:
+        _listener_task = asyncio.create_task(_listen())
+
+
+async def stop_catalog_cache() -> None:
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
@@ -97,6 +97,29 @@ class Settings(BaseSettings):
             f"?sslmode={self.NBA_DB_SSLMODE}&channel_binding={self.NBA_DB_CHANNEL_BINDING}"
         )
     
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """URL asyncpg para la base de datos app (asyncpg usa `ssl`, no soporta channel_binding)"""
+        return (
+            f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@"
+            f"{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+            f"?ssl={self.DB_SSLMODE}"
+        )
+    
+    @property
+    def ASYNC_NBA_DATABASE_URL(self) -> str:
+        """URL asyncpg para la base de datos nba_data (asyncpg usa `ssl`, no soporta channel_binding)"""
+        return (
+            f"postgresql+asyncpg://{self.NBA_DB_USER}:{self.NBA_DB_PASSWORD}@"
+            f"{self.NBA_DB_HOST}:{self.NBA_DB_PORT}/{self.NBA_DB_NAME}"
+            f"?ssl={self.NBA_DB_SSLMODE}"
+        )
+    
+    @property
+    def SHARED_DATABASE(self) -> bool:
+        """Esquemas app y espn en la misma base de datos: una sesión (y una transacción) cubre ambos"""
+        return self.DATABASE_URL == self.NBA_DATABASE_URL
+    
     # JWT Configuration
     SECRET_KEY: str
     ALGORITHM: str
@@ -167,6 +190,16 @@ class Settings(BaseSettings):
     MODEL_DIR: str = "ml/models"  # Ruta relativa a Backend/ (dentro del container Docker es /app/ml/models)
     ML_SCHEMA: str = "ml"            # Schema de ml_ready_games en Neon
 
+    # Database pool Configuration (por engine; sync y async)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 5  # Segundos de espera por una conexión libre
+    DB_POOL_RECYCLE: int = 1800
+    DB_USE_NULLPOOL: bool = False  # Solo tests: sin pool, una conexión por checkout
+    DB_QUERY_CACHE_SIZE: int = 1200  # Sentencias compiladas en caché por engine (default SQLAlchemy: 500)
+    DB_LOG_CACHE_STATS: bool = False  # Dev: loguea el ratio de aciertos del caché de compilación
+    AUDIT_LOG_RETENTION_DAYS: int = 365  # Particiones mensuales de app.audit_log más antiguas se eliminan (0 = sin límite)
+
     # Redis Configuration
     REDIS_URL: Optional[str] = None  # Full Redis URL (e.g., redis://:password@host:port/db)
     REDIS_HOST: str = "localhost"
@@ -174,6 +207,9 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_DB: int = 0
     USE_REDIS: bool = False  # Set to True to use Redis instead of in-memory cache
+    REDIS_MAX_CONNECTIONS: int = 50  # Tamaño del pool compartido (cache, colas, monitoreo)
+    REDIS_POOL_TIMEOUT: int = 5  # Segundos de espera por una conexión libre del pool
+    RQ_NUM_WORKERS: int = 0  # Workers RQ en paralelo (0 = os.cpu_count())
     
     # Outbox Worker Configuration
     OUTBOX_POLL_INTERVAL: int = 5  # Segundos entre polls cuando hay eventos (default: 5)
@@ -2,38 +2,154 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine, text
+import logging
+from collections import Counter
+from sqlalchemy import DDL, create_engine, event, text
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson está en requirements.txt
+    orjson = None
+    import json
+
+logger = logging.getLogger(__name__)
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_serializer(value) -> str:
+        """Serializador para columnas JSONB (audit_log, odds_lines...): orjson, Decimal como string"""
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode()
+else:
+    def _json_serializer(value) -> str:
+        """Serializador para columnas JSONB (fechas/Decimal como string)"""
+        return json.dumps(value, default=str)
+
+def _engine_kwargs() -> dict:
+    """Opciones comunes de los engines (pool configurable por env DB_POOL_*)"""
+    kwargs = {
+        "pool_pre_ping": True,
+        "echo": settings.DEBUG,
+        "json_serializer": _json_serializer,
+        # INSERT ... VALUES (...),(...) RETURNING de hasta 1000 filas por sentencia
+        "insertmanyvalues_page_size": 1000,
+        # Caché de sentencias compiladas: modelos x variantes de selectinload/joinedload por ruta
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+    }
+    if settings.DB_USE_NULLPOOL:
+        kwargs["poolclass"] = NullPool
+    else:
+        kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return kwargs
+
+# executemany_mode solo aplica a psycopg2 (engines sync): UPDATE/DELETE por
+# lotes con execute_batch además de los INSERT multi-VALUES.
+
 # Engine para Neon (esquema app) - Sistema de usuarios/apuestas
 # Neon no soporta search_path en conexiones pooled, se establece después de conectar
+# (no usar search_path en connect_args para Neon pooled connections)
 app_engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.DEBUG,
-    # No usar search_path en connect_args para Neon pooled connections
+    settings.DATABASE_URL, executemany_mode="values_plus_batch", **_engine_kwargs()
 )
 
 # Engine para Neon (esquema espn) - Datos de NBA
 espn_engine = create_engine(
-    settings.NBA_DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.DEBUG,
-    # No usar search_path en connect_args para Neon pooled connections
+    settings.NBA_DATABASE_URL, executemany_mode="values_plus_batch", **_engine_kwargs()
 )
 
+# Engines async (asyncpg) - no bloquean el event loop de Uvicorn.
+# Los servicios se migran gradualmente; los engines sync se mantienen para
+# el código existente y los scripts de migración.
+app_async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, **_engine_kwargs())
+
+espn_async_engine = create_async_engine(settings.ASYNC_NBA_DATABASE_URL, **_engine_kwargs())
+
+# Estadísticas del caché de compilación (solo dev, DB_LOG_CACHE_STATS)
+_CACHE_STATS_LOG_EVERY = 1000
+_cache_stats: Counter = Counter()
+
+def _track_compiled_cache(conn, cursor, statement, parameters, context, executemany):
+    # cache_hit: CACHE_HIT ("cached since"), CACHE_MISS ("generated in"), resto = no cacheable
+    if context is None or context.compiled is None:
+        return
+    _cache_stats[context.cache_hit] += 1
+    total = sum(_cache_stats.values())
+    if total % _CACHE_STATS_LOG_EVERY == 0:
+        hits = _cache_stats[CacheStats.CACHE_HIT]
+        misses = _cache_stats[CacheStats.CACHE_MISS]
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+        logger.info(f"SQL compiled cache: {hits} hits / {misses} misses ({ratio:.1%}) over {total} executions")
+
+if settings.DB_LOG_CACHE_STATS:
+    for _engine in (app_engine, espn_engine, app_async_engine.sync_engine, espn_async_engine.sync_engine):
+        event.listen(_engine, "before_cursor_execute", _track_compiled_cache)
+
 # Session factories
 AppSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=app_engine)
 EspnSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=espn_engine)
 
+# Async session factories (expire_on_commit=False: los objetos siguen usables tras commit sin re-SELECT)
+AsyncAppSessionLocal = async_sessionmaker(app_async_engine, expire_on_commit=False, autoflush=False)
+AsyncEspnSessionLocal = async_sessionmaker(espn_async_engine, expire_on_commit=False, autoflush=False)
+
 # Bases separadas para cada esquema
 AppBase = declarative_base()
 EspnBase = declarative_base()
 
+# updated_at mantenido por la base de datos (trigger BEFORE UPDATE) en vez de
+# onupdate=func.now(): solo se toca si alguna otra columna cambió realmente
+_SET_UPDATED_AT_FN = DDL("""
+CREATE OR REPLACE FUNCTION app.trg_set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW IS DISTINCT FROM OLD THEN
+        NEW.updated_at = now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+def attach_updated_at_trigger(table):
+    """Registra el trigger set_updated_at en el CREATE TABLE de `table`"""
+    event.listen(table, "after_create", _SET_UPDATED_AT_FN)
+    event.listen(table, "after_create", DDL("DROP TRIGGER IF EXISTS set_updated_at ON %(fullname)s"))
+    event.listen(table, "after_create", DDL(
+        "CREATE TRIGGER set_updated_at BEFORE UPDATE ON %(fullname)s "
+        "FOR EACH ROW EXECUTE FUNCTION app.trg_set_updated_at()"
+    ))
+
+# NOTIFY catalog_changed al modificar catálogos cacheados en proceso (app.core.catalog_cache)
+_NOTIFY_CATALOG_CHANGED_FN = DDL("""
+CREATE OR REPLACE FUNCTION app.notify_catalog_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('catalog_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+def attach_catalog_notify_trigger(table):
+    """Registra el trigger catalog_changed_notify en el CREATE TABLE de `table`"""
+    event.listen(table, "after_create", _NOTIFY_CATALOG_CHANGED_FN)
+    event.listen(table, "after_create", DDL("DROP TRIGGER IF EXISTS catalog_changed_notify ON %(fullname)s"))
+    event.listen(table, "after_create", DDL(
+        "CREATE TRIGGER catalog_changed_notify AFTER INSERT OR UPDATE OR DELETE ON %(fullname)s "
+        "FOR EACH STATEMENT EXECUTE FUNCTION app.notify_catalog_changed()"
+    ))
+
 # Dependencias para obtener sesiones
 def get_app_db():
     """Dependency para Neon (esquema app)"""
@@ -61,14 +177,36 @@ def get_espn_db():
     finally:
         db.close()
 
+async def get_async_app_db():
+    """Async dependency para Neon (esquema app)"""
+    async with AsyncAppSessionLocal() as db:
+        # Establecer search_path después de conectar (Neon no soporta en pooled)
+        await db.execute(text(f"SET search_path TO {settings.DB_SCHEMA}, public"))
+        await db.commit()
+        yield db
+
+async def get_async_espn_db():
+    """Async dependency para Neon (esquema espn)"""
+    async with AsyncEspnSessionLocal() as db:
+        # Establecer search_path después de conectar (Neon no soporta en pooled)
+        await db.execute(text(f"SET search_path TO {settings.NBA_DB_SCHEMA}, public"))
+        await db.commit()
+        yield db
+
 # Aliases para compatibilidad con código existente (mantener sys_* por compatibilidad)
 sys_engine = app_engine
 SysSessionLocal = AppSessionLocal
 SysBase = AppBase
 get_sys_db = get_app_db
+sys_async_engine = app_async_engine
+AsyncSysSessionLocal = AsyncAppSessionLocal
+get_async_sys_db = get_async_app_db
 
 # Para compatibilidad con código existente (usa app por defecto)
 get_db = get_app_db
 engine = app_engine
 Base = AppBase
 SessionLocal = AppSessionLocal
+get_async_db = get_async_app_db
+async_engine = app_async_engine
+AsyncSessionLocal = AsyncAppSessionLocal
@@ -0,0 +1,148 @@
+"""
+Monthly range partitions for append-mostly tables
+espn.game_odds (snapshot_time), app.odds_lines, app.transactions y
+app.audit_log (created_at). Las tablas se agrupan por base de datos: espn.game_odds
+se mantiene con la conexión de NBA_DATABASE_URL, el resto con la de DATABASE_URL. Las particiones de app.audit_log más antiguas que
+AUDIT_LOG_RETENTION_DAYS se eliminan (DROP de la partición, sin DELETE).
+Se ejecuta al arrancar la API y puede programarse (cron) con:
+    python -m app.core.partitions
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+
+# Base de datos ("app" = DATABASE_URL, "espn" = NBA_DATABASE_URL) -> (schema, tabla, columna
+# de partición) de las tablas particionadas por mes
+PARTITIONED_TABLES: Dict[str, List[Tuple[str, str, str]]] = {
+    "app": [
+        ("app", "odds_lines", "created_at"),
+        ("app", "transactions", "created_at"),
+        ("app", "audit_log", "created_at"),
+    ],
+    "espn": [
+        ("espn", "game_odds", "snapshot_time"),
+    ],
+}
+
+# Retención en días por tabla (las no listadas se conservan completas)
+RETENTION_DAYS: Dict[Tuple[str, str], int] = {
+    ("app", "audit_log"): settings.AUDIT_LOG_RETENTION_DAYS,
+}
+
+# Meses por delante que deben existir siempre
+MONTHS_AHEAD = 2
+
+
+def _add_months(d: date, months: int) -> date:
+    month_index = d.month - 1 + months
+    return date(d.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def _is_partitioned(conn: Connection, schema: str, table: str) -> bool:
+    return bool(conn.execute(
+        text("""
+            SELECT 1 FROM pg_partitioned_table p
+            JOIN pg_class c ON c.oid = p.partrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = :schema AND c.relname = :table
+        """),
+        {"schema": schema, "table": table},
+    ).scalar())
+
+
+def _create_month_partition(conn: Connection, schema: str, table: str, column: str, start: date) -> None:
+    """Crea la partición del mes `start`. Si la DEFAULT ya tiene filas de ese mes el
+    CREATE ... PARTITION OF fallaría: se desacopla la DEFAULT, se crea la partición,
+    se mueven las filas y se vuelve a acoplar"""
+    name = f"{table}_{start:%Y_%m}"
+    end = _add_months(start, 1)
+    if conn.execute(text("SELECT to_regclass(:name)"), {"name": f"{schema}.{name}"}).scalar() is not None:
+        return
+
+    bounds = {"start": start, "end": end}
+    in_month = f"{column} >= :start AND {column} < :end"
+    create = text(
+        f"CREATE TABLE {schema}.{name} PARTITION OF {schema}.{table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+    has_rows = conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {schema}.{table}_default WHERE {in_month})"), bounds
+    ).scalar()
+    if not has_rows:
+        conn.execute(create)
+        return
+
+    conn.execute(text(f"ALTER TABLE {schema}.{table} DETACH PARTITION {schema}.{table}_default"))
+    conn.execute(create)
+    conn.execute(text(
+        f"WITH moved AS (DELETE FROM {schema}.{table}_default WHERE {in_month} RETURNING *) "
+        f"INSERT INTO {schema}.{name} SELECT * FROM moved"
+    ), bounds)
+    conn.execute(text(f"ALTER TABLE {schema}.{table} ATTACH PARTITION {schema}.{table}_default DEFAULT"))
+
+
+def ensure_monthly_partitions(conn: Connection, database: str = "app", months_ahead: int = MONTHS_AHEAD) -> None:
+    """Crea la partición DEFAULT y las del mes actual + months_ahead si faltan, para las
+    tablas de `database` (conn debe apuntar a esa base de datos)"""
+    first_of_month = date.today().replace(day=1)
+
+    for schema, table, column in PARTITIONED_TABLES[database]:
+        if not _is_partitioned(conn, schema, table):
+            # Tabla aún sin migrar (ver migrations/partition_time_series_tables.sql)
+            continue
+
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {schema}.{table}_default "
+            f"PARTITION OF {schema}.{table} DEFAULT"
+        ))
+        for offset in range(months_ahead + 1):
+            _create_month_partition(conn, schema, table, column, _add_months(first_of_month, offset))
+
+
+def drop_expired_partitions(conn: Connection, database: str = "app", today: Optional[date] = None) -> List[str]:
+    """Elimina las particiones mensuales de `database` cuyo mes terminó antes del límite
+    de retención. Retorna los nombres eliminados"""
+    today = today or date.today()
+    dropped: List[str] = []
+    tables = {(schema, table) for schema, table, _ in PARTITIONED_TABLES[database]}
+
+    for (schema, table), days in RETENTION_DAYS.items():
+        if (schema, table) not in tables or days <= 0 or not _is_partitioned(conn, schema, table):
+            continue
+        cutoff = today - timedelta(days=days)
+        children = conn.execute(
+            text("""
+                SELECT c.relname FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = CAST(:parent AS regclass)
+            """),
+            {"parent": f"{schema}.{table}"},
+        ).scalars()
+        for name in children:
+            suffix = name[len(table) + 1:]  # <tabla>_YYYY_MM; _default no se toca
+            try:
+                start = date(int(suffix[:4]), int(suffix[5:7]), 1)
+            except ValueError:
+                continue
+            if _add_months(start, 1) <= cutoff:
+                conn.execute(text(f"DROP TABLE IF EXISTS {schema}.{name}"))
+                dropped.append(f"{schema}.{name}")
+    return dropped
+
+
+if __name__ == "__main__":
+    from app.core.database import app_engine, espn_engine
+
+    expired: List[str] = []
+    for database, engine in (("espn", espn_engine), ("app", app_engine)):
+        with engine.begin() as connection:
+            ensure_monthly_partitions(connection, database)
+            expired += drop_expired_partitions(connection, database)
+    print("✅ Monthly partitions ensured")
+    if expired:
+        print(f"🗑️  Expired partitions dropped: {', '.join(expired)}")
@@ -0,0 +1,72 @@
+"""
+Shared Redis connection pools
+Un único pool por proceso, compartido por cache_service, queue_service (RQ)
+y cualquier consumidor futuro (monitoreo de seguridad, rate limiting).
+"""
+
+from typing import Optional
+
+from app.core.config import settings
+
+try:
+    import redis as _redis_lib
+    import redis.asyncio as _aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    _redis_lib = None
+    _aioredis = None
+    REDIS_AVAILABLE = False
+
+_pool = None
+_async_pool = None
+
+
+def _pool_kwargs() -> dict:
+    return {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "timeout": settings.REDIS_POOL_TIMEOUT,
+    }
+
+
+def _build_pool(module):
+    """Construir un BlockingConnectionPool desde REDIS_URL o host/port"""
+    if settings.REDIS_URL:
+        return module.BlockingConnectionPool.from_url(settings.REDIS_URL, **_pool_kwargs())
+    return module.BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        db=settings.REDIS_DB,
+        **_pool_kwargs(),
+    )
+
+
+def get_redis() -> Optional["_redis_lib.Redis"]:
+    """Cliente Redis sync sobre el pool compartido (None si redis no está instalado)"""
+    global _pool
+    if not REDIS_AVAILABLE:
+        return None
+    if _pool is None:
+        _pool = _build_pool(_redis_lib)
+    return _redis_lib.Redis(connection_pool=_pool)
+
+
+def get_async_redis() -> Optional["_aioredis.Redis"]:
+    """Cliente redis.asyncio sobre el pool async compartido"""
+    global _async_pool
+    if not REDIS_AVAILABLE:
+        return None
+    if _async_pool is None:
+        _async_pool = _build_pool(_aioredis)
+    return _aioredis.Redis(connection_pool=_async_pool)
+
+
+async def close_redis_pools() -> None:
+    """Cerrar los pools al apagar la aplicación"""
+    global _pool, _async_pool
+    if _async_pool is not None:
+        await _async_pool.disconnect()
+        _async_pool = None
+    if _pool is not None:
+        _pool.disconnect()
+        _pool = None
@@ -5,7 +5,7 @@ Main application entry point
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse, RedirectResponse
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse, RedirectResponse
 from fastapi.exceptions import RequestValidationError
 import uvicorn
 import os
@@ -17,7 +17,7 @@ from dotenv import load_dotenv
 
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.core.database import app_engine, espn_engine, AppBase, EspnBase, sys_engine, SysBase  # sys_* son aliases para compatibilidad
+from app.core.database import AppBase, EspnBase, app_async_engine, espn_async_engine
 from app.middleware.security_middleware import (
     SecurityHeadersMiddleware,
     HTTPSRedirectMiddleware,
@@ -56,7 +56,9 @@ app = FastAPI(
     description="API para predicción de resultados NBA y simulación de apuestas virtuales",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson (C) para serializar las respuestas; FastAPI ya entrega contenido JSON-compatible
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware - Definido directamente en el código
@@ -185,13 +187,36 @@ async def startup_event():
     try:
         # IMPORTANTE: Crear primero las tablas de espn porque app tiene referencias a espn
         # Crear tablas en Neon (esquema espn)
-        EspnBase.metadata.create_all(bind=espn_engine)
+        async with espn_async_engine.begin() as conn:
+            await conn.run_sync(EspnBase.metadata.create_all)
         print("✅ Database tables created in Neon (schema: espn)")
         
         # Crear tablas en Neon (esquema app) - después de espn
-        AppBase.metadata.create_all(bind=app_engine)
+        async with app_async_engine.begin() as conn:
+            await conn.run_sync(AppBase.metadata.create_all)
         print("✅ Database tables created in Neon (schema: app)")
         
+        # Particiones mensuales + retención, cada grupo con el engine de su base de datos
+        # (espn.game_odds en NBA_DATABASE_URL; odds_lines, transactions, audit_log en DATABASE_URL)
+        from app.core.partitions import ensure_monthly_partitions, drop_expired_partitions
+        for database, engine in (("espn", espn_async_engine), ("app", app_async_engine)):
+            async with engine.begin() as conn:
+                await conn.run_sync(ensure_monthly_partitions, database)
+                await conn.run_sync(drop_expired_partitions, database)
+        print("✅ Monthly partitions ensured")
+        
+        # Catálogos en memoria (bet_types, bet_statuses, providers, roles -> permisos)
+        try:
+            from app.core.catalog_cache import start_catalog_cache
+            await start_catalog_cache()
+            print("✅ Catalog cache loaded")
+        except Exception as cc_e:
+            print(f"⚠️  Warning: Could not load catalog cache: {cc_e}")
+        
+        # Auditoría por lotes (flusher en segundo plano)
+        from app.services.audit_service import start_audit_flusher
+        await start_audit_flusher()
+        
         # Cargar el modelo ML en el singleton global (una sola vez, en startup)
         try:
             from app.core.database import get_sys_db
@@ -300,6 +325,20 @@ async def shutdown_event():
         print("✅ Outbox worker stopped")
     except Exception as e:
         print(f"⚠️  Warning: Error stopping outbox worker: {e}")
+    
+    from app.core.catalog_cache import stop_catalog_cache
+    await stop_catalog_cache()
+    
+    # Insertar los registros de auditoría pendientes antes de cerrar los pools
+    from app.services.audit_service import stop_audit_flusher
+    await stop_audit_flusher()
+    
+    # Cerrar pools async (asyncpg) limpiamente
+    await app_async_engine.dispose()
+    await espn_async_engine.dispose()
+    
+    from app.core.redis import close_redis_pools
+    await close_redis_pools()
 
 @app.get("/health")
 async def health_check():
@@ -5,7 +5,7 @@ Security middleware for HTTPS enforcement and security headers
 from fastapi import Request, Response
 from fastapi.responses import RedirectResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 from typing import List
 
@@ -14,26 +14,46 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Rutas que no necesitan cabeceras de seguridad ni redirección HTTPS
+# (assets estáticos servidos con caché del navegador y probes de salud)
+STATIC_PATH_PREFIXES = ("/uploads/",)
+HEALTH_PATH_PREFIXES = ("/health", "/api/v1/health/")
+
+SECURITY_HEADERS = [
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+]
+
+
+class SecurityHeadersMiddleware:
     """
-    Middleware to add security headers to all responses.
+    Pure ASGI middleware to add security headers to all responses.
+    CORS preflights (OPTIONS) and static uploads skip it entirely.
     """
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(STATIC_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
         
-        # Add security headers
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + SECURITY_HEADERS
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
 class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
@@ -47,6 +67,20 @@ class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
         self.force_https = force_https
         self.allowed_hosts = allowed_hosts or []
     
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # Fast path: health probes, static uploads y localhost no pasan por dispatch
+        if scope["type"] == "http":
+            client = scope.get("client")
+            client_host = client[0] if client else None
+            if (
+                not self.force_https
+                or client_host in ("127.0.0.1", "localhost", None)
+                or scope["path"].startswith(HEALTH_PATH_PREFIXES + STATIC_PATH_PREFIXES)
+            ):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+    
     async def dispatch(self, request: Request, call_next):
         # Skip HTTPS enforcement for localhost/127.0.0.1 (development)
         client_host = request.client.host if request.client else None
@@ -19,6 +19,9 @@ from .espn_bet import (
     BetStatus as EspnBetStatus,
     Bet as EspnBet,
     BetSelection,
+    BetSelectionMoneyline,
+    BetSelectionSpread,
+    BetSelectionTotal,
     BetResult,
     GameOdds
 )
@@ -73,6 +76,9 @@ __all__ = [
     "EspnBetStatus",
     "EspnBet",
     "BetSelection",
+    "BetSelectionMoneyline",
+    "BetSelectionSpread",
+    "BetSelectionTotal",
     "BetResult",
     "GameOdds",
     # RBAC models
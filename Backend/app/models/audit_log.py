@@ -2,7 +2,8 @@
 Audit Log model for RF-10
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.core.database import SysBase
 
@@ -10,18 +11,30 @@ class AuditLog(SysBase):
     """Audit Log model for complete audit trail"""
     
     __tablename__ = "audit_log"
-    __table_args__ = {'schema': 'app'}
+    __table_args__ = (
+        Index('ix_audit_meta_gin', 'audit_metadata', postgresql_using='gin'),
+        # Listados más recientes primero con keyset (created_at, id); el btree se recorre hacia atrás
+        Index('ix_audit_created_id', 'created_at', 'id'),
+        Index('ix_audit_actor_created', 'actor_user_id', 'created_at', 'id'),
+        Index('ix_audit_resource_created', 'resource_type', 'resource_id', 'created_at'),
+        # Particionada por mes (ver app.core.partitions); la PK incluye la clave de partición
+        {'schema': 'app', 'postgresql_partition_by': 'RANGE (created_at)'},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # Defaults del servidor vuelven por RETURNING en el mismo INSERT (sin refresh posterior)
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
     organization_id = Column(Integer, nullable=True)  # Para futuro uso con organizaciones
-    actor_user_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="SET NULL"), nullable=True, index=True)
+    actor_user_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="SET NULL"), nullable=True)
     action = Column(String(100), nullable=False, index=True)  # e.g., "create_user", "place_bet", "update_prediction"
     resource_type = Column(String(50), nullable=True)  # e.g., "user", "bet", "prediction"
     resource_id = Column(Integer, nullable=True)  # ID del recurso afectado
-    before = Column(Text, nullable=True)  # JSON con estado anterior
-    after = Column(Text, nullable=True)  # JSON con estado nuevo
-    audit_metadata = Column(Text, nullable=True)  # JSON con metadatos adicionales (renombrado de 'metadata' porque es reservado)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # JSONB (migrations/audit_log_jsonb.sql): se escriben y se leen como dict; no usar json.dumps/json.loads
+    before = Column(JSONB, nullable=True)  # JSON con estado anterior
+    after = Column(JSONB, nullable=True)  # JSON con estado nuevo
+    audit_metadata = Column(JSONB, nullable=True)  # JSON con metadatos adicionales (renombrado de 'metadata' porque es reservado)
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())  # Clave de partición
     
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action='{self.action}', actor_user_id={self.actor_user_id})>"
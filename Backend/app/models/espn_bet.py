@@ -2,10 +2,50 @@
 Normalized Bet models for espn schema (3FN)
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean, ForeignKey, Text, CheckConstraint
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, Date, DateTime, Boolean, ForeignKey, Text, CheckConstraint, Index, FetchedValue, Computed
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from app.core.database import EspnBase
+from sqlalchemy.orm import relationship, foreign
+from app.core.database import EspnBase, attach_catalog_notify_trigger, attach_updated_at_trigger
+from app.models.mixins import FastRepr
+from app.models.user_accounts import UserAccount
+
+
+def to_fixed_point(value, scale: int) -> int:
+    """`round(valor * scale)` (ROUND_HALF_UP) para escribir columnas de punto fijo sin la instancia"""
+    scaled = (value if isinstance(value, Decimal) else Decimal(str(value))) * scale
+    return int(scaled.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_fixed_point(raw: int, scale: int) -> Decimal:
+    """Inverso exacto de to_fixed_point: `Decimal(raw) / scale`, sin pasar por float"""
+    return Decimal(raw) / scale
+
+
+def _fixed_point(column: str, scale: int, readonly: bool = False) -> hybrid_property:
+    """Expone una columna entera de punto fijo (centavos, diezmilésimas) con su
+    nombre histórico: lee `Decimal(valor) / scale` (exacto, sin pasar por float)
+    y escribe `round(valor * scale)`.
+    Con `readonly=True` (columnas generadas) no hay setter."""
+
+    def fget(self):
+        raw = getattr(self, column)
+        return None if raw is None else from_fixed_point(raw, scale)
+
+    def fset(self, value):
+        if value is None:
+            setattr(self, column, None)
+        else:
+            setattr(self, column, to_fixed_point(value, scale))
+
+    def expr(cls):
+        return getattr(cls, column) / scale
+
+    return hybrid_property(fget, None if readonly else fset, expr=expr)
+
 
 # ============================================================================
 # Catálogos (Normalización de Enums)
@@ -22,7 +62,7 @@ class BetType(EspnBase):
     description = Column(Text, nullable=True)
     
     # Relationships
-    bets = relationship("Bet", back_populates="bet_type")
+    bets = relationship("Bet", back_populates="bet_type", lazy="raise")  # colección sin límite: cargar explícitamente
     
     def __repr__(self):
         return f"<BetType(code='{self.code}', name='{self.name}')>"
@@ -39,7 +79,7 @@ class BetStatus(EspnBase):
     description = Column(Text, nullable=True)
     
     # Relationships
-    bets = relationship("Bet", back_populates="bet_status")
+    bets = relationship("Bet", back_populates="bet_status", lazy="raise")  # colección sin límite: cargar explícitamente
     
     def __repr__(self):
         return f"<BetStatus(code='{self.code}', name='{self.name}')>"
@@ -49,50 +89,81 @@ class BetStatus(EspnBase):
 # Tabla Principal de Apuestas
 # ============================================================================
 
-class Bet(EspnBase):
+class Bet(FastRepr, EspnBase):
     """Normalized Bet model (3FN)"""
     
     __tablename__ = "bets"
     __table_args__ = (
-        CheckConstraint('bet_amount > 0', name='chk_bets_amount_positive'),
-        CheckConstraint('potential_payout >= bet_amount', name='chk_bets_payout'),
+        CheckConstraint('bet_amount_cents > 0', name='chk_bets_amount_positive'),
+        CheckConstraint('potential_payout_cents >= bet_amount_cents', name='chk_bets_payout'),
+        # Historial: WHERE user_id AND bet_status_code ORDER BY placed_at (index-only scan)
+        Index('ix_bets_user_status_placed', 'user_id', 'bet_status_code', 'placed_at',
+              postgresql_include=['bet_amount_cents', 'potential_payout_cents', 'game_id']),
+        # Listado sin filtro de estado con paginación por keyset (placed_at, id); ver BetService.get_user_bets
+        Index('ix_bets_user_placed_id', 'user_id', 'placed_at', 'id'),
+        # Solo apuestas pendientes (minoría): índice parcial pequeño para el filtro status='pending'
+        Index('ix_bets_pending_user_placed', 'user_id', 'placed_at', 'id',
+              postgresql_where=text("bet_status_code = 'pending'")),
         {'schema': 'espn'},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False)  # FK a app.user_accounts (sin constraint por esquema diferente)
-    game_id = Column(Integer, ForeignKey("espn.games.game_id", ondelete="RESTRICT"), nullable=False)
+    # id, potential_payout, placed_at/updated_at y los nombres del trigger vuelven por
+    # RETURNING en el mismo INSERT/UPDATE (sin refresh posterior)
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id = Column(BigInteger, primary_key=True)
+    # FK a app.user_accounts: el constraint fk_bets_user_id lo crea la migración
+    # cross_schema_foreign_keys.sql (app se crea después de espn en create_all)
+    user_id = Column(Integer, nullable=False, index=True)
+    game_id = Column(BigInteger, ForeignKey("espn.games.game_id", ondelete="RESTRICT"), nullable=False)
     
     # Bet type and status (normalized)
     bet_type_code = Column(String(20), ForeignKey("espn.bet_types.code", ondelete="RESTRICT"), nullable=False)
     bet_status_code = Column(String(20), ForeignKey("espn.bet_statuses.code", ondelete="RESTRICT"), nullable=False, default='pending')
     
-    # Bet amount
-    bet_amount = Column(Numeric(10, 2), nullable=False)
-    
-    # Odds reference (normalized)
-    odds_id = Column(Integer, ForeignKey("espn.game_odds.id", ondelete="SET NULL"), nullable=True)
-    odds_value = Column(Numeric(10, 4), nullable=False)  # Snapshot para auditoría
+    # Bet amount (centavos)
+    bet_amount_cents = Column(BigInteger, nullable=False)
+    bet_amount = _fixed_point('bet_amount_cents', 100)
+    
+    # Odds reference (normalized). Sin FK: game_odds está particionada por
+    # snapshot_time y su PK es (id, snapshot_time); la referencia es a nivel app
+    odds_id = Column(BigInteger, nullable=True)
+    odds_value_e4 = Column(BigInteger, nullable=False)  # Snapshot para auditoría (diezmilésimas)
+    odds_value = _fixed_point('odds_value_e4', 10_000)
+    
+    # Potential payout (centavos): columna generada = round(monto * cuota), la calcula
+    # Postgres en cada INSERT/UPDATE de bet_amount_cents / odds_value_e4
+    potential_payout_cents = Column(
+        BigInteger,
+        Computed("round(bet_amount_cents * odds_value_e4 / 10000.0)::bigint", persisted=True),
+        nullable=False,
+    )
+    potential_payout = _fixed_point('potential_payout_cents', 100, readonly=True)
     
-    # Potential payout (calculable pero guardado para auditoría)
-    potential_payout = Column(Numeric(10, 2), nullable=False)
+    # Campos desnormalizados para lectura (historial de apuestas sin JOINs)
+    # Nombres de catálogo mantenidos por trigger (espn.bets_denorm_names);
+    # snapshots del juego fijados al colocar la apuesta (inmutables)
+    bet_type_name = Column(String(100), nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    bet_status_name = Column(String(100), nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    home_team_snapshot = Column(String(100), nullable=True)
+    away_team_snapshot = Column(String(100), nullable=True)
+    game_date_snapshot = Column(Date, nullable=True)
     
     # Timestamps
-    placed_at = Column(DateTime(timezone=True), server_default=func.now())
+    placed_at = Column(DateTime(timezone=True), server_default=func.now())  # Momento de creación (no hay created_at aparte)
     settled_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # trigger set_updated_at
     
     # Relationships
     game = relationship("Game", foreign_keys=[game_id])
+    user = relationship(UserAccount, primaryjoin=lambda: foreign(Bet.user_id) == UserAccount.id, viewonly=True)
     bet_type = relationship("BetType", foreign_keys=[bet_type_code], back_populates="bets")
     bet_status = relationship("BetStatus", foreign_keys=[bet_status_code], back_populates="bets")
-    odds = relationship("GameOdds", foreign_keys=[odds_id])
-    selection = relationship("BetSelection", back_populates="bet", uselist=False)
-    result = relationship("BetResult", back_populates="bet", uselist=False)
+    odds = relationship("GameOdds", primaryjoin="foreign(Bet.odds_id) == GameOdds.id", viewonly=True)
+    selection = relationship("BetSelection", back_populates="bet", uselist=False, lazy="joined")
+    result = relationship("BetResult", back_populates="bet", uselist=False, lazy="joined")
     
-    def __repr__(self):
-        return f"<Bet(id={self.id}, user_id={self.user_id}, amount={self.bet_amount}, status={self.bet_status_code})>"
+    _repr_fields = ("id", "user_id", "bet_amount_cents", "bet_status_code")
 
 
 # ============================================================================
@@ -100,39 +171,86 @@ class Bet(EspnBase):
 # ============================================================================
 
 class BetSelection(EspnBase):
-    """Bet selection details (normalized)"""
+    """Bet selection (base de herencia joined-table).
+
+    Cada tipo de apuesta guarda su selección en su propia tabla sin columnas
+    NULL; bet_type_code es el discriminador que indica qué tabla hija leer.
+    """
     
     __tablename__ = "bet_selections"
-    __table_args__ = (
-        CheckConstraint(
-            """
-            (spread_value IS NULL AND over_under_value IS NULL AND is_over IS NULL) OR
-            (over_under_value IS NULL AND is_over IS NULL) OR
-            (selected_team_id IS NULL AND spread_value IS NULL)
-            """,
-            name='chk_bet_selections_logic'
-        ),
-        {'schema': 'espn'},
-    )
-    
-    id = Column(Integer, primary_key=True, index=True)
-    bet_id = Column(Integer, ForeignKey("espn.bets.id", ondelete="CASCADE"), nullable=False, unique=True)
+    __table_args__ = {'schema': 'espn'}
     
-    # Selection details (conditional based on bet type)
-    selected_team_id = Column(Integer, ForeignKey("espn.teams.team_id", ondelete="RESTRICT"), nullable=True)
-    spread_value = Column(Numeric(10, 2), nullable=True)  # For spread bets
-    over_under_value = Column(Numeric(10, 2), nullable=True)  # For over/under bets
-    is_over = Column(Boolean, nullable=True)  # True for over, False for under
+    id = Column(Integer, primary_key=True)
+    bet_id = Column(BigInteger, ForeignKey("espn.bets.id", ondelete="CASCADE"), nullable=False, unique=True)
+    bet_type_code = Column(String(20), ForeignKey("espn.bet_types.code", ondelete="RESTRICT"), nullable=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     bet = relationship("Bet", foreign_keys=[bet_id], back_populates="selection")
-    selected_team = relationship("Team", foreign_keys=[selected_team_id])
+    
+    # Campos de las tablas hijas: None cuando el tipo no los usa
+    selected_team_id = None
+    spread_value = None
+    over_under_value = None
+    is_over = None
+    
+    __mapper_args__ = {
+        "polymorphic_on": bet_type_code,
+        # LEFT JOIN a las tablas hijas en la misma query (sin lazy load por subclase)
+        "with_polymorphic": "*",
+    }
+    
+    @classmethod
+    def for_bet_type(cls, bet_type_code: str, **values) -> "BetSelection":
+        """Crea la selección de la subclase correspondiente a bet_type_code"""
+        mapper = cls.__mapper__.polymorphic_map.get(bet_type_code)
+        if mapper is None:
+            raise ValueError(f"Unsupported bet type for selection: {bet_type_code}")
+        return mapper.class_(**values)
     
     def __repr__(self):
-        return f"<BetSelection(bet_id={self.bet_id}, team_id={self.selected_team_id})>"
+        return f"<BetSelection(bet_id={self.bet_id}, type={self.bet_type_code})>"
+
+
+class BetSelectionMoneyline(BetSelection):
+    """Moneyline: solo el equipo elegido"""
+    
+    __tablename__ = "bet_selections_moneyline"
+    __table_args__ = {'schema': 'espn'}
+    __mapper_args__ = {"polymorphic_identity": "moneyline"}
+    
+    bet_id = Column(BigInteger, ForeignKey("espn.bet_selections.bet_id", ondelete="CASCADE"), primary_key=True)
+    selected_team_id = Column("team_id", Integer, ForeignKey("espn.teams.team_id", ondelete="RESTRICT"), nullable=False)
+    
+    selected_team = relationship("Team", foreign_keys=[selected_team_id])
+
+
+class BetSelectionSpread(BetSelection):
+    """Spread: equipo elegido y margen de puntos"""
+    
+    __tablename__ = "bet_selections_spread"
+    __table_args__ = {'schema': 'espn'}
+    __mapper_args__ = {"polymorphic_identity": "spread"}
+    
+    bet_id = Column(BigInteger, ForeignKey("espn.bet_selections.bet_id", ondelete="CASCADE"), primary_key=True)
+    selected_team_id = Column("team_id", Integer, ForeignKey("espn.teams.team_id", ondelete="RESTRICT"), nullable=False)
+    spread_value = Column(Numeric(10, 2), nullable=False)
+    
+    selected_team = relationship("Team", foreign_keys=[selected_team_id])
+
+
+class BetSelectionTotal(BetSelection):
+    """Over/Under: línea de puntos totales y lado elegido"""
+    
+    __tablename__ = "bet_selections_total"
+    __table_args__ = {'schema': 'espn'}
+    __mapper_args__ = {"polymorphic_identity": "over_under"}
+    
+    bet_id = Column(BigInteger, ForeignKey("espn.bet_selections.bet_id", ondelete="CASCADE"), primary_key=True)
+    over_under_value = Column(Numeric(10, 2), nullable=False)
+    is_over = Column(Boolean, nullable=False)  # True for over, False for under
 
 
 # ============================================================================
@@ -144,20 +262,20 @@ class BetResult(EspnBase):
     
     __tablename__ = "bet_results"
     __table_args__ = (
-        CheckConstraint('actual_payout >= 0', name='chk_bet_results_payout'),
+        CheckConstraint('actual_payout_cents >= 0', name='chk_bet_results_payout'),
         {'schema': 'espn'},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
-    bet_id = Column(Integer, ForeignKey("espn.bets.id", ondelete="CASCADE"), nullable=False, unique=True)
+    id = Column(Integer, primary_key=True)
+    bet_id = Column(BigInteger, ForeignKey("espn.bets.id", ondelete="CASCADE"), nullable=False, unique=True)
     
     # Result details
-    actual_payout = Column(Numeric(10, 2), nullable=True)  # Actual amount won
+    actual_payout_cents = Column(BigInteger, nullable=True)  # Actual amount won (centavos)
+    actual_payout = _fixed_point('actual_payout_cents', 100)
     result_notes = Column(Text, nullable=True)  # Additional notes
     
-    # Timestamps
+    # Timestamps (el resultado se crea al liquidar: settled_at es también su fecha de creación)
     settled_at = Column(DateTime(timezone=True), server_default=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     bet = relationship("Bet", foreign_keys=[bet_id], back_populates="result")
@@ -170,42 +288,92 @@ class BetResult(EspnBase):
 # Odds de Partidos (Normalizada)
 # ============================================================================
 
-class GameOdds(EspnBase):
+# ENUM nativo de Postgres (4 bytes) en lugar de VARCHAR + CHECK
+ODDS_TYPES = ('moneyline_home', 'moneyline_away', 'spread_home', 'spread_away', 'over_under')
+odds_type_enum = ENUM(*ODDS_TYPES, name='odds_type', schema='espn')
+
+class GameOdds(FastRepr, EspnBase):
     """Game odds (normalized, supports multiple providers and snapshots)"""
     
     __tablename__ = "game_odds"
     __table_args__ = (
-        CheckConstraint(
-            "odds_type IN ('moneyline_home', 'moneyline_away', 'spread_home', 'spread_away', 'over_under')",
-            name='chk_game_odds_type'
-        ),
-        {'schema': 'espn'},
+        Index('ix_game_odds_game_type_time', 'game_id', 'odds_type', 'snapshot_time'),
+        # Particionada por mes (ver app.core.partitions); la PK incluye la clave de partición
+        {'schema': 'espn', 'postgresql_partition_by': 'RANGE (snapshot_time)'},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
-    game_id = Column(Integer, ForeignKey("espn.games.game_id", ondelete="CASCADE"), nullable=False)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    game_id = Column(BigInteger, ForeignKey("espn.games.game_id", ondelete="CASCADE"), nullable=False)
     
     # Odds type
-    odds_type = Column(String(20), nullable=False)  # moneyline_home, moneyline_away, spread_home, spread_away, over_under
+    odds_type = Column(odds_type_enum, nullable=False)
     
     # Odds values
-    odds_value = Column(Numeric(10, 4), nullable=True)  # For moneyline
-    line_value = Column(Numeric(10, 2), nullable=True)  # For spread and over/under
+    odds_value_e4 = Column(BigInteger, nullable=True)  # For moneyline (diezmilésimas)
+    odds_value = _fixed_point('odds_value_e4', 10_000)
+    line_value_cents = Column(BigInteger, nullable=True)  # For spread and over/under (centésimas)
+    line_value = _fixed_point('line_value_cents', 100)
     
     # Provider information
     provider = Column(String(50), nullable=True)  # 'espn', 'draftkings', 'fanduel', etc.
     
-    # Snapshot time
-    snapshot_time = Column(DateTime(timezone=True), server_default=func.now())
+    # Snapshot time (clave de partición)
+    snapshot_time = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # trigger set_updated_at
     
     # Relationships
     game = relationship("Game", foreign_keys=[game_id])
-    bets = relationship("Bet", back_populates="odds")
-    
-    def __repr__(self):
-        return f"<GameOdds(id={self.id}, game_id={self.game_id}, type={self.odds_type}, value={self.odds_value or self.line_value})>"
+    bets = relationship("Bet", primaryjoin="foreign(Bet.odds_id) == GameOdds.id", viewonly=True, lazy="raise")  # colección sin límite: cargar explícitamente
+    
+    _repr_fields = ("id", "game_id", "odds_type", "odds_value_e4", "line_value_cents")
+    
+    @classmethod
+    def latest_for_game(cls, session, game_id: int):
+        """Última cuota por (odds_type, provider) de un partido, como mappings (sin hidratar ORM)"""
+        return session.execute(text("""
+            SELECT DISTINCT ON (odds_type, provider)
+                   id, game_id, odds_type, provider, snapshot_time,
+                   odds_value_e4 / 10000.0 AS odds_value,
+                   line_value_cents / 100.0 AS line_value
+            FROM espn.game_odds
+            WHERE game_id = :gid
+            ORDER BY odds_type, provider, snapshot_time DESC
+        """), {"gid": game_id}).mappings().all()
+    
+    @classmethod
+    def latest_for_games(cls, session, game_ids, odds_types, providers):
+        """Última cuota por (partido, odds_type) del provider de mayor prioridad.
+
+        Una sola query: LATERAL ... LIMIT 1 por par (game_id, odds_type) sobre
+        ix_game_odds_game_type_time. Retorna {(game_id, odds_type): odds_value}.
+        """
+        if not game_ids:
+            return {}
+        rows = session.execute(text("""
+            SELECT g.game_id, t.odds_type, o.odds_value_e4 / 10000.0 AS odds_value
+            FROM unnest(CAST(:game_ids AS bigint[])) AS g(game_id)
+            CROSS JOIN unnest(CAST(:odds_types AS espn.odds_type[])) AS t(odds_type)
+            JOIN LATERAL (
+                SELECT go.odds_value_e4
+                FROM espn.game_odds go
+                WHERE go.game_id = g.game_id
+                  AND go.odds_type = t.odds_type
+                  AND go.provider = ANY(CAST(:providers AS text[]))
+                ORDER BY array_position(CAST(:providers AS text[]), go.provider::text), go.snapshot_time DESC
+                LIMIT 1
+            ) o ON true
+        """), {
+            "game_ids": [int(gid) for gid in game_ids],
+            "odds_types": list(odds_types),
+            "providers": list(providers),
+        })
+        return {(row.game_id, row.odds_type): row.odds_value for row in rows}
+
 
+attach_updated_at_trigger(Bet.__table__)
+attach_updated_at_trigger(GameOdds.__table__)
+attach_catalog_notify_trigger(BetType.__table__)
+attach_catalog_notify_trigger(BetStatus.__table__)
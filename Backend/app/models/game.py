@@ -1,11 +1,12 @@
 """
 Game model for NBA games
 NOTE: This model reflects the ACTUAL database structure, not an idealized normalized structure.
-The games table has home_team and away_team as strings, not foreign keys.
+The games table has home_team and away_team as strings; home_team_id / away_team_id
+are resolved from them by a trigger (migrations/games_team_ids.sql).
 Based on actual database schema inspection.
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, BigInteger
+from sqlalchemy import Column, Integer, String, Float, Date, BigInteger, Boolean, Computed, FetchedValue, ForeignKey, DDL, event
 from app.core.database import EspnBase
 
 class Game(EspnBase):
@@ -14,10 +15,15 @@ class Game(EspnBase):
     __tablename__ = "games"
     __table_args__ = {'schema': 'espn'}
     
-    game_id = Column(BigInteger, primary_key=True, index=True)
+    game_id = Column(BigInteger, primary_key=True)
     fecha = Column(Date, nullable=True)
     home_team = Column(String, nullable=True)  # String, not foreign key
     away_team = Column(String, nullable=True)  # String, not foreign key
+    # team_id resuelto desde el nombre por trigger (NULL si no hay equipo que coincida)
+    home_team_id = Column(Integer, ForeignKey("espn.teams.team_id", ondelete="SET NULL"), nullable=True,
+                          server_default=FetchedValue(), server_onupdate=FetchedValue())
+    away_team_id = Column(Integer, ForeignKey("espn.teams.team_id", ondelete="SET NULL"), nullable=True,
+                          server_default=FetchedValue(), server_onupdate=FetchedValue())
     home_score = Column(Float, nullable=True)
     away_score = Column(Float, nullable=True)
     
@@ -49,13 +55,59 @@ class Game(EspnBase):
     home_team_normalized = Column(String, nullable=True)
     away_team_normalized = Column(String, nullable=True)
     
-    # Game results and differences
-    home_win = Column(BigInteger, nullable=True)  # bigint, not boolean
-    point_diff = Column(Float, nullable=True)
-    net_rating_diff = Column(Float, nullable=True)
-    reb_diff = Column(Float, nullable=True)
-    ast_diff = Column(Float, nullable=True)
-    tov_diff = Column(Float, nullable=True)
+    # Game results and differences: columnas generadas (STORED), Postgres las recalcula
+    # al escribir los scores/stats; el ETL ya no las inserta (ver migrations/generated_game_diffs.sql)
+    home_win = Column(
+        Boolean,
+        Computed("CASE WHEN home_score > 0 OR away_score > 0 THEN home_score > away_score END", persisted=True),
+        nullable=True,
+    )  # NULL mientras el partido no se ha jugado (0-0)
+    point_diff = Column(Float, Computed("home_score - away_score", persisted=True), nullable=True)
+    net_rating_diff = Column(
+        Float,
+        Computed("(home_fg_pct - away_fg_pct) + (home_3p_pct - away_3p_pct)", persisted=True),
+        nullable=True,
+    )
+    reb_diff = Column(Float, Computed("home_reb - away_reb", persisted=True), nullable=True)
+    ast_diff = Column(Float, Computed("home_ast - away_ast", persisted=True), nullable=True)
+    tov_diff = Column(Float, Computed("away_to - home_to", persisted=True), nullable=True)  # Positivo si el local pierde menos balones
     
     def __repr__(self):
         return f"<Game(game_id={self.game_id}, {self.away_team} @ {self.home_team}, {self.fecha})>"
+
+
+# Trigger que resuelve home_team_id / away_team_id (mismo SQL que migrations/games_team_ids.sql),
+# registrado en el CREATE TABLE para que también exista en bases creadas con create_all
+_RESOLVE_TEAM_ID_FN = DDL("""
+CREATE OR REPLACE FUNCTION espn.resolve_team_id(team_name TEXT)
+RETURNS INTEGER AS $$
+    SELECT COALESCE(
+        (SELECT team_id FROM espn.teams WHERE name = team_name LIMIT 1),
+        (SELECT team_id FROM espn.teams WHERE name ILIKE team_name LIMIT 1),
+        (SELECT team_id FROM espn.teams WHERE name ILIKE '%%' || team_name || '%%' LIMIT 1)
+    );
+$$ LANGUAGE sql STABLE
+""")
+
+_GAMES_RESOLVE_TEAM_IDS_FN = DDL("""
+CREATE OR REPLACE FUNCTION espn.games_resolve_team_ids()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.home_team IS DISTINCT FROM OLD.home_team THEN
+        NEW.home_team_id := espn.resolve_team_id(NEW.home_team);
+    END IF;
+    IF TG_OP = 'INSERT' OR NEW.away_team IS DISTINCT FROM OLD.away_team THEN
+        NEW.away_team_id := espn.resolve_team_id(NEW.away_team);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+event.listen(Game.__table__, "after_create", _RESOLVE_TEAM_ID_FN)
+event.listen(Game.__table__, "after_create", _GAMES_RESOLVE_TEAM_IDS_FN)
+event.listen(Game.__table__, "after_create", DDL("DROP TRIGGER IF EXISTS games_resolve_team_ids_trigger ON %(fullname)s"))
+event.listen(Game.__table__, "after_create", DDL(
+    "CREATE TRIGGER games_resolve_team_ids_trigger BEFORE INSERT OR UPDATE OF home_team, away_team ON %(fullname)s "
+    "FOR EACH ROW EXECUTE FUNCTION espn.games_resolve_team_ids()"
+))
@@ -2,7 +2,8 @@
 Idempotency Key model for RF-02
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from app.core.database import SysBase
 
@@ -12,10 +13,10 @@ class IdempotencyKey(SysBase):
     __tablename__ = "idempotency_keys"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
-    request_key = Column(String(255), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    request_key = Column(UUID(as_uuid=True), unique=True, nullable=False, index=True)  # UUID de 16 bytes (ver idempotency_service.request_key_uuid)
     request_id = Column(Integer, nullable=True)  # FK a requests.id (se agregará después)
-    response_data = Column(Text, nullable=True)  # Respuesta previa en JSON
+    response_data = Column(JSONB, nullable=True)  # Respuesta previa (el engine serializa el dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=True)  # Para limpiar keys antiguas
     
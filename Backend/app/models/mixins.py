@@ -0,0 +1,42 @@
+"""
+Mixins compartidos por los modelos
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import inspect as sa_inspect
+
+
+@lru_cache(maxsize=None)
+def _column_keys(cls) -> Tuple[str, ...]:
+    """Claves de columnas mapeadas de un modelo (calculadas una vez por clase)"""
+    return tuple(attr.key for attr in sa_inspect(cls).column_attrs)
+
+
+class FastRepr:
+    """repr/serialización leyendo `__dict__` directamente.
+
+    Evita pasar por los descriptores instrumentados (y por lazy loads o
+    refresh de atributos expirados) en modelos que se listan en volumen.
+    Los atributos no cargados salen como None.
+    """
+
+    __slots__ = ()
+
+    # Campos mostrados en __repr__ (claves de columna, no hybrid properties)
+    _repr_fields: Tuple[str, ...] = ("id",)
+    _repr_fmt: str = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Plantilla precompilada una vez por clase: "<Cls(id={!r}, ...)>"
+        fields = ", ".join(f"{key}={{!r}}" for key in cls._repr_fields)
+        cls._repr_fmt = f"<{cls.__name__}({fields})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        state = self.__dict__
+        return {key: state.get(key) for key in _column_keys(type(self))}
+
+    def __repr__(self):
+        return self._repr_fmt.format(*map(self.__dict__.get, self._repr_fields))
@@ -2,29 +2,37 @@
 Odds Line model for RF-07
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import SysBase
+from app.models.mixins import FastRepr
 
-class OddsLine(SysBase):
+class OddsLine(FastRepr, SysBase):
     """Odds Line model for storing individual odds from providers"""
     
     __tablename__ = "odds_lines"
-    __table_args__ = {'schema': 'app'}
+    __table_args__ = (
+        Index('ix_odds_lines_snapshot_line', 'snapshot_id', 'line_code'),
+        # Particionada por mes (ver app.core.partitions); la PK incluye la clave de partición
+        {'schema': 'app', 'postgresql_partition_by': 'RANGE (created_at)'},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # created_at (server default) vuelve por RETURNING en el mismo INSERT por lotes
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     snapshot_id = Column(Integer, ForeignKey("app.odds_snapshots.id", ondelete="CASCADE"), nullable=False, index=True)
     provider_id = Column(Integer, ForeignKey("app.providers.id", ondelete="RESTRICT"), nullable=True, index=True)  # Nullable porque puede venir de espn
     line_code = Column(String(100), nullable=False)  # e.g., "home_win", "away_win", "over_2.5"
     price = Column(Numeric(10, 4), nullable=False)  # Decimal odds
-    line_metadata = Column(Text, nullable=True)  # JSON con metadatos adicionales
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    line_metadata = Column(JSONB, nullable=True)  # JSON con metadatos adicionales
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())  # Clave de partición
     
     # Relationships
     snapshot = relationship("OddsSnapshot", back_populates="odds_lines")
     provider = relationship("Provider", back_populates="odds_lines", foreign_keys=[provider_id])
     
-    def __repr__(self):
-        return f"<OddsLine(id={self.id}, snapshot_id={self.snapshot_id}, line_code='{self.line_code}', price={self.price})>"
+    _repr_fields = ("id", "snapshot_id", "line_code", "price")
 
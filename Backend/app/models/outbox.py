@@ -2,22 +2,71 @@
 Outbox model for RF-08
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from typing import List, Sequence
+from sqlalchemy import Column, BigInteger, String, DateTime, Index, text, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from app.core.database import SysBase
 
 class Outbox(SysBase):
     """Outbox model for transactional event publishing"""
     
     __tablename__ = "outbox"
-    __table_args__ = {'schema': 'app'}
+    __table_args__ = (
+        # El worker solo lee pendientes: índice parcial sobre published_at IS NULL
+        Index('ix_outbox_unpublished', 'created_at', postgresql_where=text('published_at IS NULL')),
+        Index('ix_outbox_payload_gin', 'payload', postgresql_using='gin'),
+        {'schema': 'app'},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True)
     topic = Column(String(100), nullable=False, index=True)  # e.g., "prediction.completed", "bet.placed"
-    payload = Column(Text, nullable=False)  # JSON con el payload del evento
+    payload = Column(JSONB, nullable=False)  # JSON con el payload del evento
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     published_at = Column(DateTime(timezone=True), nullable=True, index=True)  # NULL = no publicado
     
+    @classmethod
+    def _claim_batch_stmt(cls, n: int):
+        return (
+            select(cls)
+            .where(cls.published_at.is_(None))
+            .order_by(cls.created_at.asc())
+            .limit(n)
+            .with_for_update(skip_locked=True)
+        )
+    
+    @classmethod
+    def _mark_published_stmt(cls, ids: Sequence[int]):
+        return update(cls).where(cls.id.in_(ids)).values(published_at=func.now())
+    
+    @classmethod
+    def claim_batch(cls, session: Session, n: int) -> List["Outbox"]:
+        """
+        Reclama hasta n eventos pendientes con FOR UPDATE SKIP LOCKED.
+        Varios workers pueden drenar el outbox en paralelo sin esperar locks;
+        los locks se liberan en el commit/rollback de la sesión.
+        """
+        return session.execute(cls._claim_batch_stmt(n)).scalars().all()
+    
+    @classmethod
+    async def claim_batch_async(cls, session: AsyncSession, n: int) -> List["Outbox"]:
+        """claim_batch sobre AsyncSession (worker del outbox)"""
+        return (await session.execute(cls._claim_batch_stmt(n))).scalars().all()
+    
+    @classmethod
+    def mark_published(cls, session: Session, ids: Sequence[int]) -> None:
+        """Marca como publicados los eventos indicados en un único UPDATE"""
+        if ids:
+            session.execute(cls._mark_published_stmt(ids))
+    
+    @classmethod
+    async def mark_published_async(cls, session: AsyncSession, ids: Sequence[int]) -> None:
+        """mark_published sobre AsyncSession"""
+        if ids:
+            await session.execute(cls._mark_published_stmt(ids))
+    
     def __repr__(self):
         return f"<Outbox(id={self.id}, topic='{self.topic}', published_at={self.published_at})>"
 
@@ -5,7 +5,7 @@ Permission model for authorization system
 from sqlalchemy import Column, Integer, String, Text, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import SysBase
+from app.core.database import SysBase, attach_catalog_notify_trigger
 
 class Permission(SysBase):
     """Permission model for RBAC system"""
@@ -13,7 +13,7 @@ class Permission(SysBase):
     __tablename__ = "permissions"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     code = Column(String(100), unique=True, nullable=False, index=True)  # e.g., "predictions:read", "bets:write"
     name = Column(String(200), nullable=False)  # e.g., "Read Predictions", "Create Bets"
     description = Column(Text, nullable=True)
@@ -21,8 +21,10 @@ class Permission(SysBase):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    roles = relationship("Role", secondary="app.role_permissions", back_populates="permissions")
+    roles = relationship("Role", secondary="app.role_permissions", back_populates="permissions", lazy="selectin")
     
     def __repr__(self):
         return f"<Permission(id={self.id}, code='{self.code}', scope='{self.scope}')>"
 
+
+attach_catalog_notify_trigger(Permission.__table__)
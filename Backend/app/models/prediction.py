@@ -2,7 +2,8 @@
 Prediction model for RF-06 and RF-07
 """
 
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, BigInteger, Float, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import SysBase
@@ -11,14 +12,20 @@ class Prediction(SysBase):
     """Prediction model for ML predictions with telemetry"""
     
     __tablename__ = "predictions"
-    __table_args__ = {'schema': 'app'}
+    __table_args__ = (
+        Index('ix_prediction_telemetry_gin', 'telemetry', postgresql_using='gin'),
+        {'schema': 'app'},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # created_at (server default) vuelve por RETURNING en el mismo INSERT por lotes
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id = Column(BigInteger, primary_key=True)
     request_id = Column(Integer, ForeignKey("app.requests.id", ondelete="CASCADE"), unique=True, nullable=False, index=True)
     model_version_id = Column(Integer, ForeignKey("app.model_versions.id", ondelete="RESTRICT"), nullable=False, index=True)
-    score = Column(Text, nullable=False)  # JSON con el score de la predicción
+    score = Column(JSONB, nullable=False)  # JSON con el score de la predicción
     latency_ms = Column(Float, nullable=True)  # Latencia de la predicción en ms
-    telemetry = Column(Text, nullable=True)  # JSON con telemetría adicional
+    telemetry = Column(JSONB, nullable=True)  # JSON con telemetría adicional
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -2,10 +2,11 @@
 Provider Endpoint model for RF-05
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import SysBase
+from app.core.database import SysBase, attach_catalog_notify_trigger
 
 class ProviderEndpoint(SysBase):
     """Provider Endpoint model for external API endpoints"""
@@ -13,12 +14,12 @@ class ProviderEndpoint(SysBase):
     __tablename__ = "provider_endpoints"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     provider_id = Column(Integer, ForeignKey("app.providers.id", ondelete="CASCADE"), nullable=False, index=True)
     purpose = Column(String(100), nullable=False)  # e.g., "odds", "stats", "predictions"
     url = Column(String(500), nullable=False)
     method = Column(String(10), default="GET", nullable=False)  # GET, POST, etc.
-    headers = Column(Text, nullable=True)  # JSON con headers adicionales
+    headers = Column(JSONB, nullable=True)  # JSON con headers adicionales
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -27,3 +28,5 @@ class ProviderEndpoint(SysBase):
     def __repr__(self):
         return f"<ProviderEndpoint(id={self.id}, provider_id={self.provider_id}, purpose='{self.purpose}')>"
 
+
+attach_catalog_notify_trigger(ProviderEndpoint.__table__)
@@ -2,10 +2,12 @@
 Request model for RF-03 - ACID transaction registration
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Text, FetchedValue
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import SysBase
+from app.core.database import SysBase, attach_updated_at_trigger
+from app.models.game import Game
 import enum
 
 class RequestStatus(str, enum.Enum):
@@ -16,23 +18,32 @@ class RequestStatus(str, enum.Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+# ENUM nativo de Postgres (4 bytes) con los valores en minúscula ('completed', ...)
+request_status_enum = ENUM(
+    RequestStatus,
+    name="request_status",
+    schema="app",
+    values_callable=lambda enum_cls: [member.value for member in enum_cls],
+)
+
 class Request(SysBase):
     """Request model for ACID transaction registration"""
     
     __tablename__ = "requests"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, nullable=True)  # Para futuro uso con organizaciones
     user_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="SET NULL"), nullable=True, index=True)
-    event_id = Column(Integer, nullable=True)  # Referencia a espn.games.id (sin FK por esquema diferente)
+    # FK cross-schema: se referencia la Column porque espn.games vive en la metadata de EspnBase
+    event_id = Column(BigInteger, ForeignKey(Game.__table__.c.game_id, ondelete="SET NULL"), nullable=True, index=True)
     market_id = Column(Integer, nullable=True)  # Para futuro uso con markets
     request_key = Column(String(255), nullable=False, index=True)  # Referencia a idempotency_keys.request_key
-    status = Column(Enum(RequestStatus), default=RequestStatus.RECEIVED, nullable=False, index=True)
-    request_metadata = Column(Text, nullable=True)  # JSON con metadatos adicionales (renombrado de 'metadata' porque es reservado)
+    status = Column(request_status_enum, default=RequestStatus.RECEIVED, nullable=False, index=True)
+    request_metadata = Column(JSONB, nullable=True)  # JSON con metadatos adicionales (renombrado de 'metadata' porque es reservado)
     error_message = Column(Text, nullable=True)  # Mensaje de error si falla
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # trigger set_updated_at
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
@@ -41,3 +52,5 @@ class Request(SysBase):
     def __repr__(self):
         return f"<Request(id={self.id}, request_key='{self.request_key}', status='{self.status}')>"
 
+
+attach_updated_at_trigger(Request.__table__)
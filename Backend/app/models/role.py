@@ -5,7 +5,7 @@ Role model for authorization system
 from sqlalchemy import Column, Integer, String, Text, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import SysBase
+from app.core.database import SysBase, attach_catalog_notify_trigger
 
 class Role(SysBase):
     """Role model for RBAC system"""
@@ -13,16 +13,18 @@ class Role(SysBase):
     __tablename__ = "roles"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     code = Column(String(50), unique=True, nullable=False, index=True)  # e.g., "admin", "user", "operator"
     name = Column(String(100), nullable=False)  # e.g., "Administrator", "Regular User"
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    permissions = relationship("Permission", secondary="app.role_permissions", back_populates="roles")
-    users = relationship("UserAccount", secondary="app.user_roles", back_populates="roles")
+    permissions = relationship("Permission", secondary="app.role_permissions", back_populates="roles", lazy="selectin")
+    users = relationship("UserAccount", secondary="app.user_roles", back_populates="roles", lazy="raise")  # colección sin límite: cargar explícitamente
     
     def __repr__(self):
         return f"<Role(id={self.id}, code='{self.code}', name='{self.name}')>"
 
+
+attach_catalog_notify_trigger(Role.__table__)
@@ -4,7 +4,7 @@ Role-Permission association table
 
 from sqlalchemy import Column, Integer, ForeignKey, DateTime
 from sqlalchemy.sql import func
-from app.core.database import SysBase
+from app.core.database import SysBase, attach_catalog_notify_trigger
 
 class RolePermission(SysBase):
     """Association table between roles and permissions"""
@@ -19,3 +19,5 @@ class RolePermission(SysBase):
     def __repr__(self):
         return f"<RolePermission(role_id={self.role_id}, permission_id={self.permission_id})>"
 
+
+attach_catalog_notify_trigger(RolePermission.__table__)
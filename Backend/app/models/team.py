@@ -12,7 +12,7 @@ class Team(EspnBase):
     __tablename__ = "teams"
     __table_args__ = {'schema': 'espn'}
     
-    team_id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, primary_key=True)
     name = Column(String(100), unique=True, nullable=False)  # e.g., "Los Angeles Lakers"
     abbreviation = Column(String(10), unique=True, nullable=False)  # e.g., "LAL"
     city = Column(String(50), nullable=False)  # e.g., "Los Angeles"
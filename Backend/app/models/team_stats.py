@@ -2,10 +2,10 @@
 Team statistics model for games
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, ForeignKey, Boolean, FetchedValue
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import EspnBase
+from app.core.database import EspnBase, attach_updated_at_trigger
 
 class TeamStatsGame(EspnBase):
     """Team statistics for a specific game"""
@@ -13,8 +13,8 @@ class TeamStatsGame(EspnBase):
     __tablename__ = "team_stats_game"
     __table_args__ = {'schema': 'espn'}
     
-    id = Column(Integer, primary_key=True, index=True)
-    game_id = Column(Integer, ForeignKey("espn.games.game_id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    game_id = Column(BigInteger, ForeignKey("espn.games.game_id"), nullable=False)
     team_id = Column(Integer, ForeignKey("espn.teams.team_id"), nullable=False)
     is_home = Column(Boolean, nullable=False)  # True if home team, False if away
     
@@ -35,7 +35,7 @@ class TeamStatsGame(EspnBase):
     # Team efficiency (no disponible en boxscores actuales - removido)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # trigger set_updated_at
     
     # Relationships
     game = relationship("Game")
@@ -43,3 +43,6 @@ class TeamStatsGame(EspnBase):
     
     def __repr__(self):
         return f"<TeamStatsGame(id={self.id}, game_id={self.game_id}, team_id={self.team_id}, points={self.points})>"
+
+
+attach_updated_at_trigger(TeamStatsGame.__table__)
@@ -2,10 +2,15 @@
 Transaction model for credit management
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, DateTime, ForeignKey, Index, CheckConstraint, select, tuple_
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.bulk import bulk_insert, bulk_insert_async
 from app.core.database import SysBase
+from app.models.mixins import FastRepr
+from app.models.espn_bet import Bet
 import enum
 
 class TransactionType(str, enum.Enum):
@@ -16,30 +21,68 @@ class TransactionType(str, enum.Enum):
     CREDIT_PURCHASE = "credit_purchase"
     ADMIN_ADJUSTMENT = "admin_adjustment"
 
-class Transaction(SysBase):
+# Columna VARCHAR + CHECK: TransactionType hereda de str, se escribe/lee tal cual sin coerción de enum
+_TRANSACTION_TYPE_VALUES = ", ".join(f"'{member.value}'" for member in TransactionType)
+
+# Columnas que escriben los servicios (id y created_at los genera la base de datos)
+_BULK_COLUMNS = ("user_id", "bet_id", "transaction_type", "amount", "balance_before", "balance_after", "description")
+
+def _normalize_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{**row, "transaction_type": TransactionType(row["transaction_type"]).value} for row in rows]
+
+class Transaction(FastRepr, SysBase):
     """Transaction model for credit tracking"""
     
     __tablename__ = "transactions"
-    __table_args__ = {'schema': 'app'}
+    __table_args__ = (
+        # Historial por usuario con paginación por keyset (created_at, id); ver Transaction.page
+        Index('ix_tx_user_created', 'user_id', 'created_at', 'id'),
+        CheckConstraint(f"transaction_type IN ({_TRANSACTION_TYPE_VALUES})", name='chk_tx_type'),
+        # Invariante del saldo (exacto: NUMERIC(12,2))
+        CheckConstraint('balance_before + amount = balance_after', name='chk_tx_balance'),
+        # Particionada por mes (ver app.core.partitions); la PK incluye la clave de partición
+        {'schema': 'app', 'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+    
+    # created_at (server default) vuelve por RETURNING en el mismo INSERT por lotes
+    __mapper_args__ = {"eager_defaults": True}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("app.user_accounts.id"), nullable=False)
-    bet_id = Column(Integer, nullable=True)  # Reference to espn.bets.id (no FK constraint due to cross-schema)
+    # FK cross-schema: se referencia la Column porque espn.bets vive en la metadata de EspnBase
+    bet_id = Column(BigInteger, ForeignKey(Bet.__table__.c.id, ondelete="SET NULL"), nullable=True, index=True)
     
     # Transaction details
-    transaction_type = Column(Enum(TransactionType), nullable=False)
-    amount = Column(Float, nullable=False)  # Positive for credits added, negative for credits spent
-    balance_before = Column(Float, nullable=False)  # User's balance before transaction
-    balance_after = Column(Float, nullable=False)  # User's balance after transaction
+    transaction_type = Column(String(24), nullable=False)  # Valores de TransactionType
+    amount = Column(Numeric(12, 2), nullable=False)  # Positive for credits added, negative for credits spent
+    balance_before = Column(Numeric(12, 2), nullable=False)  # User's balance before transaction
+    balance_after = Column(Numeric(12, 2), nullable=False)  # User's balance after transaction
     description = Column(String(255), nullable=True)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Timestamps (created_at es la clave de partición)
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     
     # Relationships
-    user = relationship("UserAccount")
-    # Note: bet_id references espn.bets.id, but we don't have a relationship
-    # because it's in a different schema and we can't have cross-schema relationships
+    user = relationship("UserAccount", lazy="raise_on_sql")
+    
+    _repr_fields = ("id", "user_id", "transaction_type", "amount")
+    
+    @classmethod
+    def bulk_insert(cls, session, rows: List[Dict[str, Any]]) -> int:
+        """Inserta un lote de movimientos en una sola sentencia (o COPY si es grande), sin flush por fila"""
+        return bulk_insert(session, cls, _normalize_rows(rows), _BULK_COLUMNS)
+    
+    @classmethod
+    async def bulk_insert_async(cls, session, rows: List[Dict[str, Any]]) -> int:
+        """bulk_insert sobre AsyncSession (COPY de asyncpg o INSERT multi-VALUES)"""
+        return await bulk_insert_async(session, cls, _normalize_rows(rows), _BULK_COLUMNS)
     
-    def __repr__(self):
-        return f"<Transaction(id={self.id}, user_id={self.user_id}, type={self.transaction_type}, amount={self.amount})>"
+    @classmethod
+    def page(cls, session, user_id: int, cursor: Optional[Tuple[datetime, int]] = None, limit: int = 50) -> List["Transaction"]:
+        """Página del historial (más reciente primero) por keyset: cursor = (created_at, id) del último
+        movimiento de la página anterior. Coste constante por página, sin OFFSET ni COUNT"""
+        stmt = select(cls).where(cls.user_id == user_id)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(cls.created_at, cls.id) < tuple_(*cursor))
+        stmt = stmt.order_by(cls.created_at.desc(), cls.id.desc()).limit(limit)
+        return list(session.scalars(stmt))
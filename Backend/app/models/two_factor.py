@@ -2,24 +2,27 @@
 Two-Factor Authentication models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import SysBase
+from app.models.mixins import FastRepr
 
-class UserTwoFactor(SysBase):
+class UserTwoFactor(FastRepr, SysBase):
     """Two-Factor Authentication configuration for users"""
     
     __tablename__ = "user_two_factor"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_account_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     
     # 2FA Configuration
     secret = Column(String(32), nullable=False)  # TOTP secret (base32 encoded)
     is_enabled = Column(Boolean, default=False, nullable=False)
-    backup_codes = Column(Text, nullable=True)  # JSON array of backup codes (hashed)
+    # SHA-256 crudo (32 bytes) de cada código de respaldo; se compara con = ANY() en la base de datos
+    backup_codes = Column(ARRAY(LargeBinary(32)), nullable=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -29,5 +32,4 @@ class UserTwoFactor(SysBase):
     # Relationships
     user_account = relationship("UserAccount", foreign_keys=[user_account_id])
     
-    def __repr__(self):
-        return f"<UserTwoFactor(id={self.id}, user_account_id={self.user_account_id}, is_enabled={self.is_enabled})>"
+    _repr_fields = ("id", "user_account_id", "is_enabled")
@@ -2,56 +2,69 @@
 Normalized User Account models - Separated by user type
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean, ForeignKey, Date, CheckConstraint
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean, ForeignKey, Date, CheckConstraint, select, bindparam, DDL, event
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, joinedload
 from app.core.database import SysBase
+from app.models.mixins import FastRepr
+
+# CITEXT (username/email) requiere la extensión antes del CREATE TABLE en bases creadas con create_all
+event.listen(SysBase.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS citext"))
 
 # ============================================================================
 # Tabla Base de Cuentas de Usuario
 # ============================================================================
 
-class UserAccount(SysBase):
+class UserAccount(FastRepr, SysBase):
     """Base user account with common authentication fields"""
     
     __tablename__ = "user_accounts"
-    __table_args__ = {'schema': 'app'}
+    __table_args__ = (
+        CheckConstraint("user_type IN ('client', 'administrator', 'operator')", name='chk_user_accounts_user_type'),
+        # CITEXT no tiene longitud: se conservan los límites de VARCHAR(50)/VARCHAR(100)
+        CheckConstraint("char_length(username) <= 50", name='chk_user_accounts_username_len'),
+        CheckConstraint("char_length(email) <= 100", name='chk_user_accounts_email_len'),
+        {'schema': 'app'},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, index=True, nullable=False)
-    email = Column(String(100), unique=True, index=True, nullable=False)
+    id = Column(Integer, primary_key=True)
+    # CITEXT: igualdad y UNIQUE sin distinguir mayúsculas, usando el índice normal (sin lower())
+    username = Column(CITEXT, unique=True, index=True, nullable=False)
+    email = Column(CITEXT, unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    # avatar_url movido a tablas individuales (clients/administrators/operators)
+    # Discriminador: tabla de perfil actual (clients/administrators/operators); NULL si el usuario
+    # no tiene perfil. Lo mantiene el trigger app.sync_user_type al insertar/borrar el perfil (ver más abajo)
+    user_type = Column(String(16), nullable=True, index=True)
+    # Copia del perfil para listados sin JOIN a las tablas por tipo; la fuente sigue siendo
+    # clients/administrators/operators (trigger app.sync_user_profile, ver más abajo)
+    display_name = Column(String(201), nullable=True)  # "first_name last_name"
+    avatar_url = Column(String(500), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    # Relationships (polymorphic)
-    client = relationship("Client", back_populates="user_account", uselist=False)
-    administrator = relationship("Administrator", back_populates="user_account", uselist=False)
-    operator = relationship("Operator", back_populates="user_account", uselist=False)
-    roles = relationship("Role", secondary="app.user_roles", back_populates="users")
+    # Relationships (polymorphic). raise_on_sql: cargar con load_user_account()/joinedload/selectinload,
+    # nunca un SELECT implícito por fila
+    client = relationship("Client", back_populates="user_account", uselist=False, lazy="raise_on_sql")
+    administrator = relationship("Administrator", back_populates="user_account", uselist=False, lazy="raise_on_sql")
+    operator = relationship("Operator", back_populates="user_account", uselist=False, lazy="raise_on_sql")
+    roles = relationship("Role", secondary="app.user_roles", back_populates="users", lazy="raise_on_sql")
     
-    def __repr__(self):
-        return f"<UserAccount(id={self.id}, username='{self.username}', email='{self.email}')>"
+    _repr_fields = ("id", "username", "email")
     
-    @property
-    def user_type(self):
-        """Determine user type based on relationships"""
-        if self.client:
-            return 'client'
-        elif self.administrator:
-            return 'administrator'
-        elif self.operator:
-            return 'operator'
-        return None
+
+
+def load_user_account(db, user_id: int):
+    """UserAccount con su perfil (client/administrator/operator) y el rol del perfil en un solo SELECT"""
+    return db.scalars(me_statement(), {"id": user_id}).first()
 
 
 # ============================================================================
 # Cliente (Reemplaza "usuario")
 # ============================================================================
 
-class Client(SysBase):
+class Client(FastRepr, SysBase):
     """Client model - Users who can place bets"""
     
     __tablename__ = "clients"
@@ -60,12 +73,12 @@ class Client(SysBase):
         {'schema': 'app'},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_account_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="CASCADE"), nullable=False, unique=True)
     role_id = Column(Integer, ForeignKey("app.roles.id", ondelete="RESTRICT"), nullable=False)
     
     # Client-specific fields
-    credits = Column(Numeric(10, 2), default=1000.0, nullable=False)
+    credits = Column(Numeric(12, 2), default=1000.0, nullable=False)  # Mismo tipo que los montos de app.transactions
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
     phone = Column(String(20), nullable=True)
@@ -80,21 +93,20 @@ class Client(SysBase):
     user_account = relationship("UserAccount", foreign_keys=[user_account_id], back_populates="client")
     role = relationship("Role", foreign_keys=[role_id])
     
-    def __repr__(self):
-        return f"<Client(id={self.id}, user_account_id={self.user_account_id}, credits={self.credits})>"
+    _repr_fields = ("id", "user_account_id", "credits")
 
 
 # ============================================================================
 # Administrador
 # ============================================================================
 
-class Administrator(SysBase):
+class Administrator(FastRepr, SysBase):
     """Administrator model - System administrators with full access"""
     
     __tablename__ = "administrators"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_account_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="CASCADE"), nullable=False, unique=True)
     role_id = Column(Integer, ForeignKey("app.roles.id", ondelete="RESTRICT"), nullable=False)
     
@@ -114,21 +126,20 @@ class Administrator(SysBase):
     user_account = relationship("UserAccount", foreign_keys=[user_account_id], back_populates="administrator")
     role = relationship("Role", foreign_keys=[role_id])
     
-    def __repr__(self):
-        return f"<Administrator(id={self.id}, user_account_id={self.user_account_id}, employee_id='{self.employee_id}')>"
+    _repr_fields = ("id", "user_account_id", "employee_id")
 
 
 # ============================================================================
 # Operador
 # ============================================================================
 
-class Operator(SysBase):
+class Operator(FastRepr, SysBase):
     """Operator model - System operators with limited permissions"""
     
     __tablename__ = "operators"
     __table_args__ = {'schema': 'app'}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_account_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="CASCADE"), nullable=False, unique=True)
     role_id = Column(Integer, ForeignKey("app.roles.id", ondelete="RESTRICT"), nullable=False)
     
@@ -149,6 +160,84 @@ class Operator(SysBase):
     user_account = relationship("UserAccount", foreign_keys=[user_account_id], back_populates="operator")
     role = relationship("Role", foreign_keys=[role_id])
     
-    def __repr__(self):
-        return f"<Operator(id={self.id}, user_account_id={self.user_account_id}, employee_id='{self.employee_id}', shift='{self.shift}')>"
+    _repr_fields = ("id", "user_account_id", "employee_id", "shift")
+
+
+# ============================================================================
+# Triggers de perfil (mismo SQL que migrations/user_type_discriminator.sql
+# y migrations/user_profile_denorm.sql)
+# ============================================================================
+
+# Registrados en el CREATE TABLE de cada tabla de perfil para que también existan
+# en bases creadas con create_all (igual que attach_updated_at_trigger)
+_SYNC_USER_PROFILE_FN = DDL("""
+CREATE OR REPLACE FUNCTION app.sync_user_profile()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE app.user_accounts
+    SET display_name = NULLIF(btrim(concat_ws(' ', NEW.first_name, NEW.last_name)), ''),
+        avatar_url = NEW.avatar_url
+    WHERE id = NEW.user_account_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+# Perfil insertado -> user_type; perfil borrado -> NULL si aún apuntaba a esa tabla (al mover un
+# usuario de tabla el orden INSERT/DELETE da igual)
+_SYNC_USER_TYPE_FN = DDL("""
+CREATE OR REPLACE FUNCTION app.sync_user_type()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE app.user_accounts SET user_type = NULL
+        WHERE id = OLD.user_account_id AND user_type = TG_ARGV[0];
+    ELSE
+        UPDATE app.user_accounts SET user_type = TG_ARGV[0]
+        WHERE id = NEW.user_account_id AND user_type IS DISTINCT FROM TG_ARGV[0];
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+for _profile_table, _user_type in (
+    (Client.__table__, 'client'),
+    (Administrator.__table__, 'administrator'),
+    (Operator.__table__, 'operator'),
+):
+    event.listen(_profile_table, "after_create", _SYNC_USER_TYPE_FN)
+    event.listen(_profile_table, "after_create", DDL("DROP TRIGGER IF EXISTS sync_user_type ON %(fullname)s"))
+    event.listen(_profile_table, "after_create", DDL(
+        "CREATE TRIGGER sync_user_type AFTER INSERT OR DELETE ON %(fullname)s "
+        f"FOR EACH ROW EXECUTE FUNCTION app.sync_user_type('{_user_type}')"
+    ))
+    event.listen(_profile_table, "after_create", _SYNC_USER_PROFILE_FN)
+    event.listen(_profile_table, "after_create", DDL("DROP TRIGGER IF EXISTS sync_user_profile ON %(fullname)s"))
+    event.listen(_profile_table, "after_create", DDL(
+        "CREATE TRIGGER sync_user_profile AFTER INSERT OR UPDATE OF first_name, last_name, avatar_url "
+        "ON %(fullname)s FOR EACH ROW EXECUTE FUNCTION app.sync_user_profile()"
+    ))
+
+
+# ============================================================================
+# Carga del perfil completo ("me")
+# ============================================================================
+
+# Se construye una sola vez (en el primer uso, cuando todos los mappers ya están
+# registrados): misma sentencia y misma clave de caché de compilación en cada llamada;
+# el id entra como bindparam. Perfiles y su rol son uno a uno: joinedload los trae en el
+# mismo SELECT sin duplicar la fila del usuario.
+_ME_STMT = None
+
 
+def me_statement():
+    global _ME_STMT
+    if _ME_STMT is None:
+        me_loader = (
+            joinedload(UserAccount.client).joinedload(Client.role),
+            joinedload(UserAccount.administrator).joinedload(Administrator.role),
+            joinedload(UserAccount.operator).joinedload(Operator.role),
+        )
+        _ME_STMT = select(UserAccount).options(*me_loader).where(UserAccount.id == bindparam("id"))
+    return _ME_STMT
@@ -2,33 +2,38 @@
 User Session models for tracking active JWT sessions
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index, LargeBinary, CheckConstraint, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import SysBase
+from app.models.mixins import FastRepr
 
-class UserSession(SysBase):
+class UserSession(FastRepr, SysBase):
     """Active user sessions (JWT tokens)"""
     
     __tablename__ = "user_sessions"
     __table_args__ = (
-        Index('idx_user_sessions_user_account_id', 'user_account_id'),
-        Index('idx_user_sessions_token_hash', 'token_hash'),
+        Index('idx_user_sessions_user_account_id', 'user_account_id'),  # FK + búsqueda por dispositivo
+        # Auth check: WHERE token_hash = ? AND is_active (índice parcial, solo sesiones vivas)
+        Index('idx_sessions_token_active', 'token_hash', postgresql_where=text('is_active')),
+        # Listado de sesiones activas del usuario ORDER BY created_at DESC
+        Index('idx_sessions_user_active_created', 'user_account_id', 'created_at', postgresql_where=text('is_active')),
+        CheckConstraint('octet_length(token_hash) = 32', name='chk_user_sessions_token_hash_len'),
         {'schema': 'app'},
     )
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_account_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_account_id = Column(Integer, ForeignKey("app.user_accounts.id", ondelete="CASCADE"), nullable=False)
     
     # Session information
-    token_hash = Column(String(64), nullable=False, index=True)  # SHA-256 hash of JWT token
+    token_hash = Column(LargeBinary(32), nullable=False)  # SHA-256 digest (32 bytes, bytea) of JWT token
     device_info = Column(String(255), nullable=True)  # Browser, OS, etc.
     ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
     user_agent = Column(Text, nullable=True)
     location = Column(String(255), nullable=True)  # City, Country
     
     # Session status
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     last_activity = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Timestamps
@@ -37,7 +42,6 @@ class UserSession(SysBase):
     revoked_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    user_account = relationship("UserAccount", foreign_keys=[user_account_id])
+    user_account = relationship("UserAccount", foreign_keys=[user_account_id], lazy="raise_on_sql")
     
-    def __repr__(self):
-        return f"<UserSession(id={self.id}, user_account_id={self.user_account_id}, is_active={self.is_active})>"
+    _repr_fields = ("id", "user_account_id", "is_active")
@@ -2,9 +2,10 @@
 Bet Pydantic schemas
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import Optional
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 import enum
 
 # Enums para Pydantic schemas (valores válidos de la base de datos)
@@ -28,16 +29,39 @@ class BetBase(BaseModel):
     odds: float
     potential_payout: float
 
-class BetCreate(BetBase):
+_CENT = Decimal("0.01")
+
+
+def _quantize_cents(v: Optional[Decimal]) -> Optional[Decimal]:
+    """Redondea montos y líneas a centavos (ROUND_HALF_UP, igual que to_fixed_point): el descuento
+    de créditos, bet_amount_cents y el movimiento del ledger usan exactamente el mismo valor"""
+    return None if v is None else v.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+# Entrada como Decimal: Pydantic convierte una sola vez y el servicio los usa tal cual.
+# Montos y líneas se redondean a centavos al validar (el cliente envía stake / n apuestas);
+# las cuotas no tienen límite (las calculadas en el cliente traen más de 6 decimales) y
+# to_fixed_point las redondea a diezmilésimas al escribir. Las respuestas siguen en float.
+class BetCreate(BaseModel):
+    game_id: int
+    bet_type: BetType
+    bet_amount: Decimal
+    odds: Decimal
+    potential_payout: Decimal  # Informativo: la base de datos lo recalcula (columna generada)
     selected_team_id: Optional[int] = None
-    spread_value: Optional[float] = None
-    over_under_value: Optional[float] = None
+    spread_value: Optional[Decimal] = None
+    over_under_value: Optional[Decimal] = None
     is_over: Optional[bool] = None
 
+    _quantize_money = field_validator(
+        'bet_amount', 'potential_payout', 'spread_value', 'over_under_value'
+    )(_quantize_cents)
+
 class BetUpdate(BaseModel):
-    bet_amount: Optional[float] = None
-    odds: Optional[float] = None
-    potential_payout: Optional[float] = None
+    bet_amount: Optional[Decimal] = None
+    odds: Optional[Decimal] = None
+    potential_payout: Optional[Decimal] = None
+
+    _quantize_money = field_validator('bet_amount', 'potential_payout')(_quantize_cents)
 
 class BetResponse(BetBase):
     id: int
@@ -39,3 +39,5 @@ class MatchResponse(BaseModel):
     
     class Config:
         from_attributes = True
+        frozen = True
+        extra = 'ignore'
@@ -30,4 +30,6 @@ class PermissionResponse(PermissionBase):
     
     class Config:
         from_attributes = True
+        frozen = True
+        extra = 'ignore'
 
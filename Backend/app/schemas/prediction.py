@@ -2,8 +2,8 @@
 Prediction Pydantic schemas
 """
 
-from pydantic import BaseModel, field_serializer
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, TypeAdapter
+from typing import Optional, Dict, Any, List
 from datetime import datetime, date
 
 class PredictionRequest(BaseModel):
@@ -59,53 +59,15 @@ class PredictionResponse(BaseModel):
     inference_latency_ms: Optional[int] = None  # latencia aislada del modelo
     model_signals: Optional[Dict[str, float]] = None  # rf_proba, poisson_*, etc.
 
-    @field_serializer('game_date')
-    def serialize_game_date(self, value: Optional[datetime]) -> Optional[str]:
-        """Serializar game_date a ISO format string"""
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value.isoformat()
-        if isinstance(value, date):
-            return value.isoformat()
-        return str(value)
-    
-    @field_serializer('prediction_timestamp')
-    def serialize_prediction_timestamp(self, value: datetime) -> str:
-        """Serializar prediction_timestamp a ISO format string"""
-        if isinstance(value, datetime):
-            return value.isoformat()
-        return str(value)
-    
+    # Sin serializers/overrides propios: el núcleo de pydantic (Rust) emite datetime/date en ISO 8601
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-            date: lambda v: v.isoformat() if v else None
-        }
-    
-    def model_dump(self, **kwargs):
-        """Override model_dump to ensure datetime serialization"""
-        # Usar mode='json' para serializar correctamente los datetime
-        mode = kwargs.pop('mode', 'python')
-        if mode == 'json' or 'json' in str(kwargs.get('mode', '')):
-            kwargs['mode'] = 'json'
-        data = super().model_dump(**kwargs)
-        # Convertir datetime a ISO format strings si aún no están convertidos
-        if 'game_date' in data and data['game_date']:
-            if isinstance(data['game_date'], (datetime, date)):
-                data['game_date'] = data['game_date'].isoformat()
-        if 'prediction_timestamp' in data and data['prediction_timestamp']:
-            if isinstance(data['prediction_timestamp'], datetime):
-                data['prediction_timestamp'] = data['prediction_timestamp'].isoformat()
-        return data
-    
-    def dict(self, **kwargs):
-        """Override dict for backward compatibility"""
-        # Por defecto, usar mode='json' para serializar datetime correctamente
-        if 'mode' not in kwargs:
-            kwargs['mode'] = 'json'
-        return self.model_dump(**kwargs)
+        frozen = True
+        extra = 'ignore'
+
+
+# Serializador precompilado para listas (GET /predictions/upcoming): dump_json en una sola pasada
+PREDICTION_LIST_ADAPTER = TypeAdapter(List[PredictionResponse])
 
 class ModelStatusResponse(BaseModel):
     model_loaded: bool
@@ -2,9 +2,21 @@
 Provider schemas for API requests/responses
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, Dict, Any, Union
 from datetime import datetime
+import json
+
+
+def _parse_json_field(v):
+    """Acepta JSON como string (compatibilidad) o dict; se guarda como JSONB.
+    Un string que no es JSON válido se rechaza (422) en vez de guardarse vacío"""
+    if isinstance(v, str):
+        try:
+            return json.loads(v)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e.msg}") from e
+    return v
 
 class ProviderBase(BaseModel):
     code: str = Field(..., description="Unique provider code (e.g., 'espn', 'odds_api')")
@@ -12,10 +24,10 @@ class ProviderBase(BaseModel):
     timeout_seconds: int = Field(30, ge=1, le=300, description="Request timeout in seconds")
     max_retries: int = Field(3, ge=0, le=10, description="Maximum retry attempts")
     circuit_breaker_threshold: int = Field(5, ge=1, le=50, description="Circuit breaker failure threshold")
-    provider_metadata: Optional[str] = Field(None, description="JSON metadata for provider configuration")
+    provider_metadata: Optional[Union[Dict[str, Any], str]] = Field(None, description="JSON metadata for provider configuration")
 
 class ProviderCreate(ProviderBase):
-    pass
+    _parse_provider_metadata = field_validator('provider_metadata', mode='before')(_parse_json_field)
 
 class ProviderUpdate(BaseModel):
     name: Optional[str] = None
@@ -23,7 +35,9 @@ class ProviderUpdate(BaseModel):
     timeout_seconds: Optional[int] = Field(None, ge=1, le=300)
     max_retries: Optional[int] = Field(None, ge=0, le=10)
     circuit_breaker_threshold: Optional[int] = Field(None, ge=1, le=50)
-    provider_metadata: Optional[str] = None
+    provider_metadata: Optional[Union[Dict[str, Any], str]] = None
+
+    _parse_provider_metadata = field_validator('provider_metadata', mode='before')(_parse_json_field)
 
 class ProviderResponse(ProviderBase):
     id: int
@@ -38,16 +52,18 @@ class ProviderEndpointBase(BaseModel):
     purpose: str = Field(..., description="Endpoint purpose (e.g., 'odds', 'stats', 'predictions')")
     url: str = Field(..., description="Endpoint URL")
     method: str = Field("GET", description="HTTP method")
-    headers: Optional[str] = Field(None, description="JSON headers")
+    headers: Optional[Union[Dict[str, Any], str]] = Field(None, description="JSON headers")
 
 class ProviderEndpointCreate(ProviderEndpointBase):
-    pass
+    _parse_headers = field_validator('headers', mode='before')(_parse_json_field)
 
 class ProviderEndpointUpdate(BaseModel):
     purpose: Optional[str] = None
     url: Optional[str] = None
     method: Optional[str] = None
-    headers: Optional[str] = None
+    headers: Optional[Union[Dict[str, Any], str]] = None
+
+    _parse_headers = field_validator('headers', mode='before')(_parse_json_field)
 
 class ProviderEndpointResponse(BaseModel):
     id: int
@@ -55,7 +71,7 @@ class ProviderEndpointResponse(BaseModel):
     purpose: str
     url: str
     method: str
-    headers: Optional[str] = None
+    headers: Optional[Union[Dict[str, Any], str]] = None
     created_at: datetime
 
     class Config:
@@ -28,6 +28,8 @@ class RoleResponse(RoleBase):
     
     class Config:
         from_attributes = True
+        frozen = True
+        extra = 'ignore'
 
 class RoleWithPermissions(RoleResponse):
     """Role with permissions"""
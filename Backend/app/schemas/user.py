@@ -1,10 +1,15 @@
 """
 User Pydantic schemas
+
+EmailStr (email-validator) solo en los schemas de entrada, donde el email viene
+del cliente. Los de respuesta (UserResponse, AdminUserListItem) usan `str`: el
+email sale de app.user_accounts y ya se validó al guardarse.
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter, field_serializer
 from typing import Optional, List
 from datetime import datetime, date
+from decimal import Decimal
 
 class UserBase(BaseModel):
     username: str
@@ -22,7 +27,7 @@ class UserUpdate(BaseModel):
     username: Optional[str] = None
     email: Optional[EmailStr] = None
     rol: Optional[str] = None
-    credits: Optional[float] = None
+    credits: Optional[Decimal] = None
     is_active: Optional[bool] = None  # For admin to activate/deactivate users
     # Client profile fields
     first_name: Optional[str] = None
@@ -34,7 +39,8 @@ class UserUpdate(BaseModel):
 
 class UserResponse(UserBase):
     id: int
-    credits: Optional[float] = None  # Opcional, solo para clientes
+    email: str  # Viene de la base de datos: sin revalidar con email-validator
+    credits: Optional[Decimal] = None  # Opcional, solo para clientes (NUMERIC(12,2))
     is_active: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -45,8 +51,36 @@ class UserResponse(UserBase):
     phone: Optional[str] = None
     date_of_birth: Optional[date] = None
     
-    class Config:
-        from_attributes = True
+    @field_serializer('credits')
+    def serialize_credits(self, value: Optional[Decimal]) -> Optional[float]:
+        """El frontend espera un número JSON, no un string decimal"""
+        return None if value is None else float(value)
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+    
+    @classmethod
+    def from_orm_fast(cls, user_account, rol: str, client=None, with_profile: bool = True) -> "UserResponse":
+        """Construye la respuesta desde filas ya validadas por la base de datos, sin revalidar (model_construct)"""
+        profile = client if with_profile else None
+        return cls.model_construct(
+            id=user_account.id,
+            username=user_account.username,
+            email=user_account.email,
+            rol=rol,
+            credits=client.credits if client else None,
+            is_active=user_account.is_active,
+            created_at=user_account.created_at,
+            updated_at=user_account.updated_at,
+            avatar_url=user_account.avatar_url,
+            first_name=profile.first_name if profile else None,
+            last_name=profile.last_name if profile else None,
+            phone=profile.phone if profile else None,
+            date_of_birth=profile.date_of_birth if profile else None,
+        )
+
+
+# Serializador precompilado para GET /users/ (lista de respuestas construidas con from_orm_fast)
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
 
 class UserCreateWithRol(UserBase):
     """Schema para crear usuario con rol explícito (solo admin)"""
@@ -62,6 +96,8 @@ class Token(BaseModel):
     access_token: str
     token_type: str
     rol: str  # Rol del usuario (client, administrator, operator)
+    
+    model_config = ConfigDict(frozen=True)
 
 class SendVerificationCodeRequest(BaseModel):
     """Request to send verification code"""
@@ -119,6 +155,8 @@ class TwoFactorStatusResponse(BaseModel):
     is_enabled: bool
     is_setup: bool  # True if secret exists but not enabled yet
     
+    model_config = ConfigDict(frozen=True)
+    
 # ============================================================================
 # Avatar Schemas
 # ============================================================================
@@ -127,6 +165,8 @@ class AvatarUploadResponse(BaseModel):
     """Response after avatar upload"""
     avatar_url: str
     message: str
+    
+    model_config = ConfigDict(frozen=True)
 
 # ============================================================================
 # Session Schemas
@@ -142,8 +182,7 @@ class UserSessionResponse(BaseModel):
     created_at: datetime
     is_current: bool = False  # True if this is the current session
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class SessionRevokeRequest(BaseModel):
     """Request to revoke a session"""
@@ -157,7 +196,7 @@ class AdminUserListItem(BaseModel):
     """User information for admin panel list - excludes current admin"""
     id: int
     username: str
-    email: EmailStr
+    email: str
     is_active: bool
     role_code: Optional[str] = None  # Código del rol principal (admin, operator, client)
     role_name: Optional[str] = None  # Nombre del rol principal
@@ -169,8 +208,7 @@ class AdminUserListItem(BaseModel):
     last_name: Optional[str] = None
     avatar_url: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class DeactivateAccountRequest(BaseModel):
     """Request to deactivate account - requires 2FA code"""
@@ -1,15 +1,102 @@
 """
 Audit Service for RF-09 (RF-10 en doc.txt)
 Registra todas las acciones relevantes del sistema
+
+Los registros independientes (commit=True) se encolan y un flusher en segundo
+plano los inserta por lotes (hasta AUDIT_BATCH_SIZE filas o AUDIT_FLUSH_INTERVAL
+segundos por INSERT + COMMIT). Con commit=False o sync=True se escribe en la
+sesión del llamador, dentro de su transacción.
 """
 
+import asyncio
+import logging
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-import json
 
+from app.core.database import AsyncAppSessionLocal
 from app.models import AuditLog
 
+logger = logging.getLogger(__name__)
+
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL = 0.2  # segundos
+AUDIT_QUEUE_MAXSIZE = 10_000  # Si se llena, log_action escribe en línea
+
+_audit_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+
+async def _insert_batch(batch: List[Dict[str, Any]]) -> None:
+    try:
+        async with AsyncAppSessionLocal() as db:
+            await db.execute(insert(AuditLog), batch)  # executemany: INSERT multi-VALUES
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Error flushing {len(batch)} audit log rows: {e}", exc_info=True)
+
+
+# Centinela de parada: el flusher termina e inserta su lote en curso (cancel() lo perdería)
+_STOP = object()
+
+
+async def _audit_flusher() -> None:
+    """Drena la cola: espera el primer registro y junta hasta AUDIT_BATCH_SIZE o AUDIT_FLUSH_INTERVAL"""
+    loop = asyncio.get_running_loop()
+    stop = False
+    while not stop:
+        item = await _audit_queue.get()
+        if item is _STOP:
+            return
+        batch = [item]
+        deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+        while len(batch) < AUDIT_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_audit_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stop = True
+                break
+            batch.append(item)
+        await _insert_batch(batch)
+
+
+def _in_event_loop() -> bool:
+    """asyncio.Queue no es thread-safe: solo se encola desde el hilo del event loop"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+async def start_audit_flusher() -> None:
+    global _audit_queue, _flusher_task
+    if _flusher_task is None:
+        _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+        _flusher_task = asyncio.create_task(_audit_flusher())
+
+
+async def stop_audit_flusher() -> None:
+    """Detiene el flusher e inserta lo que quede en la cola"""
+    global _audit_queue, _flusher_task
+    if _flusher_task is None:
+        return
+    await _audit_queue.put(_STOP)
+    await _flusher_task
+    _flusher_task = None
+    pending = []
+    while not _audit_queue.empty():
+        pending.append(_audit_queue.get_nowait())
+    _audit_queue = None
+    for start in range(0, len(pending), AUDIT_BATCH_SIZE):
+        await _insert_batch(pending[start:start + AUDIT_BATCH_SIZE])
+
 
 class AuditService:
     """Service for comprehensive audit logging"""
@@ -17,7 +104,7 @@ class AuditService:
     def __init__(self, db: Session):
         self.db = db
     
-    async def log_action(
+    def log_action(
         self,
         action: str,
         actor_user_id: Optional[int] = None,
@@ -27,63 +114,120 @@ class AuditService:
         after: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         organization_id: Optional[int] = None,
-        commit: bool = True
-    ) -> AuditLog:
+        commit: bool = True,
+        sync: bool = False,
+        return_instance: bool = False
+    ) -> Optional[AuditLog]:
         """
-        Registra una acción en el log de auditoría
+        Registra una acción en el log de auditoría.
+        commit=True (sin sync) la encola para el flusher y retorna None;
+        commit=False / sync=True la escribe en la sesión actual con un INSERT de Core
+        (sin unit of work) y retorna None, o el AuditLog si return_instance=True.
         """
-        audit_log = AuditLog(
+        values = dict(
             organization_id=organization_id,
             actor_user_id=actor_user_id,
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
-            before=json.dumps(before) if before else None,
-            after=json.dumps(after) if after else None,
-            audit_metadata=json.dumps(metadata) if metadata else None,
-            created_at=datetime.utcnow()
+            before=before or None,
+            after=after or None,
+            audit_metadata=metadata or None,
         )
         
-        self.db.add(audit_log)
+        if commit and not sync and not return_instance and _audit_queue is not None and _in_event_loop():
+            try:
+                # Encolado: se fija la hora del evento (el INSERT llega hasta AUDIT_FLUSH_INTERVAL después)
+                _audit_queue.put_nowait({**values, "created_at": datetime.utcnow()})
+                return None
+            except asyncio.QueueFull:
+                pass  # Cola saturada: escritura en línea
+        
+        # En línea: created_at lo pone Postgres (server_default now())
+        if return_instance:
+            audit_log = AuditLog(**values)  # eager_defaults: id/created_at vuelven por RETURNING
+            self.db.add(audit_log)
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+            return audit_log
         
+        # Core INSERT en la transacción de la sesión: sin identity map ni historial de atributos
+        self.db.execute(insert(AuditLog.__table__).values(**values))
         if commit:
             self.db.commit()
-            self.db.refresh(audit_log)
-        else:
-            self.db.flush()
+        return None
+    
+    def _filtered_select(
+        self,
+        actor_user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[int] = None,
+        metadata_contains: Optional[Dict[str, Any]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ):
+        """select() con los filtros dados (`is not None`: 0 es un valor válido).
+        Con date_from/date_to el planner poda las particiones mensuales fuera del rango"""
+        stmt = select(AuditLog)
         
-        return audit_log
+        if actor_user_id is not None:
+            stmt = stmt.where(AuditLog.actor_user_id == actor_user_id)
+        if action is not None:
+            stmt = stmt.where(AuditLog.action == action)
+        if resource_type is not None:
+            stmt = stmt.where(AuditLog.resource_type == resource_type)
+        if resource_id is not None:
+            stmt = stmt.where(AuditLog.resource_id == resource_id)
+        if metadata_contains:
+            # Filtrado en el servidor con @> (usa el índice GIN)
+            stmt = stmt.where(AuditLog.audit_metadata.contains(metadata_contains))
+        if date_from is not None:
+            stmt = stmt.where(AuditLog.created_at >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(AuditLog.created_at <= date_to)
+        return stmt
     
-    async def get_audit_logs(
+    def get_audit_logs(
         self,
         actor_user_id: Optional[int] = None,
         action: Optional[str] = None,
         resource_type: Optional[str] = None,
         resource_id: Optional[int] = None,
+        metadata_contains: Optional[Dict[str, Any]] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         limit: int = 100,
-        offset: int = 0
-    ) -> List[AuditLog]:
-        """Obtiene logs de auditoría con filtros"""
-        query = self.db.query(AuditLog)
-        
-        if actor_user_id:
-            query = query.filter(AuditLog.actor_user_id == actor_user_id)
-        if action:
-            query = query.filter(AuditLog.action == action)
-        if resource_type:
-            query = query.filter(AuditLog.resource_type == resource_type)
-        if resource_id:
-            query = query.filter(AuditLog.resource_id == resource_id)
-        if date_from:
-            query = query.filter(AuditLog.created_at >= date_from)
-        if date_to:
-            query = query.filter(AuditLog.created_at <= date_to)
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> Tuple[List[AuditLog], Optional[Tuple[datetime, int]]]:
+        """
+        Obtiene logs de auditoría con filtros, más recientes primero.
+        Con cursor = (created_at, id) del último log de la página anterior pagina por keyset
+        (coste constante); offset queda para la paginación por número de página.
+        Retorna (logs, next_cursor); next_cursor es None en la última página.
+        """
+        stmt = self._filtered_select(
+            actor_user_id, action, resource_type, resource_id, metadata_contains, date_from, date_to
+        )
+        if cursor is not None:
+            stmt = stmt.where(tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*cursor))
+        elif offset:
+            stmt = stmt.offset(offset)
         
-        return query.order_by(AuditLog.created_at.desc()).offset(offset).limit(limit).all()
+        stmt = stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit)
+        logs = self.db.scalars(stmt).all()
+        next_cursor = (logs[-1].created_at, logs[-1].id) if len(logs) == limit else None
+        return logs, next_cursor
+    
+    def count_audit_logs(self, **filters) -> int:
+        """Total de logs que cumplen los filtros (mismos argumentos que get_audit_logs)"""
+        stmt = self._filtered_select(**filters).with_only_columns(func.count()).select_from(AuditLog).order_by(None)
+        return self.db.scalar(stmt)
     
-    async def get_audit_log_by_id(self, audit_log_id: int) -> Optional[AuditLog]:
+    def get_audit_log_by_id(self, audit_log_id: int) -> Optional[AuditLog]:
         """Obtiene un log de auditoría por ID"""
         return self.db.query(AuditLog).filter(AuditLog.id == audit_log_id).first()
 
@@ -2,13 +2,22 @@
 Authentication service
 """
 
+import base64
+import calendar
+import hashlib
+import hmac
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import orjson
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from fastapi.security import APIKeyHeader
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.config import settings
 from app.core.database import get_sys_db
@@ -17,11 +26,91 @@ from app.models.user_role import UserRole
 from app.models.permission import Permission
 # from app.services.user_service import UserService  # Removed to avoid circular import
 
-# Password hashing - usando argon2 que es más seguro y sin límite de longitud
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Password hashing - usando argon2 que es más seguro y sin límite de longitud.
+# Parámetros explícitos (mínimo OWASP: 19 MiB, t=2, p=1) en lugar de los defaults de passlib
+# (64 MiB, t=3, p=4); los hashes con otros parámetros se rehashean al iniciar sesión.
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
-# JWT token scheme
-security = HTTPBearer()
+# Firma HS* precalculada: cabecera en base64url y clave HMAC se construyen una sola vez.
+# Otros algoritmos (RS*/ES*) siguen pasando por jwt.encode.
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+_JWT_DIGEST = _HMAC_DIGESTS.get(settings.ALGORITHM)
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": settings.ALGORITHM, "typ": "JWT"}))
+_JWT_KEY = settings.SECRET_KEY.encode()
+
+# Tokens ya verificados: token -> (username, exp). El TTL corto acota cuánto tarda en
+# dejar de aceptarse un token; exp se vuelve a comprobar en cada acierto.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_token_cache_lock = threading.Lock()
+
+# Filas de user_accounts por username (valores de columnas, no instancias compartidas entre
+# sesiones). Las escrituras vía ORM en user_accounts y en las tablas de perfil (cuyos triggers
+# actualizan display_name, avatar_url, user_type) invalidan al instante.
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=15)
+_user_cache_lock = threading.Lock()
+_USER_COLUMNS = tuple(attr.key for attr in inspect(UserAccount).column_attrs)
+
+def _load_user_account(db: Session, username: str) -> Optional[UserAccount]:
+    """UserAccount por username: desde la caché (sin SELECT) o desde la base de datos"""
+    with _user_cache_lock:
+        values = _USER_CACHE.get(username)
+    if values is not None:
+        # Instancia persistente "limpia" en la sesión actual, como si viniera de un SELECT
+        user_account = UserAccount(**values)
+        make_transient_to_detached(user_account)
+        return db.merge(user_account, load=False)
+    
+    user_account = db.query(UserAccount).filter(UserAccount.username == username).first()
+    if user_account is not None:
+        values = {key: getattr(user_account, key) for key in _USER_COLUMNS}
+        with _user_cache_lock:
+            _USER_CACHE[username] = values
+    return user_account
+
+def invalidate_cached_user(username: Optional[str] = None) -> None:
+    """Invalida un usuario de la caché (o todos si username es None)"""
+    with _user_cache_lock:
+        if username is None:
+            _USER_CACHE.clear()
+        else:
+            _USER_CACHE.pop(username, None)
+
+@event.listens_for(UserAccount, "after_update")
+@event.listens_for(UserAccount, "after_delete")
+def _invalidate_user_account(mapper, connection, target) -> None:
+    # Username anterior (si cambió) y actual
+    for username in (*inspect(target).attrs.username.history.deleted, target.username):
+        invalidate_cached_user(username)
+
+def invalidate_cached_user_id(user_id: int) -> None:
+    """Invalida por id (escrituras en tablas de perfil, que solo conocen user_account_id)"""
+    with _user_cache_lock:
+        for username in [name for name, values in _USER_CACHE.items() if values["id"] == user_id]:
+            _USER_CACHE.pop(username, None)
+
+# Los triggers copian avatar_url/display_name/user_type del perfil a user_accounts:
+# cualquier escritura en clients/administrators/operators invalida al usuario
+@event.listens_for(Client, "after_insert")
+@event.listens_for(Client, "after_update")
+@event.listens_for(Client, "after_delete")
+@event.listens_for(Administrator, "after_insert")
+@event.listens_for(Administrator, "after_update")
+@event.listens_for(Administrator, "after_delete")
+@event.listens_for(Operator, "after_insert")
+@event.listens_for(Operator, "after_update")
+@event.listens_for(Operator, "after_delete")
+def _invalidate_user_profile(mapper, connection, target) -> None:
+    invalidate_cached_user_id(target.user_account_id)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -40,22 +129,51 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    if _JWT_DIGEST is None:
+        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    
+    # Mismo token que jwt.encode (exp como timestamp entero), sin reconstruir cabecera ni firmante
+    to_encode["exp"] = calendar.timegm(expire.utctimetuple())
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(to_encode))
+    signature = hmac.new(_JWT_KEY, signing_input, _JWT_DIGEST).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
-def verify_token(token: str) -> Optional[str]:
-    """Verify JWT token and return username"""
+def _decode_token(token: str) -> Optional[Tuple[str, float]]:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
     except JWTError:
         return None
+    username = payload.get("sub")
+    if username is None:
+        return None
+    return username, float(payload.get("exp", float("inf")))
+
+def verify_token(token: str) -> Optional[str]:
+    """Verify JWT token and return username (decodificación cacheada por token)"""
+    with _token_cache_lock:
+        cached = _TOKEN_CACHE.get(token)
+    if cached is None:
+        cached = _decode_token(token)
+        if cached is None:
+            return None  # Los tokens inválidos no se cachean
+        with _token_cache_lock:
+            _TOKEN_CACHE[token] = cached
+    username, exp = cached
+    if exp < time.time():
+        return None
+    return username
+
+# Esquema de seguridad para OpenAPI (/docs: botón Authorize con "Bearer <token>"). APIKeyHeader
+# solo lee la cabecera tal cual, sin parsearla; el prefijo se comprueba abajo
+bearer_header = APIKeyHeader(
+    name="Authorization",
+    scheme_name="BearerAuth",
+    description='Cabecera "Authorization: Bearer <token>"',
+    auto_error=False,
+)
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    authorization: Optional[str] = Depends(bearer_header),
     db: Session = Depends(get_sys_db)
 ) -> UserAccount:
     """Get current authenticated user (UserAccount)"""
@@ -65,16 +183,20 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # Cabecera "Authorization: Bearer <token>" leída directamente (esquema sin distinguir mayúsculas)
+    if not authorization or authorization[:7].lower() != "bearer ":
+        raise credentials_exception
+    
     try:
-        token = credentials.credentials
+        token = authorization[7:].strip()
         username = verify_token(token)
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
     
-    # Direct database query to avoid circular import
-    user_account = db.query(UserAccount).filter(UserAccount.username == username).first()
+    # Caché TTL por username (evita el SELECT por request); is_active se comprueba igualmente
+    user_account = _load_user_account(db, username)
     if user_account is None:
         raise credentials_exception
     
@@ -92,6 +214,11 @@ async def authenticate_user(db: Session, username: str, password: str) -> Option
     user_account = db.query(UserAccount).filter(UserAccount.username == username).first()
     if not user_account:
         return None
-    if not verify_password(password, user_account.hashed_password):
+    valid, new_hash = pwd_context.verify_and_update(password, user_account.hashed_password)
+    if not valid:
         return None
+    if new_hash:
+        # Hash con parámetros antiguos: se actualiza ahora que tenemos la contraseña en claro
+        user_account.hashed_password = new_hash
+        db.commit()
     return user_account
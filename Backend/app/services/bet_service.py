@@ -2,169 +2,287 @@
 Bet service for business logic - Using normalized ESPN schema
 """
 
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional, Dict, Any
+from sqlalchemy import bindparam, case, func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, make_transient_to_detached, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from decimal import Decimal
-from app.models.espn_bet import Bet as EspnBet, BetSelection, BetResult
+from app.models.espn_bet import Bet as EspnBet, BetSelection, BetResult, from_fixed_point, to_fixed_point
 from app.models.transaction import Transaction, TransactionType
+from app.models.user_accounts import UserAccount, Client
 from app.schemas.bet import BetCreate, BetUpdate
-from app.services.user_service import UserService
-from app.core.database import get_espn_db
+from app.services.user_service import credit_delta_statement
+from app.core import catalog_cache
+from app.services.cache_service import cache_service
+
+# Estadísticas por usuario (Redis si USE_REDIS, si no en memoria); se invalidan al
+# colocar, modificar, cancelar o liquidar apuestas del usuario
+BET_STATS_TTL_SECONDS = 3600
+
+def _bet_stats_key(user_id: int) -> str:
+    return f"bet_stats:{user_id}"
+
+def invalidate_betting_stats(user_id: int) -> None:
+    cache_service.delete(_bet_stats_key(user_id))
+
+# SELECT de get_bet_by_id construido una vez (parámetros bet_id / user_id): ni el árbol
+# de expresiones ni la clave de la caché de compilación se recalculan en cada llamada
+_BET_BY_ID_STMT = None
+
+def _bet_by_id_statement():
+    global _BET_BY_ID_STMT
+    if _BET_BY_ID_STMT is None:
+        # raiseload("*"): igual que get_user_bets, un lazy load no declarado falla en vez de emitir SELECT
+        _BET_BY_ID_STMT = select(EspnBet).options(
+            joinedload(EspnBet.selection),
+            joinedload(EspnBet.result),
+            raiseload("*")
+        ).where(
+            EspnBet.id == bindparam("bet_id"),
+            EspnBet.user_id == bindparam("user_id")
+        )
+    return _BET_BY_ID_STMT
+
+def _team_name_matches(team_name: str, game_team: Optional[str]) -> bool:
+    """Mismo criterio que la búsqueda por nombre: exacto, sin mayúsculas o parcial"""
+    if not game_team:
+        return False
+    return team_name == game_team or game_team.lower() in team_name.lower()
 
 class BetService:
-    def __init__(self, sys_db: Session, espn_db: Session = None):
+    """Apuestas sobre AsyncSession (asyncpg): cada acceso a la base de datos se espera con
+    await y libera el event loop mientras tanto"""
+    
+    def __init__(self, sys_db: AsyncSession, espn_db: AsyncSession = None):
         self.sys_db = sys_db  # Para transacciones y usuarios
         self.espn_db = espn_db or sys_db  # Para apuestas (esquema espn)
-        self.user_service = UserService(sys_db)
+        # Misma sesión para ambos esquemas: una sola transacción (y un solo commit) por operación
+        self._single_session = self.espn_db is self.sys_db
+    
+    async def _apply_credit_delta(self, user_id: int, delta, commit: bool = True) -> Optional[Decimal]:
+        """UserService.apply_credit_delta sobre sys_db: saldo resultante o None (no cliente / saldo insuficiente)"""
+        balance_after = (await self.sys_db.execute(credit_delta_statement(user_id, delta))).scalar_one_or_none()
+        if balance_after is None:
+            return None
+        if commit:
+            await self.sys_db.commit()
+        return balance_after
+    
+    async def _insert_bet(
+        self,
+        bet_values: Dict[str, Any],
+        selection_values: Optional[Dict[str, Any]] = None,
+        transaction_values: Optional[Dict[str, Any]] = None
+    ) -> EspnBet:
+        """Inserta la apuesta, su selección y (opcional) el movimiento de créditos en una sola
+        sentencia con CTEs de escritura:
+        WITH b AS (INSERT INTO bets ... RETURNING *), s AS (INSERT ... SELECT b.id FROM b), ...
+        SELECT b.* FROM b. La apuesta vuelve completa (id, potential_payout, timestamps, nombres
+        del trigger) y queda en la sesión igual que tras un SELECT; sin unit of work ni flush."""
+        bet_cte = insert(EspnBet).values(**bet_values).returning(*EspnBet.__table__.c).cte("b")
+        columns = [aliased(EspnBet, bet_cte)]
+        ctes = []
+        
+        selection = None
+        if selection_values:
+            selection = BetSelection.for_bet_type(bet_values["bet_type_code"], **selection_values)
+            base_table = BetSelection.__table__
+            selection_cte = insert(base_table).from_select(
+                ["bet_id", "bet_type_code"], select(bet_cte.c.id, bet_cte.c.bet_type_code)
+            ).returning(base_table.c.id, base_table.c.created_at).cte("s")
+            # Tabla hija: bet_id + columnas propias del tipo (p.ej. selected_team_id -> team_id)
+            mapper = type(selection).__mapper__
+            child_columns = {mapper.columns[key]: value for key, value in selection_values.items()}
+            ctes.append(insert(mapper.local_table).from_select(
+                ["bet_id", *(column.name for column in child_columns)],
+                select(bet_cte.c.id, *(literal(value, column.type) for column, value in child_columns.items()))
+            ).cte("sc"))
+            columns += [selection_cte.c.id, selection_cte.c.created_at]
+        
+        if transaction_values:
+            # Solo con una sesión compartida: app.transactions vive en la misma base de datos
+            tx_table = Transaction.__table__
+            tx_values = {**transaction_values, "transaction_type": TransactionType(transaction_values["transaction_type"]).value}
+            ctes.append(insert(tx_table).from_select(
+                ["bet_id", *tx_values],
+                select(bet_cte.c.id, *(literal(value, tx_table.c[key].type) for key, value in tx_values.items()))
+            ).cte("t"))
+        
+        # raiseload: sin JOIN eager a selection/result (el snapshot de la sentencia aún no ve las filas nuevas)
+        stmt = select(*columns).options(raiseload("*")).add_cte(*ctes)
+        row = (await self.espn_db.execute(stmt)).one()
+        db_bet = row[0]
+        
+        if selection is not None:
+            # La selección ya está en la base de datos: se adjunta a la sesión como persistente
+            selection.id, selection.created_at = row[1], row[2]
+            selection.bet_id = db_bet.id
+            make_transient_to_detached(selection)
+            self.espn_db.add(selection)
+        # Relaciones ya conocidas: sin refresh ni lazy load al construir la respuesta
+        set_committed_value(db_bet, "selection", selection)
+        set_committed_value(db_bet, "result", None)
+        return db_bet
+    
+    async def _get_user_credits(self, user_id: int) -> Optional[Decimal]:
+        return await self.sys_db.scalar(select(Client.credits).where(Client.user_account_id == user_id))
     
     async def get_user_bets(
         self,
         user_id: int,
         status: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, int]] = None
     ) -> List[EspnBet]:
-        """Get user's bets with filters"""
-        query = self.espn_db.query(EspnBet).options(
+        """Get user's bets with filters, más recientes primero.
+        Con cursor = (placed_at, id) de la última apuesta de la página anterior pagina por
+        keyset (coste constante); offset queda para la paginación por número de página."""
+        # raiseload("*"): cualquier lazy load accidental en el listado falla en vez de generar N+1
+        stmt = select(EspnBet).options(
             joinedload(EspnBet.selection),
-            joinedload(EspnBet.result)
-        ).filter(EspnBet.user_id == user_id)
+            joinedload(EspnBet.result),
+            raiseload("*")
+        ).where(EspnBet.user_id == user_id)
         
         if status:
-            query = query.filter(EspnBet.bet_status_code == status)
+            stmt = stmt.where(EspnBet.bet_status_code == status)
+        
+        if cursor is not None:
+            stmt = stmt.where(tuple_(EspnBet.placed_at, EspnBet.id) < tuple_(*cursor))
+        elif offset:
+            stmt = stmt.offset(offset)
         
-        return query.order_by(EspnBet.placed_at.desc()).offset(offset).limit(limit).all()
+        stmt = stmt.order_by(EspnBet.placed_at.desc(), EspnBet.id.desc()).limit(limit)
+        return list((await self.espn_db.scalars(stmt)).unique().all())
     
     async def get_bet_by_id(self, bet_id: int, user_id: int) -> Optional[EspnBet]:
         """Get bet by ID (user must own the bet)"""
-        return self.espn_db.query(EspnBet).options(
-            joinedload(EspnBet.selection),
-            joinedload(EspnBet.result)
-        ).filter(
-            EspnBet.id == bet_id,
-            EspnBet.user_id == user_id
-        ).first()
+        result = await self.espn_db.scalars(_bet_by_id_statement(), {"bet_id": bet_id, "user_id": user_id})
+        return result.unique().first()
     
     async def place_bet(self, bet: BetCreate, user_id: int) -> EspnBet:
         """Place a new bet using normalized schema"""
         # Validar que user_account existe explícitamente antes de insertar en espn.bets
-        user_account = await self.user_service.get_user_by_id(user_id)
-        if not user_account:
+        user_account_id = await self.sys_db.scalar(select(UserAccount.id).where(UserAccount.id == user_id))
+        if user_account_id is None:
             raise ValueError(f"User {user_id} not found in user_accounts")
         
-        # Deduct credits from user first
-        success = await self.user_service.deduct_credits(user_id, bet.bet_amount)
-        if not success:
+        # Deduct credits from user first (UPDATE ... RETURNING: saldo resultante sin SELECT extra).
+        # Con una sola sesión el descuento, la apuesta y el movimiento van en la misma transacción
+        balance_after = await self._apply_credit_delta(
+            user_id, -bet.bet_amount, commit=not self._single_session
+        )
+        if balance_after is None:
             raise ValueError("Insufficient credits")
         
-        credits_deducted = True
+        credits_deducted = not self._single_session  # En una sola transacción el rollback deshace el descuento
         try:
             # Convert bet_type enum to string code
             bet_type_code = bet.bet_type.value if hasattr(bet.bet_type, 'value') else str(bet.bet_type)
+            if catalog_cache.is_loaded() and catalog_cache.get_bet_type(bet_type_code) is None:
+                raise ValueError(f"Unknown bet type: {bet_type_code}")
             
             # Map selected_team_id if it's provided
-            # The frontend now sends real team_id from the teams table (thanks to MatchService update)
-            # We just need to validate that the team exists and belongs to the game
+            # The frontend sends real team_id from the teams table; games.home_team_id/away_team_id
+            # (resueltos por trigger desde los nombres) bastan para validarlo: dos comparaciones enteras
+            from app.models.game import Game
+            game = (await self.espn_db.execute(
+                select(Game.home_team, Game.away_team, Game.fecha, Game.home_team_id, Game.away_team_id)
+                .where(Game.game_id == bet.game_id)
+            )).first()
+            
             mapped_team_id = None
             if bet.selected_team_id:
                 # Validate that the game exists
-                from app.models.game import Game
-                from app.models.team import Team
-                game = self.espn_db.query(Game).filter(Game.game_id == bet.game_id).first()
                 if not game:
                     raise ValueError(f"Game {bet.game_id} not found")
                 
-                # Validate that the team exists in the teams table
-                team = self.espn_db.query(Team).filter(Team.team_id == bet.selected_team_id).first()
-                if not team:
-                    raise ValueError(
-                        f"Team with team_id {bet.selected_team_id} not found in teams table. "
-                        f"Please ensure the team exists in the database."
-                    )
-                
-                # Verify that the team is part of this game
-                # Find both teams in the teams table to verify
-                home_team_db = None
-                away_team_db = None
-                
-                if game.home_team:
-                    home_team_db = self.espn_db.query(Team).filter(Team.name == game.home_team).first()
-                    if not home_team_db:
-                        home_team_db = self.espn_db.query(Team).filter(Team.name.ilike(game.home_team)).first()
-                    if not home_team_db:
-                        home_team_db = self.espn_db.query(Team).filter(
-                            Team.name.ilike(f"%{game.home_team}%")
-                        ).first()
-                
-                if game.away_team:
-                    away_team_db = self.espn_db.query(Team).filter(Team.name == game.away_team).first()
-                    if not away_team_db:
-                        away_team_db = self.espn_db.query(Team).filter(Team.name.ilike(game.away_team)).first()
-                    if not away_team_db:
-                        away_team_db = self.espn_db.query(Team).filter(
-                            Team.name.ilike(f"%{game.away_team}%")
-                        ).first()
-                
-                # Check if the selected team is one of the game's teams
-                if (home_team_db and bet.selected_team_id == home_team_db.team_id) or \
-                   (away_team_db and bet.selected_team_id == away_team_db.team_id):
-                    mapped_team_id = bet.selected_team_id
-                else:
-                    raise ValueError(
-                        f"Team {bet.selected_team_id} ({team.name}) is not part of game {bet.game_id}. "
-                        f"Game has home_team='{game.home_team}' and away_team='{game.away_team}'."
-                    )
+                if bet.selected_team_id not in (game.home_team_id, game.away_team_id):
+                    # Sin coincidencia por id: nombre del equipo para el mensaje de error o, si el
+                    # trigger no resolvió algún id del partido (NULL), para comparar por nombre
+                    from app.models.team import Team
+                    team_name = await self.espn_db.scalar(select(Team.name).where(Team.team_id == bet.selected_team_id))
+                    if team_name is None:
+                        raise ValueError(
+                            f"Team with team_id {bet.selected_team_id} not found in teams table. "
+                            f"Please ensure the team exists in the database."
+                        )
+                    if not (game.home_team_id is None and _team_name_matches(team_name, game.home_team)) and \
+                       not (game.away_team_id is None and _team_name_matches(team_name, game.away_team)):
+                        raise ValueError(
+                            f"Team {bet.selected_team_id} ({team_name}) is not part of game {bet.game_id}. "
+                            f"Game has home_team='{game.home_team}' and away_team='{game.away_team}'."
+                        )
+                mapped_team_id = bet.selected_team_id
             
-            # Create bet record in espn schema
-            db_bet = EspnBet(
-                user_id=user_id,
-                game_id=bet.game_id,
-                bet_type_code=bet_type_code,
-                bet_status_code='pending',
-                bet_amount=Decimal(str(bet.bet_amount)),
-                odds_value=Decimal(str(bet.odds)),
-                potential_payout=Decimal(str(bet.potential_payout)),
-                odds_id=None  # Puede ser None si no hay referencia a game_odds
-            )
-            self.espn_db.add(db_bet)
-            self.espn_db.flush()  # Para obtener el ID
-            
-            # Create bet selection if needed
-            if mapped_team_id or bet.spread_value or bet.over_under_value is not None:
-                bet_selection = BetSelection(
-                    bet_id=db_bet.id,
-                    selected_team_id=mapped_team_id,
-                    spread_value=Decimal(str(bet.spread_value)) if bet.spread_value else None,
-                    over_under_value=Decimal(str(bet.over_under_value)) if bet.over_under_value else None,
-                    is_over=bet.is_over
-                )
-                self.espn_db.add(bet_selection)
-            
-            self.espn_db.commit()
-            self.espn_db.refresh(db_bet)
+            # Create bet selection if needed (tabla hija según el tipo de apuesta)
+            selection_values = None
+            if bet_type_code == 'moneyline' and mapped_team_id:
+                selection_values = {"selected_team_id": mapped_team_id}
+            elif bet_type_code == 'spread' and mapped_team_id and bet.spread_value is not None:
+                selection_values = {
+                    "selected_team_id": mapped_team_id,
+                    "spread_value": bet.spread_value,
+                }
+            elif bet_type_code == 'over_under' and bet.over_under_value is not None:
+                # bet_selections_total.is_over es NOT NULL: sin él la línea se perdería en silencio
+                if bet.is_over is None:
+                    raise ValueError("is_over is required for over_under bets")
+                selection_values = {
+                    "over_under_value": bet.over_under_value,
+                    "is_over": bet.is_over,
+                }
             
             # Create transaction record in app schema
-            user_credits = await self.user_service.get_user_credits(user_id)
-            transaction = Transaction(
+            transaction_values = dict(
                 user_id=user_id,
-                bet_id=db_bet.id,
                 transaction_type=TransactionType.BET_PLACED,
                 amount=-bet.bet_amount,
-                balance_before=(user_credits or 0) + bet.bet_amount,
-                balance_after=user_credits or 0,
+                balance_before=balance_after + bet.bet_amount,
+                balance_after=balance_after,
                 description=f"Bet placed: {bet_type_code} for ${bet.bet_amount}"
             )
-            self.sys_db.add(transaction)
-            self.sys_db.commit()
+            
+            # Apuesta + selección (+ movimiento si ambos esquemas comparten sesión) en un solo viaje
+            db_bet = await self._insert_bet(
+                dict(
+                    user_id=user_id,
+                    game_id=bet.game_id,
+                    bet_type_code=bet_type_code,
+                    bet_status_code='pending',
+                    bet_amount_cents=to_fixed_point(bet.bet_amount, 100),
+                    odds_value_e4=to_fixed_point(bet.odds, 10_000),
+                    # potential_payout es columna generada (monto * cuota); el valor del cliente se ignora
+                    odds_id=None,  # Puede ser None si no hay referencia a game_odds
+                    # Snapshots del juego para el historial (bet_type_name/bet_status_name los llena el trigger)
+                    home_team_snapshot=game.home_team if game else None,
+                    away_team_snapshot=game.away_team if game else None,
+                    game_date_snapshot=game.fecha if game else None
+                ),
+                selection_values,
+                transaction_values if self._single_session else None
+            )
+            
+            if not self._single_session:
+                await self.espn_db.commit()
+                await Transaction.bulk_insert_async(self.sys_db, [dict(bet_id=db_bet.id, **transaction_values)])
+            await self.sys_db.commit()
             
             credits_deducted = False  # Mark as successful, no need to refund
+            invalidate_betting_stats(user_id)
             return db_bet
         except Exception as e:
+            if self._single_session:
+                await self.sys_db.rollback()
             # If anything fails after deducting credits, refund them
-            if credits_deducted:
+            elif credits_deducted:
                 try:
-                    await self.user_service.add_credits(user_id, bet.bet_amount)
+                    await self.sys_db.rollback()
+                    await self._apply_credit_delta(user_id, bet.bet_amount)
                 except Exception as refund_error:
                     # Log the refund error but don't mask the original error
                     import logging
@@ -180,63 +298,69 @@ class BetService:
         
         update_data = bet_update.dict(exclude_unset=True)
         if 'bet_amount' in update_data:
-            db_bet.bet_amount = Decimal(str(update_data['bet_amount']))
+            db_bet.bet_amount = update_data['bet_amount']
         if 'odds' in update_data:
-            db_bet.odds_value = Decimal(str(update_data['odds']))
-        if 'potential_payout' in update_data:
-            db_bet.potential_payout = Decimal(str(update_data['potential_payout']))
+            db_bet.odds_value = update_data['odds']
+        # potential_payout se recalcula en la base de datos (columna generada)
         
-        self.espn_db.commit()
-        self.espn_db.refresh(db_bet)
+        await self.espn_db.commit()  # potential_payout y updated_at vuelven por RETURNING (eager_defaults)
+        invalidate_betting_stats(user_id)
         return db_bet
     
+    async def _claim_pending_bet(self, bet_id: int, new_status: str, *returning, user_id: Optional[int] = None):
+        """UPDATE bets SET estado, settled_at WHERE id AND (user_id) AND pendiente RETURNING ...
+        Propiedad y estado se comprueban en el mismo UPDATE: sin SELECT previo, y de dos
+        operaciones concurrentes solo una encuentra la fila 'pending'. None si no hay fila"""
+        conditions = [EspnBet.id == bet_id, EspnBet.bet_status_code == 'pending']
+        if user_id is not None:
+            conditions.append(EspnBet.user_id == user_id)
+        stmt = update(EspnBet).where(*conditions).values(
+            bet_status_code=new_status,
+            settled_at=func.now()  # SET settled_at = now() (reloj del servidor, timestamptz)
+        ).returning(*returning)
+        return (await self.espn_db.execute(stmt)).first()
+    
     async def cancel_bet(self, bet_id: int, user_id: int) -> bool:
         """Cancel a pending bet"""
-        db_bet = await self.get_bet_by_id(bet_id, user_id)
-        if not db_bet or db_bet.bet_status_code != 'pending':
+        claimed = await self._claim_pending_bet(bet_id, 'cancelled', EspnBet.bet_amount_cents, user_id=user_id)
+        if claimed is None:
             return False
         
-        # Get current credits before refund
-        user_credits_before = await self.user_service.get_user_credits(user_id) or 0
-        
-        # Refund credits first
-        bet_amount = float(db_bet.bet_amount)
+        # Refund credits (con una sola sesión: mismo commit que el cambio de estado)
+        refund = from_fixed_point(claimed.bet_amount_cents, 100)
         credits_refunded = False
         try:
-            success = await self.user_service.add_credits(user_id, bet_amount)
-            if not success:
+            user_credits_after = await self._apply_credit_delta(user_id, refund, commit=not self._single_session)
+            if user_credits_after is None:
                 raise ValueError("Failed to refund credits - user is not a client")
             
-            credits_refunded = True
-            
-            # Get credits after refund
-            user_credits_after = await self.user_service.get_user_credits(user_id) or 0
-            
-            # Update bet status
-            db_bet.bet_status_code = 'cancelled'
-            db_bet.settled_at = datetime.utcnow()
-            self.espn_db.commit()
+            if not self._single_session:
+                credits_refunded = True
+                await self.espn_db.commit()
             
             # Create refund transaction (using ADMIN_ADJUSTMENT for refunds since there's no specific refund type)
-            transaction = Transaction(
+            await Transaction.bulk_insert_async(self.sys_db, [dict(
                 user_id=user_id,
                 bet_id=bet_id,
                 transaction_type=TransactionType.ADMIN_ADJUSTMENT,  # Using admin adjustment for refunds
-                amount=bet_amount,
-                balance_before=user_credits_before,
+                amount=refund,
+                balance_before=user_credits_after - refund,
                 balance_after=user_credits_after,
-                description=f"Bet cancelled: refund of ${bet_amount}"
-            )
-            self.sys_db.add(transaction)
-            self.sys_db.commit()
+                description=f"Bet cancelled: refund of ${refund}"
+            )])
+            await self.sys_db.commit()
             
             credits_refunded = False  # Mark as successful, no need to reverse
+            invalidate_betting_stats(user_id)
             return True
         except Exception as e:
+            # El UPDATE de la apuesta sin confirmar se deshace (la apuesta sigue pendiente)
+            await self.espn_db.rollback()
             # If anything fails after refunding credits, try to reverse the refund
             if credits_refunded:
                 try:
-                    await self.user_service.deduct_credits(user_id, bet_amount)
+                    await self.sys_db.rollback()
+                    await self._apply_credit_delta(user_id, -refund)
                 except Exception as reverse_error:
                     # Log the reverse error but don't mask the original error
                     import logging
@@ -246,81 +370,73 @@ class BetService:
     
     async def settle_bet(self, bet_id: int, won: bool) -> bool:
         """Settle a bet (admin function)"""
-        db_bet = self.espn_db.query(EspnBet).filter(EspnBet.id == bet_id).first()
-        if not db_bet or db_bet.bet_status_code != 'pending':
+        claimed = await self._claim_pending_bet(
+            bet_id, 'won' if won else 'lost', EspnBet.user_id, EspnBet.potential_payout_cents
+        )
+        if claimed is None:
             return False
-        
-        # Get current credits before settlement
-        user_credits_before = await self.user_service.get_user_credits(db_bet.user_id) or 0
+        user_id = claimed.user_id
         
         credits_added = False
-        payout = 0.0
+        payout = Decimal(0)
         try:
             if won:
-                db_bet.bet_status_code = 'won'
-                payout = float(db_bet.potential_payout)
-                # Add winnings to user account
-                success = await self.user_service.add_credits(db_bet.user_id, payout)
-                if not success:
+                payout = from_fixed_point(claimed.potential_payout_cents, 100)
+                # Add winnings to user account (el saldo anterior se deriva del devuelto por RETURNING)
+                user_credits_after = await self._apply_credit_delta(
+                    user_id, payout, commit=not self._single_session
+                )
+                if user_credits_after is None:
                     raise ValueError("Failed to add winnings - user is not a client")
                 
-                credits_added = True
-                
-                # Get credits after adding winnings
-                user_credits_after = await self.user_service.get_user_credits(db_bet.user_id) or 0
-                
-                # Create or update bet result
-                bet_result = self.espn_db.query(BetResult).filter(BetResult.bet_id == bet_id).first()
-                if not bet_result:
-                    bet_result = BetResult(bet_id=bet_id, actual_payout=Decimal(str(payout)))
-                    self.espn_db.add(bet_result)
-                else:
-                    bet_result.actual_payout = Decimal(str(payout))
+                credits_added = not self._single_session
                 
-                # Create transaction for bet won
-                transaction = Transaction(
-                    user_id=db_bet.user_id,
+                # Create transaction for bet won (se inserta tras el commit de espn_db)
+                transaction_values = dict(
+                    user_id=user_id,
                     bet_id=bet_id,
                     transaction_type=TransactionType.BET_WON,
                     amount=payout,
-                    balance_before=user_credits_before,
+                    balance_before=user_credits_after - payout,
                     balance_after=user_credits_after,
                     description=f"Bet won: payout of ${payout}"
                 )
-                self.sys_db.add(transaction)
             else:
-                db_bet.bet_status_code = 'lost'
-                # Create or update bet result
-                bet_result = self.espn_db.query(BetResult).filter(BetResult.bet_id == bet_id).first()
-                if not bet_result:
-                    bet_result = BetResult(bet_id=bet_id, actual_payout=Decimal('0'))
-                    self.espn_db.add(bet_result)
-                else:
-                    bet_result.actual_payout = Decimal('0')
-                
                 # Create transaction for bet lost (no credits added, just record)
-                transaction = Transaction(
-                    user_id=db_bet.user_id,
+                user_credits_before = await self._get_user_credits(user_id) or 0
+                transaction_values = dict(
+                    user_id=user_id,
                     bet_id=bet_id,
                     transaction_type=TransactionType.BET_LOST,
-                    amount=0.0,
+                    amount=Decimal(0),
                     balance_before=user_credits_before,
                     balance_after=user_credits_before,  # No change in balance
                     description=f"Bet lost: no payout"
                 )
-                self.sys_db.add(transaction)
             
-            db_bet.settled_at = datetime.utcnow()
-            self.espn_db.commit()
-            self.sys_db.commit()
+            # Create or update bet result (upsert por bet_id: sin leer antes el resultado)
+            payout_cents = claimed.potential_payout_cents if won else 0
+            result_stmt = pg_insert(BetResult).values(bet_id=bet_id, actual_payout_cents=payout_cents)
+            await self.espn_db.execute(result_stmt.on_conflict_do_update(
+                index_elements=[BetResult.bet_id],
+                set_={"actual_payout_cents": result_stmt.excluded.actual_payout_cents}
+            ))
+            
+            if not self._single_session:
+                await self.espn_db.commit()
+            await Transaction.bulk_insert_async(self.sys_db, [transaction_values])
+            await self.sys_db.commit()
             
             credits_added = False  # Mark as successful, no need to reverse
+            invalidate_betting_stats(user_id)
             return True
         except Exception as e:
+            await self.espn_db.rollback()
             # If anything fails after adding credits (for won bets), try to reverse the credit addition
             if credits_added and won:
                 try:
-                    await self.user_service.deduct_credits(db_bet.user_id, payout)
+                    await self.sys_db.rollback()
+                    await self._apply_credit_delta(user_id, -payout)
                 except Exception as reverse_error:
                     # Log the reverse error but don't mask the original error
                     import logging
@@ -329,24 +445,34 @@ class BetService:
             raise
     
     async def get_user_betting_stats(self, user_id: int) -> Dict[str, Any]:
-        """Get user's betting statistics"""
-        # Cargar las apuestas con la relación result para evitar N+1 queries
-        bets = self.espn_db.query(EspnBet).options(
-            joinedload(EspnBet.result)
-        ).filter(EspnBet.user_id == user_id).all()
+        """Get user's betting statistics (cacheadas BET_STATS_TTL_SECONDS)"""
+        async def fetch_stats() -> Dict[str, Any]:
+            return await self._compute_betting_stats(user_id)
         
-        total_bets = len(bets)
-        won_bets = len([b for b in bets if b.bet_status_code == 'won'])
-        lost_bets = len([b for b in bets if b.bet_status_code == 'lost'])
-        pending_bets = len([b for b in bets if b.bet_status_code == 'pending'])
-        
-        total_wagered = sum(float(b.bet_amount) for b in bets)
-        
-        # Get actual payouts from BetResult
-        total_won = 0.0
-        for bet in bets:
-            if bet.bet_status_code == 'won' and bet.result:
-                total_won += float(bet.result.actual_payout or 0)
+        return await cache_service.get_or_set(
+            key=_bet_stats_key(user_id),
+            fetch_func=fetch_stats,
+            ttl_seconds=BET_STATS_TTL_SECONDS,
+            stale_ttl_seconds=BET_STATS_TTL_SECONDS,  # Sin periodo stale: la invalidación es explícita
+            allow_stale=False
+        )
+    
+    async def _compute_betting_stats(self, user_id: int) -> Dict[str, Any]:
+        """Agregados de las apuestas del usuario (una consulta)"""
+        # Agregación en la base de datos: una sola fila en lugar de recorrer todas las apuestas.
+        # Se suman los centavos (enteros) y se convierten una vez al final
+        won = EspnBet.bet_status_code == 'won'
+        stmt = select(
+            func.count(EspnBet.id),
+            func.coalesce(func.sum(case((won, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((EspnBet.bet_status_code == 'lost', 1), else_=0)), 0),
+            func.coalesce(func.sum(case((EspnBet.bet_status_code == 'pending', 1), else_=0)), 0),
+            func.coalesce(func.sum(EspnBet.bet_amount_cents), 0),
+            func.coalesce(func.sum(case((won, BetResult.actual_payout_cents), else_=0)), 0),
+        ).outerjoin(BetResult, BetResult.bet_id == EspnBet.id).where(EspnBet.user_id == user_id)
+        total_bets, won_bets, lost_bets, pending_bets, wagered_cents, won_cents = (await self.espn_db.execute(stmt)).one()
+        total_wagered = int(wagered_cents) / 100
+        total_won = int(won_cents) / 100
         
         win_rate = (won_bets / (won_bets + lost_bets)) * 100 if (won_bets + lost_bets) > 0 else 0
         roi = ((total_won - total_wagered) / total_wagered) * 100 if total_wagered > 0 else 0
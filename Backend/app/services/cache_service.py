@@ -9,12 +9,6 @@ from datetime import datetime, timedelta
 import json
 import hashlib
 
-try:
-    import redis as _redis_lib
-    _REDIS_AVAILABLE = True
-except ImportError:
-    _REDIS_AVAILABLE = False
-
 
 class CacheService:
     """
@@ -36,7 +30,8 @@ class CacheService:
 
         try:
             from app.core.config import settings
-            if getattr(settings, 'USE_REDIS', False) and _REDIS_AVAILABLE:
+            from app.core.redis import REDIS_AVAILABLE
+            if getattr(settings, 'USE_REDIS', False) and REDIS_AVAILABLE:
                 self._init_redis(settings)
         except Exception:
             pass
@@ -47,17 +42,8 @@ class CacheService:
 
     def _init_redis(self, settings) -> None:
         try:
-            redis_url = getattr(settings, 'REDIS_URL', None)
-            if redis_url:
-                self._redis_client = _redis_lib.from_url(redis_url, decode_responses=False)
-            else:
-                self._redis_client = _redis_lib.Redis(
-                    host=getattr(settings, 'REDIS_HOST', 'localhost'),
-                    port=getattr(settings, 'REDIS_PORT', 6379),
-                    password=getattr(settings, 'REDIS_PASSWORD', None),
-                    db=getattr(settings, 'REDIS_DB', 0),
-                    decode_responses=False,
-                )
+            from app.core.redis import get_redis
+            self._redis_client = get_redis()
             self._redis_client.ping()
             self._connected = True
             print("Redis cache connected successfully")
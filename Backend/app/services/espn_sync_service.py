@@ -58,15 +58,16 @@ def _upsert_odd(
         return
     db.execute(
         text("""
-            INSERT INTO espn.game_odds (game_id, odds_type, odds_value, line_value, provider, snapshot_time)
-            VALUES (:game_id, :odds_type, :odds_value, :line_value, :provider, NOW())
+            INSERT INTO espn.game_odds (game_id, odds_type, odds_value_e4, line_value_cents, provider, snapshot_time)
+            VALUES (:game_id, :odds_type, :odds_value_e4, :line_value_cents, :provider, NOW())
             ON CONFLICT DO NOTHING
         """),
         {
             "game_id": game_id,
             "odds_type": odds_type,
-            "odds_value": odds_value,
-            "line_value": line_value,
+            # Punto fijo: cuotas en diezmilésimas, líneas en centésimas
+            "odds_value_e4": round(odds_value * 10_000) if odds_value is not None else None,
+            "line_value_cents": round(line_value * 100) if line_value is not None else None,
             "provider": provider,
         },
     )
@@ -133,28 +133,22 @@ def _upsert_game(db: Session, g: dict) -> str:
     - Si existe y el partido está completado → actualiza scores.
     Retorna 'inserted' | 'updated' | 'skipped'.
     """
-    home_win = None
-    if g["completed"] and g["home_score"] > 0:
-        home_win = 1 if g["home_score"] > g["away_score"] else 0
-
+    # home_win / point_diff son columnas generadas (se recalculan al cambiar los scores)
     hs = g["home_score"] if g["completed"] else 0
     as_ = g["away_score"] if g["completed"] else 0
 
     result = db.execute(text("""
         INSERT INTO espn.games
-            (game_id, fecha, home_team, away_team, home_score, away_score, home_win, game_type)
+            (game_id, fecha, home_team, away_team, home_score, away_score, game_type)
         VALUES
-            (:gid, :fecha, :ht, :at, :hs, :as_, :hw, :gt)
+            (:gid, :fecha, :ht, :at, :hs, :as_, :gt)
         ON CONFLICT (game_id) DO UPDATE
             SET home_score = CASE
                     WHEN espn.games.home_score = 0 AND EXCLUDED.home_score > 0
                     THEN EXCLUDED.home_score ELSE espn.games.home_score END,
                 away_score = CASE
                     WHEN espn.games.away_score = 0 AND EXCLUDED.away_score > 0
-                    THEN EXCLUDED.away_score ELSE espn.games.away_score END,
-                home_win = CASE
-                    WHEN espn.games.home_win IS NULL AND EXCLUDED.home_win IS NOT NULL
-                    THEN EXCLUDED.home_win ELSE espn.games.home_win END
+                    THEN EXCLUDED.away_score ELSE espn.games.away_score END
         RETURNING
             (xmax = 0) AS was_inserted,
             home_score,
@@ -166,7 +160,6 @@ def _upsert_game(db: Session, g: dict) -> str:
         "at":   g["away_team"],
         "hs":   hs,
         "as_":  as_,
-        "hw":   home_win,
         "gt":   g["game_type"],
     })
 
@@ -54,7 +54,7 @@ class GameSyncService:
             # Invalidar cachés para que /matches/upcoming y
             # /predict/upcoming recalculen con los partidos nuevos.
             cache_service.invalidate_pattern("matches")
-            cache_service.invalidate_pattern("predictions_upcoming")
+            cache_service.invalidate_pattern("predictions_upcoming:v2")
 
         return {
             "dates_queried": [dates[0], dates[-1]],
@@ -6,6 +6,9 @@ Handles request deduplication using request_key
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta, timezone
+import hashlib
+import re
+import uuid
 from app.models import IdempotencyKey, Request
 from app.core.config import settings
 
@@ -20,6 +23,23 @@ def _utcnow() -> datetime:
     """
     return datetime.now(timezone.utc)
 
+
+_UUID_RE = re.compile(
+    r"^\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\}?$"
+)
+
+
+def request_key_uuid(request_key: str) -> uuid.UUID:
+    """Normaliza X-Idempotency-Key a UUID (columna de 16 bytes).
+
+    Si el cliente ya envía un UUID se usa tal cual; si no, se usa md5(key)
+    como UUID, igual que hace la migración SQL con `md5(request_key)::uuid`.
+    """
+    if _UUID_RE.match(request_key):
+        return uuid.UUID(request_key)
+    return uuid.UUID(hashlib.md5(request_key.encode("utf-8")).hexdigest())
+
+
 class IdempotencyService:
     def __init__(self, db: Session):
         self.db = db
@@ -31,7 +51,7 @@ class IdempotencyService:
         Retorna None si no existe, o el resultado previo si existe
         """
         idempotency_key = self.db.query(IdempotencyKey).filter(
-            IdempotencyKey.request_key == request_key
+            IdempotencyKey.request_key == request_key_uuid(request_key)
         ).first()
         
         if not idempotency_key:
@@ -46,19 +66,11 @@ class IdempotencyService:
         
         # Si existe y no expiró, retornar respuesta previa
         if idempotency_key.response_data:
-            import json
-            try:
-                return {
-                    "exists": True,
-                    "response": json.loads(idempotency_key.response_data),
-                    "created_at": idempotency_key.created_at
-                }
-            except:
-                return {
-                    "exists": True,
-                    "response": idempotency_key.response_data,
-                    "created_at": idempotency_key.created_at
-                }
+            return {
+                "exists": True,
+                "response": idempotency_key.response_data,  # JSONB: ya llega como dict
+                "created_at": idempotency_key.created_at
+            }
         
         return {"exists": True, "created_at": idempotency_key.created_at}
     
@@ -73,7 +85,7 @@ class IdempotencyService:
         """
         # Verificar si ya existe
         existing = self.db.query(IdempotencyKey).filter(
-            IdempotencyKey.request_key == request_key
+            IdempotencyKey.request_key == request_key_uuid(request_key)
         ).first()
         
         if existing:
@@ -93,7 +105,7 @@ class IdempotencyService:
         
         # Crear nueva clave
         idempotency_key = IdempotencyKey(
-            request_key=request_key,
+            request_key=request_key_uuid(request_key),
             request_id=request_id,
             expires_at=expires_at
         )
@@ -113,18 +125,14 @@ class IdempotencyService:
         Almacenar respuesta para una clave de idempotencia
         """
         idempotency_key = self.db.query(IdempotencyKey).filter(
-            IdempotencyKey.request_key == request_key
+            IdempotencyKey.request_key == request_key_uuid(request_key)
         ).first()
         
         if not idempotency_key:
             return False
         
-        # Serializar respuesta a JSON
-        import json
-        try:
-            idempotency_key.response_data = json.dumps(response_data, default=str)
-        except:
-            idempotency_key.response_data = str(response_data)
+        # JSONB: el dict se pasa tal cual; lo serializa el json_serializer del engine
+        idempotency_key.response_data = response_data
         
         self.db.commit()
         return True
@@ -134,7 +142,7 @@ class IdempotencyService:
         Eliminar una clave de idempotencia
         """
         idempotency_key = self.db.query(IdempotencyKey).filter(
-            IdempotencyKey.request_key == request_key
+            IdempotencyKey.request_key == request_key_uuid(request_key)
         ).first()
         
         if not idempotency_key:
@@ -353,8 +353,8 @@ class LiveFeatureExtractor:
         try:
             row = self.db.execute(text(f"""
                 SELECT
-                    AVG(CASE WHEN go.odds_type = 'moneyline_home' THEN go.odds_value END) AS ml_home,
-                    AVG(CASE WHEN go.odds_type = 'moneyline_away' THEN go.odds_value END) AS ml_away
+                    AVG(CASE WHEN go.odds_type = 'moneyline_home' THEN go.odds_value_e4 END) / 10000.0 AS ml_home,
+                    AVG(CASE WHEN go.odds_type = 'moneyline_away' THEN go.odds_value_e4 END) / 10000.0 AS ml_away
                 FROM {self.ESPN_SCHEMA}.game_odds go
                 JOIN {self.ESPN_SCHEMA}.odds_event_game_map m ON go.game_id = m.game_id
                 JOIN {self.ESPN_SCHEMA}.odds o ON o.game_id = m.odds_id
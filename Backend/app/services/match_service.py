@@ -8,10 +8,14 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 from app.models.game import Game
 from app.models.team import Team
+from app.models.espn_bet import GameOdds
 from app.schemas.match import MatchResponse, TeamBase
 from app.services.db_schema_service import DBSchemaService
 
 class MatchService:
+    # Prioridad de providers para odds de referencia
+    ODDS_PROVIDER_PRIORITY = ('draftkings', 'fanduel', 'betmgm', 'betrivers', 'mybookieag')
+    
     def __init__(self, db: Session):
         self.db = db
         self.schema_service = DBSchemaService(db)
@@ -202,6 +206,16 @@ class MatchService:
             result = self.db.execute(text(sql), params)
             rows = result.fetchall()
             
+            # Odds de referencia de todos los partidos en una sola query (LATERAL)
+            latest_odds = {}
+            game_ids = [row._mapping.get('id') for row in rows if row._mapping.get('id')]
+            try:
+                latest_odds = GameOdds.latest_for_games(
+                    self.db, game_ids, ('moneyline_home', 'moneyline_away'), self.ODDS_PROVIDER_PRIORITY
+                )
+            except Exception:
+                self.db.rollback()
+            
             # Convertir resultados a dict y resolver IDs de equipos
             matches = []
             for row in rows:
@@ -229,41 +243,15 @@ class MatchService:
                 away_team_div = away_team_db.division if away_team_db else ''
                 
                 # Construir objeto MatchResponse usando solo columnas que existen
-                # Intentar obtener odds de espn.game_odds para este partido
+                # Odds de espn.game_odds (precargadas para toda la página)
                 game_id_val = match_dict.get('id')
                 home_odds_val = None
                 away_odds_val = None
                 if game_id_val:
-                    try:
-                        # Prioridad de providers para odds de referencia
-                        PROVIDER_PRIORITY = ('draftkings', 'fanduel', 'betmgm', 'betrivers', 'mybookieag')
-                        odds_row = self.db.execute(text("""
-                            SELECT
-                                MAX(CASE WHEN odds_type='moneyline_home' THEN odds_value END)
-                                    FILTER (WHERE provider = (
-                                        SELECT provider FROM espn.game_odds
-                                        WHERE game_id = :gid AND odds_type = 'moneyline_home'
-                                          AND provider = ANY(:priority)
-                                        ORDER BY array_position(:priority, provider)
-                                        LIMIT 1
-                                    )) AS home_odds,
-                                MAX(CASE WHEN odds_type='moneyline_away' THEN odds_value END)
-                                    FILTER (WHERE provider = (
-                                        SELECT provider FROM espn.game_odds
-                                        WHERE game_id = :gid AND odds_type = 'moneyline_away'
-                                          AND provider = ANY(:priority)
-                                        ORDER BY array_position(:priority, provider)
-                                        LIMIT 1
-                                    )) AS away_odds
-                            FROM espn.game_odds
-                            WHERE game_id = :gid
-                              AND odds_type IN ('moneyline_home', 'moneyline_away')
-                        """), {"gid": int(game_id_val), "priority": list(PROVIDER_PRIORITY)}).fetchone()
-                        if odds_row:
-                            home_odds_val = float(odds_row[0]) if odds_row[0] else None
-                            away_odds_val = float(odds_row[1]) if odds_row[1] else None
-                    except Exception:
-                        pass
+                    home_odds = latest_odds.get((int(game_id_val), 'moneyline_home'))
+                    away_odds = latest_odds.get((int(game_id_val), 'moneyline_away'))
+                    home_odds_val = float(home_odds) if home_odds else None
+                    away_odds_val = float(away_odds) if away_odds else None
 
                 match = {
                     "id": match_dict.get('id'),
@@ -360,7 +348,7 @@ class MatchService:
                 'status': None,  # No existe en la estructura real
                 'home_score': self._find_column(['home_score', 'home_pts']),  # Existe
                 'away_score': self._find_column(['away_score', 'away_pts']),  # Existe
-                'winner': None,  # No existe, pero hay 'home_win' (bigint)
+                'winner': None,  # No existe, pero hay 'home_win' (boolean)
                 'home_win': self._find_column(['home_win']),  # Existe en Neon
                 'home_odds': None,  # No existe en games, está en odds
                 'away_odds': None,  # No existe en games, está en odds
@@ -513,7 +501,7 @@ class MatchService:
                 "status": None,  # No existe en la estructura real
                 "home_score": match_dict.get(column_mapping['home_score']) if column_mapping['home_score'] else None,
                 "away_score": match_dict.get(column_mapping['away_score']) if column_mapping['away_score'] else None,
-                "winner_id": None,  # No hay tabla teams, pero hay home_win (bigint)
+                "winner_id": None,  # No hay tabla teams, pero hay home_win (boolean)
                 "home_odds": None,
                 "away_odds": None,
                 "over_under": None,
@@ -6,7 +6,6 @@ Maneja eventos transaccionales usando el patrón outbox
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import json
 
 from app.models import Outbox
 
@@ -29,7 +28,7 @@ class OutboxService:
         """
         outbox_entry = Outbox(
             topic=topic,
-            payload=json.dumps(payload, default=str),
+            payload=payload,  # JSONB: el engine serializa fechas/Decimal con default=str
             created_at=datetime.utcnow(),
             published_at=None  # Se actualiza cuando el worker lo procesa
         )
@@ -386,10 +386,6 @@ class PredictionService:
     ):
         """Guardar predicción en BD con telemetría"""
         try:
-            # Serializar score a JSON - convertir datetime/date a string via default=str
-            import json
-            score_json = json.dumps(prediction_data, default=str)
-            
             # Crear o actualizar predicción
             existing_prediction = self.db.query(Prediction).filter(
                 Prediction.request_id == request_id
@@ -397,7 +393,7 @@ class PredictionService:
             
             if existing_prediction:
                 # Actualizar predicción existente
-                existing_prediction.score = score_json
+                existing_prediction.score = prediction_data
                 existing_prediction.latency_ms = latency_ms
                 existing_prediction.model_version_id = self.model_version_obj.id
             else:
@@ -405,7 +401,7 @@ class PredictionService:
                 prediction = Prediction(
                     request_id=request_id,
                     model_version_id=self.model_version_obj.id,
-                    score=score_json,
+                    score=prediction_data,
                     latency_ms=latency_ms
                 )
                 self.db.add(prediction)
@@ -10,6 +10,7 @@ import asyncio
 import httpx
 
 from app.models import Provider, ProviderEndpoint
+from app.core import catalog_cache
 from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 
 class ProviderOrchestrator:
@@ -50,14 +51,8 @@ class ProviderOrchestrator:
         for attempt in range(max_retries + 1):
             try:
                 async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-                    # Parsear headers si existen
-                    headers = {}
-                    if endpoint.headers:
-                        import json
-                        try:
-                            headers = json.loads(endpoint.headers)
-                        except:
-                            pass
+                    # Headers adicionales (JSONB -> dict)
+                    headers = endpoint.headers if isinstance(endpoint.headers, dict) else {}
                     
                     # Determinar método HTTP
                     method = getattr(endpoint, 'method', 'GET').upper()
@@ -116,11 +111,16 @@ class ProviderOrchestrator:
         """
         Llamar a un proveedor específico por código y propósito
         """
-        # Obtener proveedor
-        provider = self.db.query(Provider).filter(
-            Provider.code == provider_code,
-            Provider.is_active == True
-        ).first()
+        # Obtener proveedor (catálogo en memoria; BD si la caché no está cargada)
+        if catalog_cache.is_loaded():
+            provider = catalog_cache.get_provider(provider_code)
+            if provider is not None and not provider.is_active:
+                provider = None
+        else:
+            provider = self.db.query(Provider).filter(
+                Provider.code == provider_code,
+                Provider.is_active == True
+            ).first()
         
         if not provider:
             raise ValueError(f"Provider '{provider_code}' not found or inactive")
@@ -221,9 +221,12 @@ class ProviderOrchestrator:
     
     def get_provider_status(self, provider_code: str) -> Dict[str, Any]:
         """Obtener estado de un proveedor (circuit breaker, etc.)"""
-        provider = self.db.query(Provider).filter(
-            Provider.code == provider_code
-        ).first()
+        if catalog_cache.is_loaded():
+            provider = catalog_cache.get_provider(provider_code)
+        else:
+            provider = self.db.query(Provider).filter(
+                Provider.code == provider_code
+            ).first()
         
         if not provider:
             return {"error": "Provider not found"}
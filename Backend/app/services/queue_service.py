@@ -44,21 +44,8 @@ class QueueService:
     def _init_redis(self):
         """Initialize Redis connection for RQ"""
         try:
-            redis_url = getattr(settings, 'REDIS_URL', None)
-            redis_host = getattr(settings, 'REDIS_HOST', 'localhost')
-            redis_port = getattr(settings, 'REDIS_PORT', 6379)
-            redis_password = getattr(settings, 'REDIS_PASSWORD', None)
-            redis_db = getattr(settings, 'REDIS_DB', 0)
-            
-            if redis_url:
-                self._redis_conn = Redis.from_url(redis_url)
-            else:
-                self._redis_conn = Redis(
-                    host=redis_host,
-                    port=redis_port,
-                    password=redis_password,
-                    db=redis_db
-                )
+            from app.core.redis import get_redis
+            self._redis_conn = get_redis()
             
             # Test connection
             self._redis_conn.ping()
@@ -25,15 +25,6 @@ class RequestService:
         Crear un nuevo registro de solicitud (ACID transaction)
         Estado inicial: RECEIVED
         """
-        # Serializar metadata a JSON si se proporciona
-        request_metadata = None
-        if metadata:
-            import json
-            try:
-                request_metadata = json.dumps(metadata)
-            except:
-                request_metadata = str(metadata)
-        
         request = Request(
             request_key=request_key,
             user_id=user_id,
@@ -41,7 +32,7 @@ class RequestService:
             organization_id=organization_id,
             market_id=market_id,
             status=RequestStatus.RECEIVED,
-            request_metadata=request_metadata
+            request_metadata=metadata or None
         )
         
         self.db.add(request)
@@ -79,17 +70,8 @@ class RequestService:
             request.error_message = error_message
         
         if metadata:
-            import json
-            try:
-                # Actualizar metadata existente o crear nuevo
-                if request.request_metadata:
-                    existing_metadata = json.loads(request.request_metadata)
-                    existing_metadata.update(metadata)
-                    request.request_metadata = json.dumps(existing_metadata)
-                else:
-                    request.request_metadata = json.dumps(metadata)
-            except:
-                request.request_metadata = str(metadata)
+            # Actualizar metadata existente o crear nuevo (nuevo dict para que JSONB detecte el cambio)
+            request.request_metadata = {**(request.request_metadata or {}), **metadata}
         
         # Si el estado es COMPLETED o FAILED, marcar completed_at
         if status in [RequestStatus.COMPLETED, RequestStatus.FAILED]:
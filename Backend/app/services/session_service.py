@@ -6,6 +6,7 @@ Handles tracking and management of active JWT sessions
 import hashlib
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.user_session import UserSession
 from app.models.user_accounts import UserAccount
@@ -15,9 +16,9 @@ class SessionService:
     def __init__(self, db: Session):
         self.db = db
     
-    def hash_token(self, token: str) -> str:
-        """Hash a JWT token for storage"""
-        return hashlib.sha256(token.encode()).hexdigest()
+    def hash_token(self, token: str) -> bytes:
+        """Hash a JWT token for storage (digest SHA-256 crudo, 32 bytes)"""
+        return hashlib.sha256(token.encode()).digest()
     
     async def create_session(
         self,
@@ -85,25 +86,26 @@ class SessionService:
             existing.expires_at = expires_at
             existing.last_activity = now_utc
             existing.revoked_at = None
-            self.db.commit()
-            self.db.refresh(existing)
+            self.db.commit()  # sin refresh: el login no lee la sesión devuelta
             return existing
 
-        session = UserSession(
-            user_account_id=user_id,
-            token_hash=token_hash,
-            device_info=device_info,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            location=location,
-            is_active=True,
-            expires_at=expires_at,
-            last_activity=now_utc
-        )
-
-        self.db.add(session)
+        # INSERT ... RETURNING en un solo round-trip (sin flush del unit of work ni refresh posterior)
+        session = self.db.scalars(
+            insert(UserSession)
+            .values(
+                user_account_id=user_id,
+                token_hash=token_hash,
+                device_info=device_info,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                location=location,
+                is_active=True,
+                expires_at=expires_at,
+                last_activity=now_utc
+            )
+            .returning(UserSession)
+        ).one()
         self.db.commit()
-        self.db.refresh(session)
 
         return session
     
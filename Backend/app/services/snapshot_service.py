@@ -7,10 +7,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
 
 from app.models import OddsSnapshot, OddsLine
 from app.core.database import espn_engine
+from app.core.bulk import bulk_insert
 from app.services.db_schema_service import DBSchemaService
 
 
@@ -42,16 +42,17 @@ class SnapshotService:
         # Obtener odds desde esquema espn
         odds_data = await self._fetch_odds_from_espn(game_id)
         
-        # Crear odds_lines desde los datos de espn
-        for odds_line_data in odds_data:
-            odds_line = OddsLine(
-                snapshot_id=snapshot.id,
-                provider_id=None,  # Viene de espn, no de provider externo
-                line_code=odds_line_data["line_code"],
-                price=odds_line_data["price"],
-                line_metadata=json.dumps(odds_line_data.get("metadata", {}))
-            )
-            self.db.add(odds_line)
+        # Crear odds_lines desde los datos de espn (COPY para lotes grandes)
+        bulk_insert(self.db, OddsLine, [
+            {
+                "snapshot_id": snapshot.id,
+                "provider_id": None,  # Viene de espn, no de provider externo
+                "line_code": odds_line_data["line_code"],
+                "price": odds_line_data["price"],
+                "line_metadata": odds_line_data.get("metadata", {})
+            }
+            for odds_line_data in odds_data
+        ])
         
         self.db.commit()
         self.db.refresh(snapshot)
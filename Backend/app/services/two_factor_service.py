@@ -9,8 +9,8 @@ import io
 import base64
 import secrets
 import hashlib
-import json
 from typing import Optional, List, Tuple
+from sqlalchemy import select, update, func, any_
 from sqlalchemy.orm import Session
 from app.models.two_factor import UserTwoFactor
 from app.models.user_accounts import UserAccount
@@ -55,25 +55,42 @@ class TwoFactorService:
             codes.append(code)
         return codes
     
-    def hash_backup_code(self, code: str) -> str:
-        """Hash a backup code for storage"""
-        return hashlib.sha256(code.encode()).hexdigest()
+    def hash_backup_code(self, code: str) -> bytes:
+        """Hash a backup code for storage (raw SHA-256 digest, BYTEA)"""
+        return hashlib.sha256(code.encode()).digest()
     
     def verify_totp(self, secret: str, code: str) -> bool:
         """Verify a TOTP code"""
         totp = pyotp.TOTP(secret)
         return totp.verify(code, valid_window=1)  # Allow 1 time step window
     
-    def verify_backup_code(self, hashed_codes: str, code: str) -> bool:
-        """Verify a backup code"""
-        if not hashed_codes:
-            return False
-        try:
-            codes_list = json.loads(hashed_codes)
-            code_hash = self.hash_backup_code(code)
-            return code_hash in codes_list
-        except:
+    def verify_backup_code(self, user_id: int, code: str) -> bool:
+        """Verify a backup code (comparación en la base de datos, sin cargar los hashes)"""
+        code_hash = self.hash_backup_code(code)
+        return self.db.execute(
+            select(1).where(
+                UserTwoFactor.user_account_id == user_id,
+                code_hash == any_(UserTwoFactor.backup_codes),
+            )
+        ).first() is not None
+    
+    def consume_backup_code(self, user_id: int, code: str) -> bool:
+        """Verify and invalidate a backup code in a single UPDATE ... RETURNING"""
+        code_hash = self.hash_backup_code(code)
+        consumed = self.db.execute(
+            update(UserTwoFactor)
+            .where(
+                UserTwoFactor.user_account_id == user_id,
+                code_hash == any_(UserTwoFactor.backup_codes),
+            )
+            .values(backup_codes=func.array_remove(UserTwoFactor.backup_codes, code_hash))
+            .returning(UserTwoFactor.id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if consumed is None:
             return False
+        self.db.commit()
+        return True
     
     async def get_user_2fa(self, user_id: int) -> Optional[UserTwoFactor]:
         """Get 2FA configuration for a user"""
@@ -98,14 +115,14 @@ class TwoFactorService:
         if existing:
             # Update existing record
             existing.secret = secret
-            existing.backup_codes = json.dumps(hashed_codes)
+            existing.backup_codes = hashed_codes
             existing.is_enabled = False
         else:
             # Create new record
             two_factor = UserTwoFactor(
                 user_account_id=user_id,
                 secret=secret,
-                backup_codes=json.dumps(hashed_codes),
+                backup_codes=hashed_codes,
                 is_enabled=False
             )
             self.db.add(two_factor)
@@ -130,7 +147,7 @@ class TwoFactorService:
         # Verify the code
         if not self.verify_totp(two_factor.secret, code):
             # Also check backup codes
-            if not self.verify_backup_code(two_factor.backup_codes, code):
+            if not self.verify_backup_code(user_id, code):
                 return False
         
         # Enable 2FA
@@ -163,18 +180,8 @@ class TwoFactorService:
         if self.verify_totp(two_factor.secret, code):
             return True
         
-        # Try backup code
-        if self.verify_backup_code(two_factor.backup_codes, code):
-            # Remove used backup code
-            codes_list = json.loads(two_factor.backup_codes)
-            code_hash = self.hash_backup_code(code)
-            if code_hash in codes_list:
-                codes_list.remove(code_hash)
-                two_factor.backup_codes = json.dumps(codes_list) if codes_list else None
-                self.db.commit()
-            return True
-        
-        return False
+        # Try backup code (se elimina del array al usarse)
+        return self.consume_backup_code(user_id, code)
     
     async def is_2fa_enabled(self, user_id: int) -> bool:
         """Check if 2FA is enabled for a user"""
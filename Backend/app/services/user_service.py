@@ -5,12 +5,23 @@ User service for business logic
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from decimal import Decimal
-from sqlalchemy import func
+from sqlalchemy import func, update
 from app.models.user_accounts import UserAccount, Client, Administrator, Operator
 from app.models.role import Role
 from app.schemas.user import UserCreate, UserUpdate
 from app.services.auth_service import get_password_hash
 
+def credit_delta_statement(user_id: int, delta):
+    """UPDATE ... RETURNING del saldo con la guarda de saldo no negativo (sesión sync o async)"""
+    delta = Decimal(str(delta))
+    return (
+        update(Client)
+        .where(Client.user_account_id == user_id, Client.credits + delta >= 0)
+        .values(credits=Client.credits + delta)
+        .returning(Client.credits)
+        .execution_options(synchronize_session=False)
+    )
+
 class UserService:
     def __init__(self, db: Session):
         self.db = db
@@ -113,8 +124,7 @@ class UserService:
         if user_update.credits is not None:
             client = await self.get_client_by_user_id(user_id)
             if client:
-                from decimal import Decimal
-                client.credits = Decimal(str(user_update.credits))
+                client.credits = user_update.credits  # Decimal (schema) -> NUMERIC(12,2)
 
         # Update Client fields if user is a client
         client = await self.get_client_by_user_id(user_id)
@@ -130,21 +140,27 @@ class UserService:
         self.db.refresh(user_account)
         return user_account
 
+    async def apply_credit_delta(self, user_id: int, delta) -> Optional[Decimal]:
+        """
+        Apply a signed credit delta atomically and return the new balance.
+        Single UPDATE ... RETURNING: no prior SELECT, no lost updates between
+        concurrent requests. Returns None if the user is not a client or the
+        deduction would leave a negative balance (chk_clients_credits_positive
+        remains as a backstop).
+        """
+        balance_after = self.db.execute(credit_delta_statement(user_id, delta)).scalar_one_or_none()
+        if balance_after is None:
+            return None
+        self.db.commit()
+        return balance_after
+
     async def adjust_credits(self, user_id: int, amount: float) -> bool:
         """
         Adjust client credits by a signed amount.
         Positive amount adds credits; negative amount deducts.
         Returns False if user not found or insufficient credits for a deduction.
         """
-        client = await self.get_client_by_user_id(user_id)
-        if not client:
-            return False
-        amount_decimal = Decimal(str(amount))
-        if amount_decimal < 0 and client.credits < -amount_decimal:
-            return False
-        client.credits += amount_decimal
-        self.db.commit()
-        return True
+        return await self.apply_credit_delta(user_id, amount) is not None
 
     async def add_credits(self, user_id: int, amount: float) -> bool:
         """Add credits to client account"""
@@ -18,21 +18,8 @@ class UserTypeService:
         self.db = db
     
     def get_user_current_table(self, user_id: int) -> Optional[UserTableType]:
-        """Determina en qué tabla está actualmente el usuario"""
-        # Verificar en orden: administrator, operator, client
-        admin = self.db.query(Administrator).filter(Administrator.user_account_id == user_id).first()
-        if admin:
-            return 'administrator'
-        
-        operator = self.db.query(Operator).filter(Operator.user_account_id == user_id).first()
-        if operator:
-            return 'operator'
-        
-        client = self.db.query(Client).filter(Client.user_account_id == user_id).first()
-        if client:
-            return 'client'
-        
-        return None
+        """Determina en qué tabla está actualmente el usuario (columna discriminadora, 1 lookup por PK)"""
+        return self.db.query(UserAccount.user_type).filter(UserAccount.id == user_id).scalar()
     
     def get_user_primary_role(self, user_id: int) -> Optional[Role]:
         """
@@ -4,14 +4,13 @@ Procesa eventos del outbox de forma asíncrona
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models import Outbox
-from app.core.database import SysSessionLocal
+from app.core.database import AsyncSysSessionLocal
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,8 +19,10 @@ logger = logging.getLogger(__name__)
 class OutboxWorker:
     """Worker para procesar eventos del outbox con polling adaptivo"""
     
-    def __init__(self, db: Session = None):
-        self.db = db or SysSessionLocal()
+    def __init__(self, session_factory: async_sessionmaker = None):
+        # AsyncSession (asyncpg): el polling no bloquea el event loop.
+        # Una sesión por batch; la conexión vuelve al pool entre polls.
+        self.session_factory = session_factory or AsyncSysSessionLocal
         self.running = False
         # Usar intervalos configurables desde config
         self.poll_interval_with_events = settings.OUTBOX_POLL_INTERVAL  # Default: 5 segundos
@@ -60,63 +61,75 @@ class OutboxWorker:
         if batch_size is None:
             batch_size = settings.OUTBOX_BATCH_SIZE
         
-        try:
-            # Obtener eventos no publicados
-            unpublished = self.db.query(Outbox).filter(
-                Outbox.published_at.is_(None)
-            ).order_by(Outbox.created_at.asc()).limit(batch_size).all()
-            
-            if not unpublished:
-                # No hay eventos, retornar False para usar intervalo largo
+        async with self.session_factory() as db:
+            try:
+                # Reclamar eventos no publicados (SKIP LOCKED: otros workers toman otros)
+                unpublished = await Outbox.claim_batch_async(db, batch_size)
+                
+                if not unpublished:
+                    # No hay eventos, cerrar la transacción y usar intervalo largo
+                    await db.rollback()
+                    return False
+                
+                # Hay eventos, despacharlos en paralelo (handlers I/O-bound) y
+                # marcar como publicados los exitosos en un único commit
+                logger.info(f"Processing {len(unpublished)} unpublished event(s)")
+                
+                results = await asyncio.gather(
+                    *[self.dispatch_event(event) for event in unpublished],
+                    return_exceptions=True
+                )
+                
+                published_ids = []
+                for event, result in zip(unpublished, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error processing event {event.id}: {result}", exc_info=result)
+                        # No marcar como publicado si hay error
+                        continue
+                    published_ids.append(event.id)
+                await Outbox.mark_published_async(db, published_ids)
+                await db.commit()  # Libera los locks de las filas reclamadas
+                
+                # Retornar True para indicar que había eventos (usar intervalo corto)
+                return True
+            except Exception as e:
+                logger.error(f"Error fetching unpublished events: {e}", exc_info=True)
+                await db.rollback()
+                # En caso de error, retornar False para no acelerar el polling
                 return False
-            
-            # Hay eventos, procesarlos
-            logger.info(f"Processing {len(unpublished)} unpublished event(s)")
-            
-            for event in unpublished:
-                try:
-                    await self.process_event(event)
-                except Exception as e:
-                    logger.error(f"Error processing event {event.id}: {e}", exc_info=True)
-                    # No marcar como publicado si hay error
-                    continue
-            
-            # Retornar True para indicar que había eventos (usar intervalo corto)
-            return True
-        except Exception as e:
-            logger.error(f"Error fetching unpublished events: {e}", exc_info=True)
-            self.db.rollback()
-            # En caso de error, retornar False para no acelerar el polling
-            return False
     
-    async def process_event(self, event: Outbox):
+    async def process_event(self, db: AsyncSession, event: Outbox):
         """Procesa un evento individual"""
         try:
-            payload = json.loads(event.payload)
-            topic = event.topic
-            
-            logger.debug(f"Processing event {event.id}: {topic}")
-            
-            # Procesar según el topic
-            if topic == "prediction.completed":
-                await self.handle_prediction_completed(payload)
-            elif topic == "bet.placed":
-                await self.handle_bet_placed(payload)
-            elif topic == "request.completed":
-                await self.handle_request_completed(payload)
-            else:
-                logger.warning(f"Unknown topic: {topic}")
+            await self.dispatch_event(event)
             
             # Marcar como publicado
             event.published_at = datetime.utcnow()
-            self.db.commit()
+            await db.commit()
             logger.debug(f"Event {event.id} marked as published")
             
         except Exception as e:
             logger.error(f"Error processing event {event.id}: {e}", exc_info=True)
-            self.db.rollback()
+            await db.rollback()
             raise
     
+    async def dispatch_event(self, event: Outbox):
+        """Ejecuta el handler del topic del evento (no toca la sesión de BD)"""
+        payload = event.payload
+        topic = event.topic
+        
+        logger.debug(f"Processing event {event.id}: {topic}")
+        
+        # Procesar según el topic
+        if topic == "prediction.completed":
+            await self.handle_prediction_completed(payload)
+        elif topic == "bet.placed":
+            await self.handle_bet_placed(payload)
+        elif topic == "request.completed":
+            await self.handle_request_completed(payload)
+        else:
+            logger.warning(f"Unknown topic: {topic}")
+    
     async def handle_prediction_completed(self, payload: dict):
         """Maneja evento de predicción completada"""
         # Aquí se podría enviar a un webhook, notificación, etc.
@@ -137,20 +150,21 @@ class OutboxWorker:
     
     async def process_single_event(self, event_id: int) -> bool:
         """Procesa un evento específico por ID"""
-        event = self.db.query(Outbox).filter(Outbox.id == event_id).first()
-        if not event:
-            return False
-        
-        if event.published_at:
-            logger.debug(f"Event {event_id} already published")
-            return True
-        
-        try:
-            await self.process_event(event)
-            return True
-        except Exception as e:
-            logger.error(f"Error processing event {event_id}: {e}", exc_info=True)
-            return False
+        async with self.session_factory() as db:
+            event = await db.get(Outbox, event_id)
+            if not event:
+                return False
+            
+            if event.published_at:
+                logger.debug(f"Event {event_id} already published")
+                return True
+            
+            try:
+                await self.process_event(db, event)
+                return True
+            except Exception as e:
+                logger.error(f"Error processing event {event_id}: {e}", exc_info=True)
+                return False
 
 
 # Instancia global del worker (se puede inicializar en background)
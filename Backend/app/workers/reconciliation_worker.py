@@ -55,7 +55,7 @@ class ReconciliationWorker:
             # Query para encontrar bets huérfanas (cross-schema)
             # En Neon, ambos esquemas están en la misma base de datos
             query = text("""
-                SELECT b.id, b.user_id, b.game_id, b.bet_amount, b.placed_at
+                SELECT b.id, b.user_id, b.game_id, b.bet_amount_cents / 100.0 AS bet_amount, b.placed_at
                 FROM espn.bets b
                 LEFT JOIN app.user_accounts u ON u.id = b.user_id
                 WHERE u.id IS NULL
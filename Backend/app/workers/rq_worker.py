@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from rq import Worker, Queue, Connection
+from rq.worker_pool import WorkerPool
 from redis import Redis
 from app.core.config import settings
 import logging
@@ -61,10 +62,17 @@ def main():
         logger.info("🚀 Starting RQ worker...")
         logger.info(f"   Listening to queues: high, default, low")
         
-        # Start worker
-        with Connection(redis_conn):
-            worker = Worker(queues)
-            worker.work()
+        # Start worker(s): con RQ_NUM_WORKERS > 1 se usa WorkerPool para
+        # procesar varios jobs en paralelo (un Worker clásico ejecuta uno a la vez)
+        num_workers = settings.RQ_NUM_WORKERS or os.cpu_count() or 1
+        if num_workers > 1:
+            logger.info(f"   WorkerPool with {num_workers} workers")
+            pool = WorkerPool(queues, connection=redis_conn, num_workers=num_workers)
+            pool.start()
+        else:
+            with Connection(redis_conn):
+                worker = Worker(queues)
+                worker.work()
             
     except Exception as e:
         logger.error(f"❌ Error starting RQ worker: {e}", exc_info=True)
@@ -59,7 +59,7 @@ def bulk_sync(start_date_str, end_date_str):
             
             print("Invalidando cachés para actualizar UI...")
             cache_service.invalidate_pattern("matches")
-            cache_service.invalidate_pattern("predictions_upcoming")
+            cache_service.invalidate_pattern("predictions_upcoming:v2")
             
         print("\n--- RESUMEN DE BULK SYNC ---")
         print(f"Fechas consultadas: {start_date_str} al {end_date_str} ({len(dates)} días)")
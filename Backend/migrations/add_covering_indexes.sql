@@ -0,0 +1,38 @@
+-- ============================================================================
+-- MIGRACIÓN: Índices compuestos / covering para consultas calientes
+-- ============================================================================
+-- - espn.bets: historial por usuario y estado ordenado por placed_at (INCLUDE
+--   para index-only scan del listado)
+-- - espn.game_odds: odds por juego y tipo, más recientes primero
+-- - app.odds_lines: líneas de un snapshot por line_code
+-- - app.transactions: movimientos de un usuario por fecha
+-- - app.outbox: índice parcial solo con eventos pendientes
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'espn' AND tablename = 'bets' AND indexname = 'ix_bets_user_status_placed') THEN
+        CREATE INDEX ix_bets_user_status_placed ON espn.bets(user_id, bet_status_code, placed_at)
+            INCLUDE (bet_amount, potential_payout, game_id);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'espn' AND tablename = 'game_odds' AND indexname = 'ix_game_odds_game_type_time') THEN
+        CREATE INDEX ix_game_odds_game_type_time ON espn.game_odds(game_id, odds_type, snapshot_time);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'app' AND tablename = 'odds_lines' AND indexname = 'ix_odds_lines_snapshot_line') THEN
+        CREATE INDEX ix_odds_lines_snapshot_line ON app.odds_lines(snapshot_id, line_code);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'app' AND tablename = 'transactions' AND indexname = 'ix_tx_user_created') THEN
+        CREATE INDEX ix_tx_user_created ON app.transactions(user_id, created_at);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'app' AND tablename = 'outbox' AND indexname = 'ix_outbox_unpublished') THEN
+        CREATE INDEX ix_outbox_unpublished ON app.outbox(created_at) WHERE published_at IS NULL;
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,30 @@
+-- ============================================================================
+-- MIGRACIÓN: app.audit_log - columnas JSON como JSONB
+-- ============================================================================
+-- before / after / audit_metadata pasan de TEXT (JSON serializado) a JSONB
+-- para poder filtrar en el servidor (->, @>) e indexar con GIN.
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'app' AND table_name = 'audit_log' AND column_name = 'before' AND data_type = 'text') THEN
+        ALTER TABLE app.audit_log ALTER COLUMN before TYPE JSONB USING before::jsonb;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'app' AND table_name = 'audit_log' AND column_name = 'after' AND data_type = 'text') THEN
+        ALTER TABLE app.audit_log ALTER COLUMN after TYPE JSONB USING after::jsonb;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'app' AND table_name = 'audit_log' AND column_name = 'audit_metadata' AND data_type = 'text') THEN
+        ALTER TABLE app.audit_log ALTER COLUMN audit_metadata TYPE JSONB USING audit_metadata::jsonb;
+    END IF;
+
+    -- Índice GIN para consultas tipo audit_metadata @> '{"ip": "..."}'
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'app' AND tablename = 'audit_log' AND indexname = 'ix_audit_meta_gin') THEN
+        CREATE INDEX ix_audit_meta_gin ON app.audit_log USING gin (audit_metadata);
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- ============================================================================
+-- MIGRACIÓN: índices compuestos de app.audit_log para paginación por keyset
+-- ============================================================================
+-- GET /search/audit-logs ordena por (created_at DESC, id DESC) y pagina con
+-- WHERE (created_at, id) < (:ts, :id). Los índices compuestos sirven a los
+-- filtros habituales (actor, recurso) en el mismo orden; los de una sola
+-- columna que quedan cubiertos por su prefijo se eliminan.
+-- ============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_audit_created_id ON app.audit_log(created_at, id);
+CREATE INDEX IF NOT EXISTS ix_audit_actor_created ON app.audit_log(actor_user_id, created_at, id);
+CREATE INDEX IF NOT EXISTS ix_audit_resource_created ON app.audit_log(resource_type, resource_id, created_at);
+
+-- Cubiertos por los compuestos anteriores
+DROP INDEX IF EXISTS app.idx_audit_actor;
+DROP INDEX IF EXISTS app.idx_audit_resource;
+DROP INDEX IF EXISTS app.idx_audit_created_at;
+DROP INDEX IF EXISTS app.ix_app_audit_log_actor_user_id;
+DROP INDEX IF EXISTS app.ix_app_audit_log_created_at;
+
+COMMIT;
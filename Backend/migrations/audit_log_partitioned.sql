@@ -0,0 +1,84 @@
+-- ============================================================================
+-- MIGRACIÓN: particionado mensual de app.audit_log por created_at
+-- ============================================================================
+-- Los listados de auditoría filtran por rango de fechas u ordenan por los más
+-- recientes; con particiones mensuales el planner poda las antiguas y el índice
+-- de la partición caliente se mantiene pequeño.
+--   - PK (id, created_at) (requisito de PostgreSQL)
+--   - una partición por cada mes con datos + 2 meses por delante + DEFAULT
+-- Particiones futuras y retención (AUDIT_LOG_RETENTION_DAYS): app.core.partitions
+-- (startup de la API o cron: python -m app.core.partitions).
+-- ============================================================================
+
+BEGIN;
+
+-- Misma función que partition_time_series_tables.sql (pg_temp no persiste entre sesiones)
+CREATE OR REPLACE FUNCTION pg_temp.partition_by_month(p_schema TEXT, p_table TEXT, p_key TEXT)
+RETURNS VOID AS $$
+DECLARE
+    legacy TEXT := p_table || '_legacy';
+    month_start DATE;
+    last_month DATE;
+BEGIN
+    -- Ya particionada: nada que hacer
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table p
+        JOIN pg_class c ON c.oid = p.partrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = p_schema AND c.relname = p_table
+    ) THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I.%I RENAME TO %I', p_schema, p_table, legacy);
+    EXECUTE format('UPDATE %I.%I SET %I = now() WHERE %I IS NULL', p_schema, legacy, p_key, p_key);
+
+    EXECUTE format(
+        'CREATE TABLE %I.%I (LIKE %I.%I INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (%I)',
+        p_schema, p_table, p_schema, legacy, p_key
+    );
+    EXECUTE format('ALTER TABLE %I.%I ALTER COLUMN %I SET NOT NULL', p_schema, p_table, p_key);
+    EXECUTE format('ALTER TABLE %I.%I ADD PRIMARY KEY (id, %I)', p_schema, p_table, p_key);
+
+    -- Particiones: desde el mes más antiguo con datos hasta 2 meses por delante
+    EXECUTE format('SELECT date_trunc(''month'', COALESCE(min(%I), now()))::date FROM %I.%I', p_key, p_schema, legacy)
+        INTO month_start;
+    last_month := (date_trunc('month', now()) + interval '2 months')::date;
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I.%I PARTITION OF %I.%I FOR VALUES FROM (%L) TO (%L)',
+            p_schema, p_table || '_' || to_char(month_start, 'YYYY_MM'), p_schema, p_table,
+            month_start, (month_start + interval '1 month')::date
+        );
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+    EXECUTE format('CREATE TABLE IF NOT EXISTS %I.%I PARTITION OF %I.%I DEFAULT',
+        p_schema, p_table || '_default', p_schema, p_table);
+
+    EXECUTE format('INSERT INTO %I.%I SELECT * FROM %I.%I', p_schema, p_table, p_schema, legacy);
+
+    -- La secuencia del id pasa a la nueva tabla antes de borrar la antigua
+    EXECUTE format('ALTER SEQUENCE IF EXISTS %I.%I OWNED BY %I.%I.id',
+        p_schema, p_table || '_id_seq', p_schema, p_table);
+    EXECUTE format('DROP TABLE %I.%I CASCADE', p_schema, legacy);
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT pg_temp.partition_by_month('app', 'audit_log', 'created_at');
+
+-- FK e índices (LIKE no copia FKs; los índices se crean sobre la tabla padre)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = 'app.audit_log'::regclass AND conname = 'audit_log_actor_user_id_fkey') THEN
+        ALTER TABLE app.audit_log ADD CONSTRAINT audit_log_actor_user_id_fkey
+            FOREIGN KEY (actor_user_id) REFERENCES app.user_accounts(id) ON DELETE SET NULL;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS ix_app_audit_log_action ON app.audit_log(action);
+CREATE INDEX IF NOT EXISTS ix_audit_meta_gin ON app.audit_log USING gin(audit_metadata);
+CREATE INDEX IF NOT EXISTS ix_audit_created_id ON app.audit_log(created_at, id);
+CREATE INDEX IF NOT EXISTS ix_audit_actor_created ON app.audit_log(actor_user_id, created_at, id);
+CREATE INDEX IF NOT EXISTS ix_audit_resource_created ON app.audit_log(resource_type, resource_id, created_at);
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- ============================================================================
+-- MIGRACIÓN: índice de historial de apuestas para paginación por keyset
+-- ============================================================================
+-- GET /bets pagina con
+--   WHERE user_id = :u AND (placed_at, id) < (:ts, :id)
+--   ORDER BY placed_at DESC, id DESC LIMIT :n
+-- ix_bets_user_status_placed solo sirve cuando se filtra por estado; sin
+-- filtro el listado necesita (user_id, placed_at, id), recorrido hacia atrás.
+-- ============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_bets_user_placed_id ON espn.bets(user_id, placed_at, id);
+
+COMMIT;
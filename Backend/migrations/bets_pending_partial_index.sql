@@ -0,0 +1,16 @@
+-- ============================================================================
+-- MIGRACIÓN: índice parcial de apuestas pendientes
+-- ============================================================================
+-- La mayoría de las apuestas históricas ya están liquidadas; las consultas de
+-- apuestas 'pending' (listado filtrado, liquidación) solo necesitan esas filas.
+-- El índice parcial ocupa pocas páginas y se mantiene en caché.
+-- Sin CONCURRENTLY: run_migrations.py ejecuta cada archivo dentro de una transacción.
+-- ============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_bets_pending_user_placed
+    ON espn.bets(user_id, placed_at, id)
+    WHERE bet_status_code = 'pending';
+
+COMMIT;
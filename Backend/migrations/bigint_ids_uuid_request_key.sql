@@ -0,0 +1,61 @@
+-- ============================================================================
+-- MIGRACIÓN: PKs/FKs de alto volumen a BIGINT + request_key como UUID
+-- ============================================================================
+-- - bets, game_odds, odds_lines, transactions, outbox, predictions: id BIGINT
+--   (y las columnas que los referencian) para no desbordar INTEGER
+-- - bets.game_id / game_odds.game_id / team_stats_game.game_id: BIGINT como
+--   espn.games.game_id (evita casts implícitos en los JOIN)
+-- - idempotency_keys.request_key: UUID (clave de índice fija de 16 bytes).
+--   Claves que no son UUID se convierten con md5(key)::uuid, igual que
+--   request_key_uuid() en idempotency_service.py
+-- ============================================================================
+
+BEGIN;
+
+-- espn
+ALTER TABLE espn.bets ALTER COLUMN id TYPE BIGINT;
+ALTER TABLE espn.bets ALTER COLUMN game_id TYPE BIGINT;
+ALTER TABLE espn.bets ALTER COLUMN odds_id TYPE BIGINT;
+ALTER TABLE espn.bet_selections ALTER COLUMN bet_id TYPE BIGINT;
+ALTER TABLE espn.bet_results ALTER COLUMN bet_id TYPE BIGINT;
+ALTER TABLE espn.game_odds ALTER COLUMN id TYPE BIGINT;
+ALTER TABLE espn.game_odds ALTER COLUMN game_id TYPE BIGINT;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_schema = 'espn' AND table_name = 'team_stats_game') THEN
+        ALTER TABLE espn.team_stats_game ALTER COLUMN game_id TYPE BIGINT;
+    END IF;
+END $$;
+
+-- Secuencias de los SERIAL pasan a BIGINT también
+ALTER SEQUENCE IF EXISTS espn.bets_id_seq AS BIGINT;
+ALTER SEQUENCE IF EXISTS espn.game_odds_id_seq AS BIGINT;
+
+-- app
+ALTER TABLE app.transactions ALTER COLUMN id TYPE BIGINT;
+ALTER TABLE app.transactions ALTER COLUMN bet_id TYPE BIGINT;
+ALTER TABLE app.odds_lines ALTER COLUMN id TYPE BIGINT;
+ALTER TABLE app.outbox ALTER COLUMN id TYPE BIGINT;
+ALTER TABLE app.predictions ALTER COLUMN id TYPE BIGINT;
+
+ALTER SEQUENCE IF EXISTS app.transactions_id_seq AS BIGINT;
+ALTER SEQUENCE IF EXISTS app.odds_lines_id_seq AS BIGINT;
+ALTER SEQUENCE IF EXISTS app.outbox_id_seq AS BIGINT;
+ALTER SEQUENCE IF EXISTS app.predictions_id_seq AS BIGINT;
+
+-- idempotency_keys.request_key -> UUID
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns WHERE table_schema = 'app' AND table_name = 'idempotency_keys' AND column_name = 'request_key' AND data_type <> 'uuid') THEN
+        ALTER TABLE app.idempotency_keys ALTER COLUMN request_key TYPE UUID USING (
+            CASE
+                WHEN request_key ~ '^\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\}?$'
+                    THEN request_key::uuid
+                ELSE md5(request_key)::uuid
+            END
+        );
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,40 @@
+-- ============================================================================
+-- MIGRACIÓN: NOTIFY al modificar catálogos cacheados en proceso
+-- ============================================================================
+-- app.core.catalog_cache mantiene en memoria bet_types, bet_statuses,
+-- providers y el mapa roles -> permisos. Cada INSERT/UPDATE/DELETE emite
+-- NOTIFY catalog_changed con el nombre de la tabla para invalidar la caché.
+-- ============================================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION app.notify_catalog_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('catalog_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'espn.bet_types', 'espn.bet_statuses',
+        'app.providers', 'app.provider_endpoints',
+        'app.roles', 'app.permissions', 'app.role_permissions'
+    ]
+    LOOP
+        IF to_regclass(t) IS NOT NULL THEN
+            EXECUTE format('DROP TRIGGER IF EXISTS catalog_changed_notify ON %s', t);
+            EXECUTE format(
+                'CREATE TRIGGER catalog_changed_notify AFTER INSERT OR UPDATE OR DELETE ON %s '
+                'FOR EACH STATEMENT EXECUTE FUNCTION app.notify_catalog_changed()',
+                t
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+COMMIT;
@@ -0,0 +1,44 @@
+-- ============================================================================
+-- MIGRACIÓN: username / email como CITEXT en app.user_accounts
+-- ============================================================================
+-- Login y búsquedas por username/email pasan a ser insensibles a mayúsculas
+-- usando los índices UNIQUE existentes, sin envolver la columna en lower().
+-- CITEXT no tiene longitud: los límites previos quedan como CHECK.
+-- La vista app.users depende de estas columnas y se recrea.
+-- Falla si hay duplicados que solo difieren en mayúsculas (resolverlos antes).
+-- ============================================================================
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS citext;
+
+DROP VIEW IF EXISTS app.users;
+
+ALTER TABLE app.user_accounts ALTER COLUMN username TYPE CITEXT;
+ALTER TABLE app.user_accounts ALTER COLUMN email TYPE CITEXT;
+
+ALTER TABLE app.user_accounts DROP CONSTRAINT IF EXISTS chk_user_accounts_username_len;
+ALTER TABLE app.user_accounts ADD CONSTRAINT chk_user_accounts_username_len
+    CHECK (char_length(username) <= 50);
+ALTER TABLE app.user_accounts DROP CONSTRAINT IF EXISTS chk_user_accounts_email_len;
+ALTER TABLE app.user_accounts ADD CONSTRAINT chk_user_accounts_email_len
+    CHECK (char_length(email) <= 100);
+
+-- Misma definición que migrations/legacy_users_view.sql
+CREATE OR REPLACE VIEW app.users AS
+SELECT
+    ua.id,
+    ua.username,
+    ua.email,
+    ua.hashed_password,
+    CASE ua.user_type WHEN 'administrator' THEN 'admin' ELSE ua.user_type END AS rol,
+    c.credits,
+    ua.is_active,
+    ua.created_at,
+    ua.updated_at
+FROM app.user_accounts ua
+LEFT JOIN app.clients c ON c.user_account_id = ua.id;
+
+COMMENT ON VIEW app.users IS 'Legacy (solo lectura): usar app.user_accounts + app.clients';
+
+COMMIT;
@@ -0,0 +1,56 @@
+-- ============================================================================
+-- MIGRACIÓN: foreign keys cross-schema (espn <-> app)
+-- ============================================================================
+-- Postgres permite FKs entre esquemas de la misma base de datos:
+--   - espn.bets.user_id       -> app.user_accounts.id  (ON DELETE RESTRICT)
+--   - app.transactions.bet_id -> espn.bets.id          (ON DELETE SET NULL)
+--   - app.requests.event_id   -> espn.games.game_id    (ON DELETE SET NULL)
+-- Se crean NOT VALID (aplican a filas nuevas sin bloquear la tabla) y luego se
+-- intenta VALIDATE; si hay huérfanos (ver reconciliation_worker) el constraint
+-- queda NOT VALID y se avisa con NOTICE.
+-- ============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_espn_bets_user_id ON espn.bets (user_id);
+CREATE INDEX IF NOT EXISTS ix_app_transactions_bet_id ON app.transactions (bet_id);
+
+ALTER TABLE app.requests ALTER COLUMN event_id TYPE BIGINT;
+CREATE INDEX IF NOT EXISTS ix_app_requests_event_id ON app.requests (event_id);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fk_bets_user_id') THEN
+        ALTER TABLE espn.bets ADD CONSTRAINT fk_bets_user_id
+            FOREIGN KEY (user_id) REFERENCES app.user_accounts (id) ON DELETE RESTRICT NOT VALID;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'transactions_bet_id_fkey') THEN
+        -- Tabla particionada: NOT VALID no está soportado, se valida al crearse.
+        -- Referencias a apuestas inexistentes quedan en NULL (igual que ON DELETE SET NULL)
+        UPDATE app.transactions t SET bet_id = NULL
+        WHERE t.bet_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM espn.bets b WHERE b.id = t.bet_id);
+        ALTER TABLE app.transactions ADD CONSTRAINT transactions_bet_id_fkey
+            FOREIGN KEY (bet_id) REFERENCES espn.bets (id) ON DELETE SET NULL;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'requests_event_id_fkey') THEN
+        ALTER TABLE app.requests ADD CONSTRAINT requests_event_id_fkey
+            FOREIGN KEY (event_id) REFERENCES espn.games (game_id) ON DELETE SET NULL NOT VALID;
+    END IF;
+END $$;
+
+DO $$
+BEGIN
+    BEGIN
+        ALTER TABLE espn.bets VALIDATE CONSTRAINT fk_bets_user_id;
+    EXCEPTION WHEN foreign_key_violation THEN
+        RAISE NOTICE 'fk_bets_user_id queda NOT VALID: hay apuestas huérfanas';
+    END;
+    BEGIN
+        ALTER TABLE app.requests VALIDATE CONSTRAINT requests_event_id_fkey;
+    EXCEPTION WHEN foreign_key_violation THEN
+        RAISE NOTICE 'requests_event_id_fkey queda NOT VALID: hay event_id sin juego';
+    END;
+END $$;
+
+COMMIT;
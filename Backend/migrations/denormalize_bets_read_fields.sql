@@ -0,0 +1,56 @@
+-- ============================================================================
+-- MIGRACIÓN: espn.bets - campos desnormalizados para lectura
+-- ============================================================================
+-- El historial de apuestas muestra tipo, estado y datos del juego. Se copian
+-- a espn.bets para listar sin JOIN a bet_types / bet_statuses / games.
+--   - bet_type_name / bet_status_name: mantenidos por trigger
+--   - home_team_snapshot / away_team_snapshot / game_date_snapshot: fijados
+--     al colocar la apuesta (inmutables)
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE espn.bets ADD COLUMN IF NOT EXISTS bet_type_name VARCHAR(100);
+ALTER TABLE espn.bets ADD COLUMN IF NOT EXISTS bet_status_name VARCHAR(100);
+ALTER TABLE espn.bets ADD COLUMN IF NOT EXISTS home_team_snapshot VARCHAR(100);
+ALTER TABLE espn.bets ADD COLUMN IF NOT EXISTS away_team_snapshot VARCHAR(100);
+ALTER TABLE espn.bets ADD COLUMN IF NOT EXISTS game_date_snapshot DATE;
+
+-- Backfill de apuestas existentes
+UPDATE espn.bets b
+SET bet_type_name = t.name
+FROM espn.bet_types t
+WHERE t.code = b.bet_type_code AND b.bet_type_name IS NULL;
+
+UPDATE espn.bets b
+SET bet_status_name = s.name
+FROM espn.bet_statuses s
+WHERE s.code = b.bet_status_code AND b.bet_status_name IS NULL;
+
+UPDATE espn.bets b
+SET home_team_snapshot = g.home_team,
+    away_team_snapshot = g.away_team,
+    game_date_snapshot = g.fecha
+FROM espn.games g
+WHERE g.game_id = b.game_id AND b.home_team_snapshot IS NULL;
+
+-- Trigger: mantener nombres de catálogo al insertar o cambiar tipo/estado
+CREATE OR REPLACE FUNCTION espn.bets_denorm_names()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.bet_type_code IS DISTINCT FROM OLD.bet_type_code THEN
+        SELECT name INTO NEW.bet_type_name FROM espn.bet_types WHERE code = NEW.bet_type_code;
+    END IF;
+    IF TG_OP = 'INSERT' OR NEW.bet_status_code IS DISTINCT FROM OLD.bet_status_code THEN
+        SELECT name INTO NEW.bet_status_name FROM espn.bet_statuses WHERE code = NEW.bet_status_code;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bets_denorm_names_trigger ON espn.bets;
+CREATE TRIGGER bets_denorm_names_trigger
+    BEFORE INSERT OR UPDATE OF bet_type_code, bet_status_code ON espn.bets
+    FOR EACH ROW EXECUTE FUNCTION espn.bets_denorm_names();
+
+COMMIT;
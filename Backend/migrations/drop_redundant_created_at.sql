@@ -0,0 +1,27 @@
+-- ============================================================================
+-- MIGRACIÓN: eliminar created_at redundante en espn.bets y espn.bet_results
+-- ============================================================================
+-- - espn.bets.created_at        = placed_at (ambos DEFAULT now() en el INSERT)
+-- - espn.bet_results.created_at = settled_at (el resultado se crea al liquidar)
+-- Se rellena el timestamp conservado si estaba a NULL antes de borrar la columna.
+-- La API sigue devolviendo created_at en BetResponse a partir de placed_at.
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'espn' AND table_name = 'bets' AND column_name = 'created_at') THEN
+        UPDATE espn.bets SET placed_at = created_at WHERE placed_at IS NULL;
+        ALTER TABLE espn.bets DROP COLUMN created_at;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'espn' AND table_name = 'bet_results' AND column_name = 'created_at') THEN
+        UPDATE espn.bet_results SET settled_at = created_at WHERE settled_at IS NULL;
+        ALTER TABLE espn.bet_results DROP COLUMN created_at;
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,42 @@
+-- ============================================================================
+-- MIGRACIÓN: eliminar índices duplicados sobre claves primarias
+-- ============================================================================
+-- Los modelos declaraban index=True en columnas primary_key, lo que creaba un
+-- índice ix_<schema>_<tabla>_<col> además del índice de la PK. Se eliminan:
+-- mismo plan de lectura, menos mantenimiento por INSERT y menos caché.
+-- Los índices UNIQUE (username, email, user_two_factor.user_account_id) se
+-- mantienen: con unique=True + index=True SQLAlchemy crea un único índice.
+-- ============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS app.ix_app_idempotency_keys_id;
+DROP INDEX IF EXISTS app.ix_app_model_versions_id;
+DROP INDEX IF EXISTS app.ix_app_outbox_id;
+DROP INDEX IF EXISTS app.ix_app_permissions_id;
+DROP INDEX IF EXISTS app.ix_app_providers_id;
+DROP INDEX IF EXISTS app.ix_app_roles_id;
+DROP INDEX IF EXISTS app.ix_app_user_accounts_id;
+DROP INDEX IF EXISTS app.ix_app_administrators_id;
+DROP INDEX IF EXISTS app.ix_app_audit_log_id;
+DROP INDEX IF EXISTS app.ix_app_clients_id;
+DROP INDEX IF EXISTS app.ix_app_operators_id;
+DROP INDEX IF EXISTS app.ix_app_provider_endpoints_id;
+DROP INDEX IF EXISTS app.ix_app_requests_id;
+DROP INDEX IF EXISTS app.ix_app_transactions_id;
+DROP INDEX IF EXISTS app.ix_app_user_roles_id;
+DROP INDEX IF EXISTS app.ix_app_user_sessions_id;
+DROP INDEX IF EXISTS app.ix_app_user_two_factor_id;
+DROP INDEX IF EXISTS app.ix_app_odds_snapshots_id;
+DROP INDEX IF EXISTS app.ix_app_predictions_id;
+DROP INDEX IF EXISTS app.ix_app_odds_lines_id;
+
+DROP INDEX IF EXISTS espn.ix_espn_games_game_id;
+DROP INDEX IF EXISTS espn.ix_espn_teams_team_id;
+DROP INDEX IF EXISTS espn.ix_espn_bets_id;
+DROP INDEX IF EXISTS espn.ix_espn_game_odds_id;
+DROP INDEX IF EXISTS espn.ix_espn_team_stats_game_id;
+DROP INDEX IF EXISTS espn.ix_espn_bet_results_id;
+DROP INDEX IF EXISTS espn.ix_espn_bet_selections_id;
+
+COMMIT;
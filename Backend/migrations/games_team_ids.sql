@@ -0,0 +1,63 @@
+-- ============================================================================
+-- MIGRACIÓN: espn.games.home_team_id / away_team_id
+-- ============================================================================
+-- espn.games guarda los equipos como nombres (los escriben el ETL, GameSync y
+-- los scrapers). Se añaden FKs a espn.teams resueltas una vez por trigger, con
+-- la misma búsqueda que MatchService._find_team_by_name (exacto, sin
+-- mayúsculas, parcial), de modo que coinciden con los team_id que ve el
+-- frontend. place_bet valida el equipo elegido con dos comparaciones enteras.
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE espn.games ADD COLUMN IF NOT EXISTS home_team_id INTEGER;
+ALTER TABLE espn.games ADD COLUMN IF NOT EXISTS away_team_id INTEGER;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'games_home_team_id_fkey') THEN
+        ALTER TABLE espn.games ADD CONSTRAINT games_home_team_id_fkey
+            FOREIGN KEY (home_team_id) REFERENCES espn.teams (team_id) ON DELETE SET NULL;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'games_away_team_id_fkey') THEN
+        ALTER TABLE espn.games ADD CONSTRAINT games_away_team_id_fkey
+            FOREIGN KEY (away_team_id) REFERENCES espn.teams (team_id) ON DELETE SET NULL;
+    END IF;
+END $$;
+
+-- Nombre -> team_id: exacto, luego sin mayúsculas, luego parcial (NULL si no hay)
+CREATE OR REPLACE FUNCTION espn.resolve_team_id(team_name TEXT)
+RETURNS INTEGER AS $$
+    SELECT COALESCE(
+        (SELECT team_id FROM espn.teams WHERE name = team_name LIMIT 1),
+        (SELECT team_id FROM espn.teams WHERE name ILIKE team_name LIMIT 1),
+        (SELECT team_id FROM espn.teams WHERE name ILIKE '%' || team_name || '%' LIMIT 1)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Backfill de partidos existentes
+UPDATE espn.games
+SET home_team_id = espn.resolve_team_id(home_team),
+    away_team_id = espn.resolve_team_id(away_team)
+WHERE home_team_id IS NULL OR away_team_id IS NULL;
+
+-- Trigger: resolver los ids al insertar o cambiar los nombres
+CREATE OR REPLACE FUNCTION espn.games_resolve_team_ids()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.home_team IS DISTINCT FROM OLD.home_team THEN
+        NEW.home_team_id := espn.resolve_team_id(NEW.home_team);
+    END IF;
+    IF TG_OP = 'INSERT' OR NEW.away_team IS DISTINCT FROM OLD.away_team THEN
+        NEW.away_team_id := espn.resolve_team_id(NEW.away_team);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS games_resolve_team_ids_trigger ON espn.games;
+CREATE TRIGGER games_resolve_team_ids_trigger
+    BEFORE INSERT OR UPDATE OF home_team, away_team ON espn.games
+    FOR EACH ROW EXECUTE FUNCTION espn.games_resolve_team_ids();
+
+COMMIT;
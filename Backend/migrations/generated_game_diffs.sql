@@ -0,0 +1,38 @@
+-- ============================================================================
+-- MIGRACIÓN: resultados y diferencias de espn.games como columnas generadas
+-- ============================================================================
+-- home_win, point_diff, net_rating_diff, reb_diff, ast_diff y tov_diff pasan a
+-- GENERATED ALWAYS AS (...) STORED con las mismas fórmulas que
+-- Scrapping/nba/etl/transform_consolidate.py. Postgres las recalcula al
+-- actualizar los scores, así que los ETL ya no las escriben.
+-- home_win pasa de BIGINT (1/0) a BOOLEAN; NULL para partidos sin jugar (0-0).
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT * FROM (VALUES
+            ('home_win',        'BOOLEAN',          'CASE WHEN home_score > 0 OR away_score > 0 THEN home_score > away_score END'),
+            ('point_diff',      'DOUBLE PRECISION', 'home_score - away_score'),
+            ('net_rating_diff', 'DOUBLE PRECISION', '(home_fg_pct - away_fg_pct) + (home_3p_pct - away_3p_pct)'),
+            ('reb_diff',        'DOUBLE PRECISION', 'home_reb - away_reb'),
+            ('ast_diff',        'DOUBLE PRECISION', 'home_ast - away_ast'),
+            ('tov_diff',        'DOUBLE PRECISION', 'away_to - home_to')
+        ) AS v(name, data_type, expr)
+    LOOP
+        -- Idempotente: solo si la columna aún no es generada
+        IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_schema = 'espn' AND table_name = 'games'
+                         AND column_name = col.name AND is_generated = 'ALWAYS') THEN
+            EXECUTE format('ALTER TABLE espn.games DROP COLUMN IF EXISTS %I', col.name);
+            EXECUTE format('ALTER TABLE espn.games ADD COLUMN %I %s GENERATED ALWAYS AS (%s) STORED',
+                           col.name, col.data_type, col.expr);
+        END IF;
+    END LOOP;
+END $$;
+
+COMMIT;
@@ -0,0 +1,27 @@
+-- ============================================================================
+-- MIGRACIÓN: idempotency_keys.response_data de TEXT a JSONB
+-- ============================================================================
+-- El servicio guardaba json.dumps(respuesta) y hacía json.loads al leer. Con
+-- JSONB el dict se entrega al driver (json_serializer del engine) y vuelve ya
+-- decodificado. Filas antiguas que no eran JSON válido (fallback str()) se
+-- conservan como string JSON.
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'idempotency_keys'
+                 AND column_name = 'response_data' AND data_type = 'text') THEN
+        BEGIN
+            ALTER TABLE app.idempotency_keys
+                ALTER COLUMN response_data TYPE JSONB USING response_data::jsonb;
+        EXCEPTION WHEN invalid_text_representation THEN
+            ALTER TABLE app.idempotency_keys
+                ALTER COLUMN response_data TYPE JSONB USING to_jsonb(response_data);
+        END;
+    END IF;
+END $$;
+
+COMMIT;
@@ -30,7 +30,7 @@ def init_basic_data(db: Session):
             version="v1.0.0",
             is_active=True,
             description="Versión inicial del modelo de predicción NBA",
-            model_metadata='{"type": "placeholder", "accuracy": 0.0}'
+            model_metadata={"type": "placeholder", "accuracy": 0.0}
         )
         db.add(model_version)
         db.commit()
@@ -77,21 +77,21 @@ def init_basic_data(db: Session):
             "purpose": "get_odds",
             "url": "https://api.example.com/espn/odds",
             "method": "GET",
-            "headers": '{"Content-Type": "application/json"}'
+            "headers": {"Content-Type": "application/json"}
         },
         {
             "provider_code": "espn",
             "purpose": "get_stats",
             "url": "https://api.example.com/espn/stats",
             "method": "GET",
-            "headers": '{"Content-Type": "application/json"}'
+            "headers": {"Content-Type": "application/json"}
         },
         {
             "provider_code": "odds_api",
             "purpose": "get_odds",
             "url": "https://api.example.com/odds",
             "method": "GET",
-            "headers": '{"Content-Type": "application/json"}'
+            "headers": {"Content-Type": "application/json"}
         }
     ]
 
@@ -13,7 +13,6 @@ from app.models import (
 )
 from app.services.auth_service import get_password_hash
 import uuid
-import json
 
 def init_sample_users(db: Session):
     """Crear usuarios de ejemplo"""
@@ -85,7 +84,7 @@ def init_sample_requests(db: Session):
             event_id=401585600 + i if i % 2 == 0 else None,
             user_id=user.id,
             status=status,
-            request_metadata=json.dumps({"source": "test", "index": i}),
+            request_metadata={"source": "test", "index": i},
             error_message=f"Error de prueba {i}" if status == RequestStatus.FAILED else None,
             created_at=datetime.utcnow() - timedelta(hours=i),
             completed_at=datetime.utcnow() - timedelta(hours=i-1) if status == RequestStatus.COMPLETED else None
@@ -123,17 +122,17 @@ def init_sample_predictions(db: Session):
         prediction = Prediction(
             request_id=request.id,
             model_version_id=model_version.id,
-            telemetry=json.dumps({
+            telemetry={
                 "home_win_probability": round(random.uniform(0.3, 0.7), 3),
                 "away_win_probability": round(random.uniform(0.3, 0.7), 3),
                 "predicted_home_score": round(random.uniform(90, 120), 1),
                 "predicted_away_score": round(random.uniform(90, 120), 1),
-            }),
+            },
             latency_ms=round(random.uniform(50, 500), 2),
-            score=json.dumps({
+            score={
                 "confidence": round(random.uniform(0.6, 0.95), 3),
                 "accuracy": round(random.uniform(0.7, 0.98), 3)
-            }),
+            },
             created_at=request.created_at
         )
         db.add(prediction)
@@ -169,9 +168,9 @@ def init_sample_audit_logs(db: Session):
             action=action,
             resource_type=resource_type,
             resource_id=i + 1,
-            before=json.dumps({"old_value": f"before_{i}"}) if action in ["update", "delete"] else None,
-            after=json.dumps({"new_value": f"after_{i}"}) if action in ["create", "update"] else None,
-            audit_metadata=json.dumps({"ip": "127.0.0.1", "user_agent": "test"}),
+            before={"old_value": f"before_{i}"} if action in ["update", "delete"] else None,
+            after={"new_value": f"after_{i}"} if action in ["create", "update"] else None,
+            audit_metadata={"ip": "127.0.0.1", "user_agent": "test"},
             created_at=datetime.utcnow() - timedelta(hours=i)
         )
         db.add(log)
@@ -202,12 +201,12 @@ def init_sample_outbox(db: Session):
         
         event = Outbox(
             topic=event_type,
-            payload=json.dumps({
+            payload={
                 "request_id": request.id,
                 "request_key": request.request_key,
                 "status": request.status.value if hasattr(request.status, 'value') else str(request.status),
                 "timestamp": datetime.utcnow().isoformat()
-            }),
+            },
             published_at=datetime.utcnow() - timedelta(hours=i) if published else None,
             created_at=datetime.utcnow() - timedelta(hours=i)
         )
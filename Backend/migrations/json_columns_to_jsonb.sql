@@ -0,0 +1,60 @@
+-- ============================================================================
+-- MIGRACIÓN: columnas JSON en TEXT -> JSONB
+-- ============================================================================
+-- outbox.payload, predictions.score/telemetry, model_versions.model_metadata,
+-- providers.provider_metadata, odds_lines.line_metadata,
+-- requests.request_metadata, provider_endpoints.headers.
+-- Valores que no son JSON válido (p. ej. fallbacks str(dict) antiguos) se
+-- guardan como string JSON en lugar de abortar la migración.
+-- ============================================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION pg_temp.try_jsonb(value TEXT)
+RETURNS JSONB AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN others THEN
+    RETURN to_jsonb(value);
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT * FROM (VALUES
+            ('outbox', 'payload'),
+            ('predictions', 'score'),
+            ('predictions', 'telemetry'),
+            ('model_versions', 'model_metadata'),
+            ('providers', 'provider_metadata'),
+            ('odds_lines', 'line_metadata'),
+            ('requests', 'request_metadata'),
+            ('provider_endpoints', 'headers')
+        ) AS t(table_name, column_name)
+    LOOP
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = 'app' AND table_name = col.table_name
+              AND column_name = col.column_name AND data_type = 'text'
+        ) THEN
+            EXECUTE format(
+                'ALTER TABLE app.%I ALTER COLUMN %I TYPE JSONB USING pg_temp.try_jsonb(%I)',
+                col.table_name, col.column_name, col.column_name
+            );
+        END IF;
+    END LOOP;
+
+    -- Índices GIN para consultas con @> / ?
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'app' AND tablename = 'outbox' AND indexname = 'ix_outbox_payload_gin') THEN
+        CREATE INDEX ix_outbox_payload_gin ON app.outbox USING gin (payload);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'app' AND tablename = 'predictions' AND indexname = 'ix_prediction_telemetry_gin') THEN
+        CREATE INDEX ix_prediction_telemetry_gin ON app.predictions USING gin (telemetry);
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,56 @@
+-- ============================================================================
+-- MIGRACIÓN: app.users como vista de solo lectura sobre user_accounts + clients
+-- ============================================================================
+-- El modelo legacy User ya no existe en el ORM; la tabla app.users (si quedó de
+-- normalize_users_by_type.sql) se renombra a app.users_legacy y las consultas
+-- legacy leen una vista con las mismas columnas, sin doble escritura.
+-- Cualquier FK residual de app.user_roles hacia app.users pasa a app.user_accounts.
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+DECLARE
+    fk RECORD;
+BEGIN
+    -- FKs de app.user_roles que aún apunten a la tabla legacy
+    FOR fk IN
+        SELECT con.conname
+        FROM pg_constraint con
+        WHERE con.conrelid = 'app.user_roles'::regclass
+          AND con.contype = 'f'
+          AND con.confrelid = to_regclass('app.users')
+    LOOP
+        EXECUTE format('ALTER TABLE app.user_roles DROP CONSTRAINT %I', fk.conname);
+    END LOOP;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint
+                   WHERE conrelid = 'app.user_roles'::regclass AND contype = 'f'
+                     AND confrelid = 'app.user_accounts'::regclass) THEN
+        ALTER TABLE app.user_roles ADD CONSTRAINT user_roles_user_id_fkey
+            FOREIGN KEY (user_id) REFERENCES app.user_accounts(id) ON DELETE CASCADE;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.tables
+               WHERE table_schema = 'app' AND table_name = 'users' AND table_type = 'BASE TABLE') THEN
+        ALTER TABLE app.users RENAME TO users_legacy;
+    END IF;
+END $$;
+
+CREATE OR REPLACE VIEW app.users AS
+SELECT
+    ua.id,
+    ua.username,
+    ua.email,
+    ua.hashed_password,
+    CASE ua.user_type WHEN 'administrator' THEN 'admin' ELSE ua.user_type END AS rol,
+    c.credits,
+    ua.is_active,
+    ua.created_at,
+    ua.updated_at
+FROM app.user_accounts ua
+LEFT JOIN app.clients c ON c.user_account_id = ua.id;
+
+COMMENT ON VIEW app.users IS 'Legacy (solo lectura): usar app.user_accounts + app.clients';
+
+COMMIT;
@@ -0,0 +1,34 @@
+-- ============================================================================
+-- MIGRACIÓN: montos de créditos como NUMERIC(12,2)
+-- ============================================================================
+-- - app.transactions.amount / balance_before / balance_after: double precision -> NUMERIC(12,2)
+-- - app.clients.credits: NUMERIC(10,2) -> NUMERIC(12,2)
+-- chk_tx_balance pasa a ser exacto (antes comparaba redondeando al centavo).
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE app.transactions DROP CONSTRAINT IF EXISTS chk_tx_balance;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'transactions' AND column_name = 'amount'
+                 AND data_type = 'double precision') THEN
+        ALTER TABLE app.transactions
+            ALTER COLUMN amount TYPE NUMERIC(12, 2) USING round(amount::numeric, 2),
+            ALTER COLUMN balance_before TYPE NUMERIC(12, 2) USING round(balance_before::numeric, 2),
+            ALTER COLUMN balance_after TYPE NUMERIC(12, 2) USING round(balance_after::numeric, 2);
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'clients' AND column_name = 'credits'
+                 AND numeric_precision <> 12) THEN
+        ALTER TABLE app.clients ALTER COLUMN credits TYPE NUMERIC(12, 2);
+    END IF;
+END $$;
+
+ALTER TABLE app.transactions ADD CONSTRAINT chk_tx_balance
+    CHECK (balance_before + amount = balance_after);
+
+COMMIT;
@@ -0,0 +1,48 @@
+-- ============================================================================
+-- MIGRACIÓN: columnas de dinero/cuotas de NUMERIC a BIGINT de punto fijo
+-- ============================================================================
+-- - Montos (bet_amount, potential_payout, actual_payout) y line_value:
+--   centavos/centésimas (x100) -> *_cents
+-- - odds_value (bets y game_odds): diezmilésimas (x10000) -> odds_value_e4
+-- Los modelos exponen los nombres históricos como hybrid_property
+-- (app/models/espn_bet.py), así que el código Python no cambia.
+-- ============================================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION pg_temp.to_fixed_point(
+    p_schema TEXT, p_table TEXT, p_column TEXT, p_new_column TEXT, p_scale INT
+) RETURNS VOID AS $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = p_schema AND table_name = p_table AND column_name = p_column
+    ) THEN
+        EXECUTE format('ALTER TABLE %I.%I RENAME COLUMN %I TO %I', p_schema, p_table, p_column, p_new_column);
+        EXECUTE format(
+            'ALTER TABLE %I.%I ALTER COLUMN %I TYPE BIGINT USING round(%I * %s)::bigint',
+            p_schema, p_table, p_new_column, p_new_column, p_scale
+        );
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE espn.bets DROP CONSTRAINT IF EXISTS chk_bets_amount_positive;
+ALTER TABLE espn.bets DROP CONSTRAINT IF EXISTS chk_bets_payout;
+ALTER TABLE espn.bet_results DROP CONSTRAINT IF EXISTS chk_bet_results_payout;
+
+SELECT pg_temp.to_fixed_point('espn', 'bets', 'bet_amount', 'bet_amount_cents', 100);
+SELECT pg_temp.to_fixed_point('espn', 'bets', 'potential_payout', 'potential_payout_cents', 100);
+SELECT pg_temp.to_fixed_point('espn', 'bets', 'odds_value', 'odds_value_e4', 10000);
+SELECT pg_temp.to_fixed_point('espn', 'bet_results', 'actual_payout', 'actual_payout_cents', 100);
+SELECT pg_temp.to_fixed_point('espn', 'game_odds', 'odds_value', 'odds_value_e4', 10000);
+SELECT pg_temp.to_fixed_point('espn', 'game_odds', 'line_value', 'line_value_cents', 100);
+
+ALTER TABLE espn.bets ADD CONSTRAINT chk_bets_amount_positive CHECK (bet_amount_cents > 0);
+ALTER TABLE espn.bets ADD CONSTRAINT chk_bets_payout CHECK (potential_payout_cents >= bet_amount_cents);
+ALTER TABLE espn.bet_results ADD CONSTRAINT chk_bet_results_payout CHECK (actual_payout_cents >= 0);
+
+-- ix_bets_user_status_placed sigue las columnas renombradas (INCLUDE por attnum)
+-- y se reconstruye con el cambio de tipo; no hace falta recrearlo.
+
+COMMIT;
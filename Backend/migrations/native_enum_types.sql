@@ -0,0 +1,59 @@
+-- ============================================================================
+-- MIGRACIÓN: columnas de estado/tipo como ENUM nativo de Postgres
+-- ============================================================================
+-- - app.requests.status            -> app.request_status
+-- - app.transactions.transaction_type -> app.transaction_type
+-- - espn.game_odds.odds_type        -> espn.odds_type (reemplaza VARCHAR + CHECK)
+-- Los enums creados por SQLAlchemy (requeststatus / transactiontype) guardaban
+-- el NOMBRE del miembro ('COMPLETED'); los nuevos guardan el valor ('completed').
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace
+                   WHERE n.nspname = 'app' AND t.typname = 'request_status') THEN
+        CREATE TYPE app.request_status AS ENUM ('received', 'processing', 'partial', 'completed', 'failed');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace
+                   WHERE n.nspname = 'app' AND t.typname = 'transaction_type') THEN
+        CREATE TYPE app.transaction_type AS ENUM ('bet_placed', 'bet_won', 'bet_lost', 'credit_purchase', 'admin_adjustment');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace
+                   WHERE n.nspname = 'espn' AND t.typname = 'odds_type') THEN
+        CREATE TYPE espn.odds_type AS ENUM ('moneyline_home', 'moneyline_away', 'spread_home', 'spread_away', 'over_under');
+    END IF;
+END $$;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'requests' AND column_name = 'status'
+                 AND udt_name <> 'request_status') THEN
+        ALTER TABLE app.requests
+            ALTER COLUMN status TYPE app.request_status USING lower(status::text)::app.request_status;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'transactions' AND column_name = 'transaction_type'
+                 AND udt_name <> 'transaction_type') THEN
+        ALTER TABLE app.transactions
+            ALTER COLUMN transaction_type TYPE app.transaction_type
+            USING lower(transaction_type::text)::app.transaction_type;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'espn' AND table_name = 'game_odds' AND column_name = 'odds_type'
+                 AND udt_name <> 'odds_type') THEN
+        ALTER TABLE espn.game_odds DROP CONSTRAINT IF EXISTS chk_game_odds_type;
+        ALTER TABLE espn.game_odds
+            ALTER COLUMN odds_type TYPE espn.odds_type USING odds_type::text::espn.odds_type;
+    END IF;
+END $$;
+
+-- Tipos antiguos generados por sqlalchemy.Enum (ya sin columnas que los usen)
+DROP TYPE IF EXISTS requeststatus;
+DROP TYPE IF EXISTS transactiontype;
+
+COMMIT;
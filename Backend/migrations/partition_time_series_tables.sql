@@ -0,0 +1,115 @@
+-- ============================================================================
+-- MIGRACIÓN: particionado mensual por rango de tiempo
+-- ============================================================================
+-- espn.game_odds (snapshot_time), app.odds_lines (created_at) y
+-- app.transactions (created_at) son append-mostly y se consultan por ventanas
+-- recientes. Se convierten a tablas particionadas por mes:
+--   - PK (id, <clave de partición>) (requisito de PostgreSQL)
+--   - una partición por cada mes con datos + 2 meses por delante + DEFAULT
+--   - espn.bets.odds_id deja de tener FK (game_odds.id ya no es único solo)
+-- Las particiones futuras las crea app.core.partitions.ensure_monthly_partitions
+-- (startup de la API o cron: python -m app.core.partitions).
+-- ============================================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION pg_temp.partition_by_month(p_schema TEXT, p_table TEXT, p_key TEXT)
+RETURNS VOID AS $$
+DECLARE
+    legacy TEXT := p_table || '_legacy';
+    month_start DATE;
+    last_month DATE;
+BEGIN
+    -- Ya particionada: nada que hacer
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table p
+        JOIN pg_class c ON c.oid = p.partrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = p_schema AND c.relname = p_table
+    ) THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I.%I RENAME TO %I', p_schema, p_table, legacy);
+    EXECUTE format('UPDATE %I.%I SET %I = now() WHERE %I IS NULL', p_schema, legacy, p_key, p_key);
+
+    EXECUTE format(
+        'CREATE TABLE %I.%I (LIKE %I.%I INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (%I)',
+        p_schema, p_table, p_schema, legacy, p_key
+    );
+    EXECUTE format('ALTER TABLE %I.%I ALTER COLUMN %I SET NOT NULL', p_schema, p_table, p_key);
+    EXECUTE format('ALTER TABLE %I.%I ADD PRIMARY KEY (id, %I)', p_schema, p_table, p_key);
+
+    -- Particiones: desde el mes más antiguo con datos hasta 2 meses por delante
+    EXECUTE format('SELECT date_trunc(''month'', COALESCE(min(%I), now()))::date FROM %I.%I', p_key, p_schema, legacy)
+        INTO month_start;
+    last_month := (date_trunc('month', now()) + interval '2 months')::date;
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I.%I PARTITION OF %I.%I FOR VALUES FROM (%L) TO (%L)',
+            p_schema, p_table || '_' || to_char(month_start, 'YYYY_MM'), p_schema, p_table,
+            month_start, (month_start + interval '1 month')::date
+        );
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+    EXECUTE format('CREATE TABLE IF NOT EXISTS %I.%I PARTITION OF %I.%I DEFAULT',
+        p_schema, p_table || '_default', p_schema, p_table);
+
+    EXECUTE format('INSERT INTO %I.%I SELECT * FROM %I.%I', p_schema, p_table, p_schema, legacy);
+
+    -- La secuencia del id pasa a la nueva tabla antes de borrar la antigua
+    EXECUTE format('ALTER SEQUENCE IF EXISTS %I.%I OWNED BY %I.%I.id',
+        p_schema, p_table || '_id_seq', p_schema, p_table);
+    EXECUTE format('DROP TABLE %I.%I CASCADE', p_schema, legacy);
+END;
+$$ LANGUAGE plpgsql;
+
+-- espn.bets.odds_id: eliminar la FK hacia game_odds (referencia a nivel app)
+DO $$
+DECLARE
+    fk_name TEXT;
+BEGIN
+    FOR fk_name IN
+        SELECT conname FROM pg_constraint
+        WHERE conrelid = 'espn.bets'::regclass AND contype = 'f'
+          AND confrelid = 'espn.game_odds'::regclass
+    LOOP
+        EXECUTE format('ALTER TABLE espn.bets DROP CONSTRAINT %I', fk_name);
+    END LOOP;
+END $$;
+
+SELECT pg_temp.partition_by_month('espn', 'game_odds', 'snapshot_time');
+SELECT pg_temp.partition_by_month('app', 'odds_lines', 'created_at');
+SELECT pg_temp.partition_by_month('app', 'transactions', 'created_at');
+
+-- FKs e índices (LIKE no copia FKs; los índices se crean sobre la tabla padre)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = 'espn.game_odds'::regclass AND conname = 'game_odds_game_id_fkey') THEN
+        ALTER TABLE espn.game_odds ADD CONSTRAINT game_odds_game_id_fkey
+            FOREIGN KEY (game_id) REFERENCES espn.games(game_id) ON DELETE CASCADE;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = 'app.odds_lines'::regclass AND conname = 'odds_lines_snapshot_id_fkey') THEN
+        ALTER TABLE app.odds_lines ADD CONSTRAINT odds_lines_snapshot_id_fkey
+            FOREIGN KEY (snapshot_id) REFERENCES app.odds_snapshots(id) ON DELETE CASCADE;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = 'app.odds_lines'::regclass AND conname = 'odds_lines_provider_id_fkey') THEN
+        ALTER TABLE app.odds_lines ADD CONSTRAINT odds_lines_provider_id_fkey
+            FOREIGN KEY (provider_id) REFERENCES app.providers(id) ON DELETE RESTRICT;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = 'app.transactions'::regclass AND conname = 'transactions_user_id_fkey') THEN
+        ALTER TABLE app.transactions ADD CONSTRAINT transactions_user_id_fkey
+            FOREIGN KEY (user_id) REFERENCES app.user_accounts(id);
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS ix_espn_game_odds_id ON espn.game_odds(id);
+CREATE INDEX IF NOT EXISTS ix_game_odds_game_type_time ON espn.game_odds(game_id, odds_type, snapshot_time);
+CREATE INDEX IF NOT EXISTS ix_app_odds_lines_id ON app.odds_lines(id);
+CREATE INDEX IF NOT EXISTS ix_app_odds_lines_snapshot_id ON app.odds_lines(snapshot_id);
+CREATE INDEX IF NOT EXISTS ix_app_odds_lines_provider_id ON app.odds_lines(provider_id);
+CREATE INDEX IF NOT EXISTS ix_odds_lines_snapshot_line ON app.odds_lines(snapshot_id, line_code);
+CREATE INDEX IF NOT EXISTS ix_app_transactions_id ON app.transactions(id);
+CREATE INDEX IF NOT EXISTS ix_tx_user_created ON app.transactions(user_id, created_at);
+
+COMMIT;
@@ -0,0 +1,43 @@
+-- ============================================================================
+-- MIGRACIÓN: invariantes de potential_payout y balance_after en la base de datos
+-- ============================================================================
+-- - espn.bets.potential_payout_cents pasa a columna generada:
+--       round(bet_amount_cents * odds_value_e4 / 10000.0)::bigint
+--   (las filas existentes se recalculan con la fórmula). Al borrar la columna
+--   vieja caen chk_bets_payout e ix_bets_user_status_placed: se recrean.
+-- - app.transactions: CHECK chk_tx_balance (balance_before + amount = balance_after,
+--   comparado al centavo mientras las columnas sean double precision).
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_schema = 'espn' AND table_name = 'bets'
+                     AND column_name = 'potential_payout_cents' AND is_generated = 'ALWAYS') THEN
+        ALTER TABLE espn.bets
+            ADD COLUMN potential_payout_cents_gen BIGINT
+            GENERATED ALWAYS AS (round(bet_amount_cents * odds_value_e4 / 10000.0)::bigint) STORED;
+        ALTER TABLE espn.bets DROP COLUMN potential_payout_cents;
+        ALTER TABLE espn.bets RENAME COLUMN potential_payout_cents_gen TO potential_payout_cents;
+        ALTER TABLE espn.bets ALTER COLUMN potential_payout_cents SET NOT NULL;
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'chk_bets_payout') THEN
+        ALTER TABLE espn.bets ADD CONSTRAINT chk_bets_payout CHECK (potential_payout_cents >= bet_amount_cents);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE schemaname = 'espn' AND tablename = 'bets' AND indexname = 'ix_bets_user_status_placed') THEN
+        CREATE INDEX ix_bets_user_status_placed ON espn.bets(user_id, bet_status_code, placed_at)
+            INCLUDE (bet_amount_cents, potential_payout_cents, game_id);
+    END IF;
+
+    -- Tabla particionada: el CHECK se propaga a todas las particiones
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'chk_tx_balance') THEN
+        ALTER TABLE app.transactions ADD CONSTRAINT chk_tx_balance
+            CHECK (round((balance_before + amount)::numeric, 2) = round(balance_after::numeric, 2));
+    END IF;
+END $$;
+
+COMMIT;
@@ -99,6 +99,38 @@ def main():
     migration_files = [
         "normalize_espn_schema_3nf.sql",  # Primero: normalización de bets
         "normalize_users_by_type.sql",    # Segundo: separación de usuarios
+        "audit_log_jsonb.sql",            # audit_log: TEXT -> JSONB + índice GIN
+        "denormalize_bets_read_fields.sql",  # bets: nombres/snapshots para lectura sin JOINs
+        "add_covering_indexes.sql",       # índices compuestos / covering / parciales
+        "bigint_ids_uuid_request_key.sql",  # ids BIGINT + request_key UUID
+        "json_columns_to_jsonb.sql",      # columnas JSON (TEXT) -> JSONB + índices GIN
+        "partition_time_series_tables.sql",  # game_odds/odds_lines/transactions por mes
+        "money_columns_to_cents.sql",  # montos y cuotas como BIGINT de punto fijo
+        "updated_at_triggers.sql",  # updated_at por trigger BEFORE UPDATE
+        "cross_schema_foreign_keys.sql",  # FKs espn <-> app (bets.user_id, transactions.bet_id, requests.event_id)
+        "split_bet_selections_by_type.sql",  # bet_selections -> tablas por tipo (moneyline/spread/total)
+        "catalog_notify_triggers.sql",  # NOTIFY catalog_changed para la caché de catálogos
+        "native_enum_types.sql",  # status/transaction_type/odds_type como ENUM nativo
+        "generated_game_diffs.sql",  # espn.games: home_win/diffs como columnas generadas
+        "drop_redundant_created_at.sql",  # bets/bet_results: sin created_at duplicado
+        "payout_balance_invariants.sql",  # payout generado + CHECK de saldo en transacciones
+        "money_columns_numeric.sql",  # transactions/clients: montos NUMERIC(12,2)
+        "user_type_discriminator.sql",  # user_accounts.user_type + trigger de sincronización
+        "user_sessions_partial_indexes.sql",  # user_sessions: índices parciales WHERE is_active
+        "user_sessions_token_hash_bytea.sql",  # user_sessions.token_hash: hex -> bytea(32)
+        "transaction_type_varchar.sql",  # transactions.transaction_type: ENUM -> VARCHAR + CHECK
+        "legacy_users_view.sql",  # app.users legacy -> vista de solo lectura
+        "user_profile_denorm.sql",  # user_accounts.display_name/avatar_url + trigger
+        "citext_user_identifiers.sql",  # username/email CITEXT
+        "drop_redundant_pk_indexes.sql",  # índices ix_*_id duplicados de la PK
+        "transactions_keyset_index.sql",  # ix_tx_user_created (user_id, created_at, id)
+        "two_factor_backup_codes_bytea.sql",  # backup_codes BYTEA[]
+        "idempotency_response_jsonb.sql",  # response_data JSONB
+        "audit_log_keyset_indexes.sql",  # audit_log (created_at, id) + actor/resource
+        "audit_log_partitioned.sql",     # audit_log particionada por mes (created_at)
+        "bets_keyset_index.sql",         # bets (user_id, placed_at, id) para keyset
+        "bets_pending_partial_index.sql",  # bets pendientes (índice parcial)
+        "games_team_ids.sql",  # games.home_team_id/away_team_id (trigger)
     ]
     
     print(f"\n📍 Conectando a base de datos...")
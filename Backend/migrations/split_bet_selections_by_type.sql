@@ -0,0 +1,79 @@
+-- ============================================================================
+-- MIGRACIÓN: espn.bet_selections dividida por tipo de apuesta
+-- ============================================================================
+-- bet_selections queda como tabla base (herencia joined-table en el ORM) con
+-- el discriminador bet_type_code; los datos de cada tipo pasan a su tabla:
+--   - bet_selections_moneyline (bet_id, team_id)
+--   - bet_selections_spread    (bet_id, team_id, spread_value)
+--   - bet_selections_total     (bet_id, over_under_value, is_over)
+-- Todas las columnas de las tablas hijas son NOT NULL; desaparece el CHECK
+-- chk_bet_selections_logic.
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE espn.bet_selections ADD COLUMN IF NOT EXISTS bet_type_code VARCHAR(20);
+
+UPDATE espn.bet_selections s
+SET bet_type_code = b.bet_type_code
+FROM espn.bets b
+WHERE b.id = s.bet_id AND s.bet_type_code IS NULL;
+
+ALTER TABLE espn.bet_selections ALTER COLUMN bet_type_code SET NOT NULL;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'bet_selections_bet_type_code_fkey') THEN
+        ALTER TABLE espn.bet_selections ADD CONSTRAINT bet_selections_bet_type_code_fkey
+            FOREIGN KEY (bet_type_code) REFERENCES espn.bet_types (code) ON DELETE RESTRICT;
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS espn.bet_selections_moneyline (
+    bet_id BIGINT PRIMARY KEY REFERENCES espn.bet_selections (bet_id) ON DELETE CASCADE,
+    team_id INTEGER NOT NULL REFERENCES espn.teams (team_id) ON DELETE RESTRICT
+);
+
+CREATE TABLE IF NOT EXISTS espn.bet_selections_spread (
+    bet_id BIGINT PRIMARY KEY REFERENCES espn.bet_selections (bet_id) ON DELETE CASCADE,
+    team_id INTEGER NOT NULL REFERENCES espn.teams (team_id) ON DELETE RESTRICT,
+    spread_value NUMERIC(10, 2) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS espn.bet_selections_total (
+    bet_id BIGINT PRIMARY KEY REFERENCES espn.bet_selections (bet_id) ON DELETE CASCADE,
+    over_under_value NUMERIC(10, 2) NOT NULL,
+    is_over BOOLEAN NOT NULL
+);
+
+-- Backfill desde las columnas dispersas (solo si aún existen)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'espn' AND table_name = 'bet_selections' AND column_name = 'selected_team_id'
+    ) THEN
+        INSERT INTO espn.bet_selections_moneyline (bet_id, team_id)
+        SELECT bet_id, selected_team_id FROM espn.bet_selections
+        WHERE bet_type_code = 'moneyline' AND selected_team_id IS NOT NULL
+        ON CONFLICT (bet_id) DO NOTHING;
+
+        INSERT INTO espn.bet_selections_spread (bet_id, team_id, spread_value)
+        SELECT bet_id, selected_team_id, spread_value FROM espn.bet_selections
+        WHERE bet_type_code = 'spread' AND selected_team_id IS NOT NULL AND spread_value IS NOT NULL
+        ON CONFLICT (bet_id) DO NOTHING;
+
+        INSERT INTO espn.bet_selections_total (bet_id, over_under_value, is_over)
+        SELECT bet_id, over_under_value, is_over FROM espn.bet_selections
+        WHERE bet_type_code = 'over_under' AND over_under_value IS NOT NULL AND is_over IS NOT NULL
+        ON CONFLICT (bet_id) DO NOTHING;
+    END IF;
+END $$;
+
+ALTER TABLE espn.bet_selections DROP CONSTRAINT IF EXISTS chk_bet_selections_logic;
+ALTER TABLE espn.bet_selections DROP COLUMN IF EXISTS selected_team_id;
+ALTER TABLE espn.bet_selections DROP COLUMN IF EXISTS spread_value;
+ALTER TABLE espn.bet_selections DROP COLUMN IF EXISTS over_under_value;
+ALTER TABLE espn.bet_selections DROP COLUMN IF EXISTS is_over;
+
+COMMIT;
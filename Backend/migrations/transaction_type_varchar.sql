@@ -0,0 +1,29 @@
+-- ============================================================================
+-- MIGRACIÓN: app.transactions.transaction_type como VARCHAR(24) + CHECK
+-- ============================================================================
+-- Reemplaza el ENUM nativo app.transaction_type (native_enum_types.sql): los
+-- valores ('bet_placed', ...) no cambian; TransactionType(str, Enum) en Python
+-- se escribe y compara como string sin coerción. Añadir un tipo nuevo es solo
+-- cambiar el CHECK (sin ALTER TYPE).
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'transactions'
+                 AND column_name = 'transaction_type' AND data_type = 'USER-DEFINED') THEN
+        ALTER TABLE app.transactions
+            ALTER COLUMN transaction_type TYPE VARCHAR(24) USING transaction_type::text;
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'chk_tx_type') THEN
+        ALTER TABLE app.transactions ADD CONSTRAINT chk_tx_type
+            CHECK (transaction_type IN ('bet_placed', 'bet_won', 'bet_lost', 'credit_purchase', 'admin_adjustment'));
+    END IF;
+END $$;
+
+DROP TYPE IF EXISTS app.transaction_type;
+
+COMMIT;
@@ -0,0 +1,27 @@
+-- ============================================================================
+-- MIGRACIÓN: índice de historial de créditos para paginación por keyset
+-- ============================================================================
+-- GET /users/credits/history pagina con
+--   WHERE user_id = :u AND (created_at, id) < (:ts, :id)
+--   ORDER BY created_at DESC, id DESC LIMIT :n
+-- ix_tx_user_created pasa de (user_id, created_at) a (user_id, created_at, id)
+-- para que el desempate por id también salga del índice (recorrido hacia atrás).
+-- Al ser un índice sobre la tabla particionada se propaga a cada partición.
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE schemaname = 'app' AND tablename = 'transactions'
+          AND indexname = 'ix_tx_user_created'
+          AND indexdef LIKE '%(user_id, created_at, id)%'
+    ) THEN
+        DROP INDEX IF EXISTS app.ix_tx_user_created;
+        CREATE INDEX ix_tx_user_created ON app.transactions(user_id, created_at, id);
+    END IF;
+END $$;
+
+COMMIT;
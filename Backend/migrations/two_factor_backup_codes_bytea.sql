@@ -0,0 +1,33 @@
+-- ============================================================================
+-- MIGRACIÓN: user_two_factor.backup_codes de TEXT (JSON) a BYTEA[]
+-- ============================================================================
+-- Antes: texto JSON con los SHA-256 en hexadecimal, parseado en Python en cada
+-- verificación. Ahora: array de digests crudos de 32 bytes; la verificación es
+-- `:hash = ANY(backup_codes)` y el consumo `array_remove(backup_codes, :hash)`.
+-- ALTER ... USING no admite subconsultas: se convierte vía columna temporal.
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'user_two_factor'
+                 AND column_name = 'backup_codes' AND data_type = 'text') THEN
+        ALTER TABLE app.user_two_factor ADD COLUMN backup_codes_bin BYTEA[];
+
+        UPDATE app.user_two_factor t
+        SET backup_codes_bin = (
+            SELECT array_agg(decode(h, 'hex'))
+            FROM json_array_elements_text(t.backup_codes::json) AS h
+        )
+        WHERE t.backup_codes IS NOT NULL AND t.backup_codes <> '';
+
+        ALTER TABLE app.user_two_factor DROP COLUMN backup_codes;
+        ALTER TABLE app.user_two_factor RENAME COLUMN backup_codes_bin TO backup_codes;
+    END IF;
+END $$;
+
+COMMENT ON COLUMN app.user_two_factor.backup_codes IS 'SHA-256 (32 bytes) de cada código de respaldo sin usar';
+
+COMMIT;
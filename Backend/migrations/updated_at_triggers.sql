@@ -0,0 +1,39 @@
+-- ============================================================================
+-- MIGRACIÓN: updated_at mantenido por trigger BEFORE UPDATE
+-- ============================================================================
+-- Reemplaza onupdate=func.now() de SQLAlchemy (que añade SET updated_at en
+-- cada flush). La función solo actualiza updated_at si otra columna cambió.
+-- Tablas nuevas: los modelos registran el mismo trigger con
+-- attach_updated_at_trigger() (app/core/database.py).
+-- ============================================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION app.trg_set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW IS DISTINCT FROM OLD THEN
+        NEW.updated_at = now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['espn.bets', 'espn.game_odds', 'espn.team_stats_game', 'app.providers', 'app.requests']
+    LOOP
+        IF to_regclass(t) IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE %s ALTER COLUMN updated_at SET DEFAULT now()', t);
+            EXECUTE format('DROP TRIGGER IF EXISTS set_updated_at ON %s', t);
+            EXECUTE format(
+                'CREATE TRIGGER set_updated_at BEFORE UPDATE ON %s FOR EACH ROW EXECUTE FUNCTION app.trg_set_updated_at()',
+                t
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+COMMIT;
@@ -0,0 +1,57 @@
+-- ============================================================================
+-- MIGRACIÓN: display_name / avatar_url copiados en app.user_accounts
+-- ============================================================================
+-- Los listados de usuarios leen user_accounts sin JOIN a clients/administrators/
+-- operators. La fuente de verdad sigue siendo la tabla del tipo de usuario; el
+-- trigger app.sync_user_profile copia los valores al insertar/actualizar el perfil.
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE app.user_accounts ADD COLUMN IF NOT EXISTS display_name VARCHAR(201);
+ALTER TABLE app.user_accounts ADD COLUMN IF NOT EXISTS avatar_url VARCHAR(500);
+
+CREATE OR REPLACE FUNCTION app.sync_user_profile()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE app.user_accounts
+    SET display_name = NULLIF(btrim(concat_ws(' ', NEW.first_name, NEW.last_name)), ''),
+        avatar_url = NEW.avatar_url
+    WHERE id = NEW.user_account_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['clients', 'administrators', 'operators'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS sync_user_profile ON app.%I', t);
+        EXECUTE format(
+            'CREATE TRIGGER sync_user_profile AFTER INSERT OR UPDATE OF first_name, last_name, avatar_url '
+            'ON app.%I FOR EACH ROW EXECUTE FUNCTION app.sync_user_profile()', t);
+    END LOOP;
+END $$;
+
+-- Backfill (misma prioridad que user_type: administrator > operator > client)
+UPDATE app.user_accounts ua
+SET display_name = NULLIF(btrim(concat_ws(' ', p.first_name, p.last_name)), ''),
+    avatar_url = p.avatar_url
+FROM (
+    SELECT user_account_id, first_name, last_name, avatar_url, 3 AS priority FROM app.clients
+    UNION ALL
+    SELECT user_account_id, first_name, last_name, avatar_url, 1 FROM app.administrators
+    UNION ALL
+    SELECT user_account_id, first_name, last_name, avatar_url, 2 FROM app.operators
+) p
+WHERE p.user_account_id = ua.id
+  AND p.priority = (
+      SELECT min(q.priority) FROM (
+          SELECT 3 AS priority FROM app.clients WHERE user_account_id = ua.id
+          UNION ALL SELECT 1 FROM app.administrators WHERE user_account_id = ua.id
+          UNION ALL SELECT 2 FROM app.operators WHERE user_account_id = ua.id
+      ) q
+  );
+
+COMMIT;
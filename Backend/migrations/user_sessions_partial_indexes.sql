@@ -0,0 +1,24 @@
+-- ============================================================================
+-- MIGRACIÓN: índices parciales para app.user_sessions
+-- ============================================================================
+-- - idx_sessions_token_active: WHERE token_hash = ? AND is_active (auth check)
+-- - idx_sessions_user_active_created: sesiones activas del usuario por created_at
+-- Se eliminan los índices de una sola columna redundantes (token_hash, is_active)
+-- y el duplicado de user_account_id creado por index=True.
+-- ============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_sessions_token_active
+    ON app.user_sessions(token_hash) WHERE is_active;
+
+CREATE INDEX IF NOT EXISTS idx_sessions_user_active_created
+    ON app.user_sessions(user_account_id, created_at) WHERE is_active;
+
+DROP INDEX IF EXISTS app.idx_user_sessions_token_hash;
+DROP INDEX IF EXISTS app.idx_user_sessions_is_active;
+DROP INDEX IF EXISTS app.ix_app_user_sessions_token_hash;
+DROP INDEX IF EXISTS app.ix_app_user_sessions_is_active;
+DROP INDEX IF EXISTS app.ix_app_user_sessions_user_account_id;
+
+COMMIT;
@@ -0,0 +1,25 @@
+-- ============================================================================
+-- MIGRACIÓN: app.user_sessions.token_hash como BYTEA (digest SHA-256 crudo)
+-- ============================================================================
+-- VARCHAR(64) hex -> BYTEA de 32 bytes: la mitad de tamaño en la tabla y en
+-- idx_sessions_token_active (se reconstruye con el ALTER TYPE).
+-- ============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = 'app' AND table_name = 'user_sessions'
+                 AND column_name = 'token_hash' AND data_type <> 'bytea') THEN
+        ALTER TABLE app.user_sessions
+            ALTER COLUMN token_hash TYPE BYTEA USING decode(token_hash, 'hex');
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'chk_user_sessions_token_hash_len') THEN
+        ALTER TABLE app.user_sessions ADD CONSTRAINT chk_user_sessions_token_hash_len
+            CHECK (octet_length(token_hash) = 32);
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,63 @@
+-- ============================================================================
+-- MIGRACIÓN: columna discriminadora app.user_accounts.user_type
+-- ============================================================================
+-- Guarda la tabla de perfil del usuario ('client' | 'administrator' | 'operator')
+-- para no consultar las tres tablas en cada acceso. Los triggers AFTER INSERT /
+-- AFTER DELETE de clients/administrators/operators la mantienen (también al mover
+-- un usuario de tabla: se borra el perfil viejo y se inserta el nuevo). NULL si el
+-- usuario no tiene perfil (como el antiguo get_user_current_table).
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE app.user_accounts ADD COLUMN IF NOT EXISTS user_type VARCHAR(16);
+
+-- Backfill (misma prioridad que UserTypeService: administrator > operator > client);
+-- usuarios sin perfil quedan en NULL
+ALTER TABLE app.user_accounts ALTER COLUMN user_type DROP NOT NULL;
+ALTER TABLE app.user_accounts ALTER COLUMN user_type DROP DEFAULT;
+
+UPDATE app.user_accounts ua
+SET user_type = CASE
+    WHEN EXISTS (SELECT 1 FROM app.administrators a WHERE a.user_account_id = ua.id) THEN 'administrator'
+    WHEN EXISTS (SELECT 1 FROM app.operators o WHERE o.user_account_id = ua.id) THEN 'operator'
+    WHEN EXISTS (SELECT 1 FROM app.clients c WHERE c.user_account_id = ua.id) THEN 'client'
+END;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'chk_user_accounts_user_type') THEN
+        ALTER TABLE app.user_accounts ADD CONSTRAINT chk_user_accounts_user_type
+            CHECK (user_type IN ('client', 'administrator', 'operator'));
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS ix_app_user_accounts_user_type ON app.user_accounts(user_type);
+
+CREATE OR REPLACE FUNCTION app.sync_user_type()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE app.user_accounts SET user_type = NULL
+        WHERE id = OLD.user_account_id AND user_type = TG_ARGV[0];
+    ELSE
+        UPDATE app.user_accounts SET user_type = TG_ARGV[0]
+        WHERE id = NEW.user_account_id AND user_type IS DISTINCT FROM TG_ARGV[0];
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sync_user_type ON app.clients;
+CREATE TRIGGER sync_user_type AFTER INSERT OR DELETE ON app.clients
+    FOR EACH ROW EXECUTE FUNCTION app.sync_user_type('client');
+
+DROP TRIGGER IF EXISTS sync_user_type ON app.administrators;
+CREATE TRIGGER sync_user_type AFTER INSERT OR DELETE ON app.administrators
+    FOR EACH ROW EXECUTE FUNCTION app.sync_user_type('administrator');
+
+DROP TRIGGER IF EXISTS sync_user_type ON app.operators;
+CREATE TRIGGER sync_user_type AFTER INSERT OR DELETE ON app.operators
+    FOR EACH ROW EXECUTE FUNCTION app.sync_user_type('operator');
+
+COMMIT;
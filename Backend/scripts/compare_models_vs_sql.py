@@ -20,12 +20,10 @@ from app.core.database import sys_engine, espn_engine, SysBase, EspnBase
 
 # Importar todos los modelos
 from app.models.user_accounts import UserAccount, Client, Administrator, Operator
-from app.models.user import User
 from app.models.role import Role
 from app.models.permission import Permission
 from app.models.role_permission import RolePermission
 from app.models.user_role import UserRole
-from app.models.bet import Bet  # Legacy bet
 from app.models.transaction import Transaction
 from app.models.idempotency_key import IdempotencyKey
 from app.models.request import Request
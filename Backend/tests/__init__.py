@@ -0,0 +1,15 @@
+"""
+Valores de configuración de prueba: app.core.config exige las credenciales de la
+base de datos al importarse. Los tests no se conectan a Neon, así que bastan
+valores ficticios (las variables ya definidas en el entorno o en .env tienen prioridad).
+"""
+
+import os
+
+for _name, _value in {
+    "NEON_DB_HOST": "localhost", "NEON_DB_NAME": "test", "NEON_DB_USER": "test", "NEON_DB_PASSWORD": "test",
+    "DB_HOST": "localhost", "DB_NAME": "test", "DB_USER": "test", "DB_PASSWORD": "test",
+    "NBA_DB_HOST": "localhost", "NBA_DB_NAME": "test", "NBA_DB_USER": "test", "NBA_DB_PASSWORD": "test",
+    "SECRET_KEY": "test-secret-key", "ALGORITHM": "HS256", "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+}.items():
+    os.environ.setdefault(_name, _value)
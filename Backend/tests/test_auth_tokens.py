@@ -0,0 +1,60 @@
+"""
+Tests del firmante HS* de app/services/auth_service.py (create_access_token).
+
+El token se firma con hmac + orjson sin pasar por jose; debe seguir siendo un
+JWT estándar que jose.jwt.decode acepte y que verify_token resuelva.
+
+Ejecutar:
+    cd Backend
+    python -m unittest tests.test_auth_tokens -v
+"""
+
+import os
+import sys
+import time
+import unittest
+from datetime import timedelta
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from jose import jwt  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.services.auth_service import create_access_token, verify_token  # noqa: E402
+
+
+class TestCreateAccessToken(unittest.TestCase):
+
+    def test_round_trips_through_jose(self):
+        token = create_access_token({"sub": "alice", "role": "client"})
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        self.assertEqual(payload["sub"], "alice")
+        self.assertEqual(payload["role"], "client")
+        self.assertIsInstance(payload["exp"], int)
+
+    def test_header_matches_algorithm(self):
+        token = create_access_token({"sub": "alice"})
+        self.assertEqual(jwt.get_unverified_header(token), {"alg": settings.ALGORITHM, "typ": "JWT"})
+
+    def test_expiration_uses_expires_delta(self):
+        token = create_access_token({"sub": "alice"}, expires_delta=timedelta(minutes=5))
+        exp = jwt.get_unverified_claims(token)["exp"]
+        self.assertAlmostEqual(exp, time.time() + 300, delta=5)
+
+    def test_verify_token_returns_subject(self):
+        self.assertEqual(verify_token(create_access_token({"sub": "bob"})), "bob")
+
+    def test_tampered_signature_rejected(self):
+        token = create_access_token({"sub": "carol"})
+        signing_input, signature = token.rsplit(".", 1)
+        forged = signing_input + "." + ("A" if signature[0] != "A" else "B") + signature[1:]
+        self.assertIsNone(verify_token(forged))
+
+    def test_expired_token_rejected(self):
+        token = create_access_token({"sub": "dave"}, expires_delta=timedelta(seconds=-10))
+        self.assertIsNone(verify_token(token))
+
+
+if __name__ == "__main__":
+    unittest.main()
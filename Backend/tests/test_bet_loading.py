@@ -0,0 +1,186 @@
+"""
+Tests de carga de apuestas en app/services/bet_service.py.
+
+get_bet_by_id y get_user_bets cargan selection/result con joinedload y el resto
+de relaciones con raiseload("*"): leer la selección o el resultado no emite
+SQL, y cualquier otra relación falla en vez de generar un SELECT por fila.
+
+No requieren conexión a Neon: las tablas de apuestas se crean en SQLite en
+memoria (esquema espn adjuntado con ATTACH) con las mismas columnas que el
+modelo, y BetService usa una sesión síncrona envuelta en la interfaz async.
+
+Ejecutar:
+    cd Backend
+    python -m unittest tests.test_bet_loading -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+from sqlalchemy.exc import InvalidRequestError  # noqa: E402
+from sqlalchemy.orm import Session, configure_mappers  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import app.models  # noqa: E402,F401  (registra todos los mappers)
+from app.models.espn_bet import (  # noqa: E402
+    Bet, BetSelection, BetSelectionMoneyline, BetSelectionSpread, BetSelectionTotal, BetResult,
+)
+from app.services.bet_service import BetService  # noqa: E402
+
+_TABLES = (
+    Bet.__table__, BetSelection.__table__, BetSelectionMoneyline.__table__,
+    BetSelectionSpread.__table__, BetSelectionTotal.__table__, BetResult.__table__,
+)
+
+
+def _create_engine(tables=_TABLES):
+    """SQLite en memoria con los esquemas espn y app; tablas con las columnas del modelo
+    (sin tipos ni DDL de Postgres: columnas generadas, triggers, índices INCLUDE)"""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _attach_schemas(dbapi_connection, _record):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS espn")
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS app")
+
+    with engine.begin() as conn:
+        for table in tables:
+            columns = ", ".join(column.name for column in table.columns)
+            conn.exec_driver_sql(f"CREATE TABLE {table.schema}.{table.name} ({columns})")
+    return engine
+
+
+class _AsyncSessionAdapter:
+    """Interfaz async que usa BetService (scalars/execute/scalar) sobre una Session síncrona"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def scalars(self, statement, params=None):
+        return self.session.scalars(statement, params)
+
+    async def execute(self, statement, params=None):
+        return self.session.execute(statement, params)
+
+    async def scalar(self, statement, params=None):
+        return self.session.scalar(statement, params)
+
+
+def _bet_row(bet_id, user_id, placed_at, **overrides):
+    row = dict(
+        id=bet_id, user_id=user_id, game_id=1, bet_type_code="moneyline", bet_status_code="pending",
+        bet_amount_cents=1000, odds_id=None, odds_value_e4=19000, potential_payout_cents=1900,
+        bet_type_name="Moneyline", bet_status_name="Pending", home_team_snapshot="Lakers",
+        away_team_snapshot="Celtics", game_date_snapshot=None, placed_at=placed_at,
+        settled_at=None, updated_at=placed_at,
+    )
+    row.update(overrides)
+    return row
+
+
+class BetLoadingTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        configure_mappers()
+        cls.engine = _create_engine()
+        now = datetime(2025, 1, 10, 12, 0, 0)
+        with cls.engine.begin() as conn:
+            conn.execute(insert(Bet.__table__), [
+                _bet_row(1, 7, now - timedelta(hours=3)),
+                _bet_row(2, 7, now - timedelta(hours=2), bet_type_code="over_under",
+                         bet_status_code="won", settled_at=now),
+                _bet_row(3, 7, now - timedelta(hours=1)),
+                _bet_row(4, 8, now),
+            ])
+            conn.execute(insert(BetSelection.__table__), [
+                dict(id=1, bet_id=1, bet_type_code="moneyline", created_at=now),
+                dict(id=2, bet_id=2, bet_type_code="over_under", created_at=now),
+            ])
+            conn.execute(insert(BetSelectionMoneyline.__table__), [dict(bet_id=1, team_id=13)])
+            conn.execute(insert(BetSelectionTotal.__table__), [dict(bet_id=2, over_under_value=220.5, is_over=True)])
+            conn.execute(insert(BetResult.__table__), [
+                dict(id=1, bet_id=2, actual_payout_cents=1900, result_notes=None, settled_at=now),
+            ])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.session = Session(self.engine)
+        self.service = BetService(_AsyncSessionAdapter(self.session))
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        self.session.close()
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _run(self, coroutine):
+        return asyncio.run(coroutine)
+
+
+class TestGetBetById(BetLoadingTestCase):
+
+    def test_selection_and_result_loaded_in_one_query(self):
+        bet = self._run(self.service.get_bet_by_id(2, 7))
+        self.assertEqual(len(self.statements), 1)
+        self.assertIsInstance(bet.selection, BetSelectionTotal)
+        self.assertTrue(bet.selection.is_over)
+        self.assertEqual(bet.result.actual_payout_cents, 1900)
+        self.assertEqual(len(self.statements), 1)  # Sin lazy loads al leer las relaciones
+
+    def test_missing_relations_are_none_without_sql(self):
+        bet = self._run(self.service.get_bet_by_id(3, 7))
+        self.assertIsNone(bet.selection)
+        self.assertIsNone(bet.result)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_other_relationships_raise(self):
+        bet = self._run(self.service.get_bet_by_id(1, 7))
+        for relationship in ("game", "bet_type", "bet_status", "odds"):
+            with self.subTest(relationship=relationship), self.assertRaises(InvalidRequestError):
+                getattr(bet, relationship)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_other_users_bet_not_returned(self):
+        self.assertIsNone(self._run(self.service.get_bet_by_id(4, 7)))
+
+
+class TestGetUserBets(BetLoadingTestCase):
+
+    def test_page_loads_relations_in_one_query(self):
+        bets = self._run(self.service.get_user_bets(7))
+        self.assertEqual([bet.id for bet in bets], [3, 2, 1])
+        selections = {bet.id: bet.selection for bet in bets}
+        self.assertIsNone(selections[3])
+        self.assertEqual(selections[1].selected_team_id, 13)
+        self.assertEqual(bets[1].result.actual_payout_cents, 1900)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_lazy_relationship_raises(self):
+        bets = self._run(self.service.get_user_bets(7, status="pending"))
+        self.assertEqual([bet.id for bet in bets], [3, 1])
+        with self.assertRaises(InvalidRequestError):
+            bets[0].game
+
+    def test_keyset_cursor_continues_after_last_bet(self):
+        first_page = self._run(self.service.get_user_bets(7, limit=2))
+        last = first_page[-1]
+        next_page = self._run(self.service.get_user_bets(7, limit=2, cursor=(last.placed_at, last.id)))
+        self.assertEqual([bet.id for bet in first_page + next_page], [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
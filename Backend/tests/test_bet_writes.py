@@ -0,0 +1,317 @@
+"""
+Tests de las escrituras de app/services/bet_service.py y user_service.credit_delta_statement.
+
+- _claim_pending_bet: UPDATE ... WHERE pendiente RETURNING; de dos reclamos solo uno gana.
+- credit_delta_statement: UPDATE guardado (saldo no negativo) RETURNING credits.
+- _insert_bet: una sola sentencia con CTEs de escritura (compilada para Postgres).
+- place_bet / cancel_bet / settle_bet: los movimientos del ledger cumplen exactamente
+  balance_before + amount = balance_after (chk_tx_balance) en Decimal con centavos, y el
+  monto descontado coincide con bet_amount_cents.
+
+El reclamo y el saldo se prueban en SQLite en memoria; el flujo completo usa sesiones
+falsas y un saldo que redondea como NUMERIC(12,2).
+
+Ejecutar:
+    cd Backend
+    python -m unittest tests.test_bet_writes -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from unittest import mock
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import app.models  # noqa: E402,F401  (registra todos los mappers)
+from app.models.espn_bet import Bet, to_fixed_point  # noqa: E402
+from app.models.transaction import Transaction, TransactionType  # noqa: E402
+from app.models.user_accounts import Client  # noqa: E402
+from app.schemas.bet import BetCreate  # noqa: E402
+from app.services.bet_service import BetService  # noqa: E402
+from app.services.user_service import credit_delta_statement  # noqa: E402
+from tests.test_bet_loading import _AsyncSessionAdapter, _bet_row, _create_engine  # noqa: E402
+
+_CENT = Decimal("0.01")
+
+
+class TestClaimPendingBet(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = _create_engine((Bet.__table__,))
+        with self.engine.begin() as conn:
+            conn.execute(insert(Bet.__table__), [_bet_row(1, 7, datetime(2025, 1, 10, 12, 0, 0))])
+        self.session = Session(self.engine)
+        self.service = BetService(_AsyncSessionAdapter(self.session))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _claim(self, status, user_id=None):
+        return asyncio.run(self.service._claim_pending_bet(1, status, Bet.bet_amount_cents, user_id=user_id))
+
+    def test_second_claim_finds_no_pending_row(self):
+        self.assertEqual(self._claim("cancelled", user_id=7).bet_amount_cents, 1000)
+        self.assertIsNone(self._claim("won"))
+        row = self.session.execute(select(Bet.bet_status_code, Bet.settled_at)).one()
+        self.assertEqual(row.bet_status_code, "cancelled")
+        self.assertIsNotNone(row.settled_at)
+
+    def test_other_users_claim_is_rejected(self):
+        self.assertIsNone(self._claim("cancelled", user_id=8))
+        self.assertEqual(self.session.scalar(select(Bet.bet_status_code)), "pending")
+
+
+class TestCreditDeltaStatement(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = _create_engine((Client.__table__,))
+        with self.engine.begin() as conn:
+            conn.execute(insert(Client.__table__).values(id=1, user_account_id=7, credits=Decimal("10.00")))
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_guard_rejects_overdraft_without_writing(self):
+        with self.engine.begin() as conn:
+            self.assertEqual(conn.execute(credit_delta_statement(7, Decimal("-3.33"))).scalar_one(), Decimal("6.67"))
+            self.assertIsNone(conn.execute(credit_delta_statement(7, Decimal("-6.68"))).scalar_one_or_none())
+            self.assertEqual(conn.execute(select(Client.credits)).scalar(), Decimal("6.67"))
+
+    def test_unknown_client_returns_no_row(self):
+        with self.engine.begin() as conn:
+            self.assertIsNone(conn.execute(credit_delta_statement(99, 1)).scalar_one_or_none())
+
+    def test_postgres_statement_is_guarded_and_exact(self):
+        compiled = credit_delta_statement(7, 0.1).compile(dialect=postgresql.dialect())
+        sql = " ".join(str(compiled).split())
+        self.assertIn("SET credits=(app.clients.credits + %(credits_1)s)", sql)
+        self.assertIn("app.clients.credits + %(credits_2)s >= %(param_1)s", sql)
+        self.assertTrue(sql.endswith("RETURNING app.clients.credits"))
+        # El delta se convierte vía str: 0.1 se envía como Decimal('0.1'), no como el binario del float
+        self.assertEqual(compiled.params["credits_1"], Decimal("0.1"))
+
+
+class _Result:
+    def __init__(self, row=None):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+    def one(self):
+        return self._row
+
+
+class _FakeSession:
+    """AsyncSession mínima: registra las sentencias y responde con filas preparadas"""
+
+    def __init__(self, scalar=None, execute_rows=()):
+        self.scalar_value = scalar
+        self.execute_rows = list(execute_rows)
+        self.statements = []
+        self.added = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        return _Result(self.execute_rows.pop(0) if self.execute_rows else None)
+
+    async def scalar(self, statement, params=None):
+        return self.scalar_value
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class _Wallet:
+    """Saldo de un cliente con la semántica de credit_delta_statement sobre NUMERIC(12,2)"""
+
+    def __init__(self, balance):
+        self.balance = Decimal(balance)
+
+    async def apply(self, user_id, delta, commit=True):
+        new_balance = (self.balance + Decimal(str(delta))).quantize(_CENT, rounding=ROUND_HALF_UP)
+        if new_balance < 0:
+            return None
+        self.balance = new_balance
+        return new_balance
+
+
+Claimed = namedtuple("Claimed", "user_id bet_amount_cents potential_payout_cents")
+
+
+class LedgerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = []
+
+        async def capture(session, rows):
+            self.rows.extend(rows)
+            return len(rows)
+
+        patcher = mock.patch.object(Transaction, "bulk_insert_async", side_effect=capture)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _service(self, wallet, claimed=None, single_session=False):
+        sys_db = _FakeSession(scalar=wallet.balance)
+        service = BetService(sys_db, sys_db if single_session else _FakeSession())
+        service._apply_credit_delta = wallet.apply
+        if claimed is not None:
+            async def claim(*args, **kwargs):
+                return claimed
+            service._claim_pending_bet = claim
+        return service
+
+    def assertLedgerRow(self, row, transaction_type, amount, balance_after):
+        self.assertEqual(row["transaction_type"], transaction_type)
+        for key in ("amount", "balance_before", "balance_after"):
+            self.assertIsInstance(row[key], Decimal, key)
+            self.assertEqual(row[key], row[key].quantize(_CENT), f"{key} must be whole cents")
+        self.assertEqual(row["amount"], amount)
+        self.assertEqual(row["balance_after"], balance_after)
+        # chk_tx_balance es una igualdad exacta
+        self.assertEqual(row["balance_before"] + row["amount"], row["balance_after"])
+
+
+class TestPlaceBetLedger(LedgerTestCase):
+
+    def _place(self, bet_amount, single_session=False):
+        wallet = _Wallet("100.00")
+        service = self._service(wallet, single_session=single_session)
+        captured = {}
+
+        async def insert_bet(bet_values, selection_values=None, transaction_values=None):
+            captured.update(bet_values=bet_values, transaction_values=transaction_values)
+            return Bet(id=1, **bet_values)
+
+        service._insert_bet = insert_bet
+        bet = BetCreate(
+            game_id=1, bet_type="moneyline", bet_amount=bet_amount, odds=1.9123456,
+            potential_payout=Decimal(str(bet_amount)) * Decimal("1.9123456"),
+        )
+        asyncio.run(service.place_bet(bet, user_id=7))
+        return wallet, captured
+
+    def test_split_stake_is_charged_stored_and_recorded_in_cents(self):
+        # El frontend divide el stake entre las apuestas del cupón: 10 / 3
+        wallet, captured = self._place(10 / 3)
+        self.assertEqual(wallet.balance, Decimal("96.67"))
+        self.assertEqual(captured["bet_values"]["bet_amount_cents"], 333)
+        self.assertEqual(captured["bet_values"]["odds_value_e4"], to_fixed_point(Decimal("1.9123456"), 10_000))
+        self.assertEqual(len(self.rows), 1)
+        self.assertLedgerRow(self.rows[0], TransactionType.BET_PLACED, Decimal("-3.33"), Decimal("96.67"))
+        self.assertEqual(self.rows[0]["bet_id"], 1)
+
+    def test_half_cent_stake_rounds_like_to_fixed_point(self):
+        wallet, captured = self._place("2.005")
+        self.assertEqual(captured["bet_values"]["bet_amount_cents"], 201)
+        self.assertEqual(Decimal("100.00") - wallet.balance, Decimal("2.01"))
+        self.assertLedgerRow(self.rows[0], TransactionType.BET_PLACED, Decimal("-2.01"), Decimal("97.99"))
+
+    def test_single_session_writes_ledger_row_in_the_bet_statement(self):
+        _, captured = self._place("5.50", single_session=True)
+        self.assertEqual(self.rows, [])  # Va en el CTE de _insert_bet, no en un INSERT aparte
+        self.assertLedgerRow(
+            captured["transaction_values"], TransactionType.BET_PLACED, Decimal("-5.50"), Decimal("94.50")
+        )
+
+
+class TestCancelAndSettleLedger(LedgerTestCase):
+
+    def test_cancel_refunds_exact_stake(self):
+        wallet = _Wallet("96.67")
+        service = self._service(wallet, claimed=Claimed(7, 333, None))
+        self.assertTrue(asyncio.run(service.cancel_bet(1, 7)))
+        self.assertEqual(wallet.balance, Decimal("100.00"))
+        self.assertLedgerRow(self.rows[0], TransactionType.ADMIN_ADJUSTMENT, Decimal("3.33"), Decimal("100.00"))
+
+    def test_settle_won_pays_exact_payout(self):
+        wallet = _Wallet("96.67")
+        service = self._service(wallet, claimed=Claimed(7, 333, 637))
+        self.assertTrue(asyncio.run(service.settle_bet(1, won=True)))
+        self.assertEqual(wallet.balance, Decimal("103.04"))
+        self.assertLedgerRow(self.rows[0], TransactionType.BET_WON, Decimal("6.37"), Decimal("103.04"))
+
+    def test_settle_lost_records_zero_movement(self):
+        wallet = _Wallet("96.67")
+        service = self._service(wallet, claimed=Claimed(7, 333, 637))
+        self.assertTrue(asyncio.run(service.settle_bet(1, won=False)))
+        self.assertEqual(wallet.balance, Decimal("96.67"))
+        self.assertLedgerRow(self.rows[0], TransactionType.BET_LOST, Decimal("0"), Decimal("96.67"))
+
+    def test_claim_lost_to_another_operation_writes_nothing(self):
+        wallet = _Wallet("96.67")
+        service = self._service(wallet, claimed=None)
+
+        async def claim(*args, **kwargs):
+            return None
+
+        service._claim_pending_bet = claim
+        self.assertFalse(asyncio.run(service.cancel_bet(1, 7)))
+        self.assertFalse(asyncio.run(service.settle_bet(1, won=True)))
+        self.assertEqual(wallet.balance, Decimal("96.67"))
+        self.assertEqual(self.rows, [])
+
+
+class TestInsertBetStatement(unittest.TestCase):
+    """_insert_bet: apuesta, selección y movimiento en una sola sentencia (CTEs de escritura)"""
+
+    def _compile(self, selection_values, transaction_values=None):
+        espn_db = _FakeSession(execute_rows=[(Bet(id=1, user_id=7, bet_type_code="moneyline"), 10, datetime(2025, 1, 1))])
+        service = BetService(_FakeSession(), espn_db)
+        bet = asyncio.run(service._insert_bet(
+            dict(user_id=7, game_id=1, bet_type_code="moneyline", bet_status_code="pending",
+                 bet_amount_cents=333, odds_value_e4=19123),
+            selection_values,
+            transaction_values,
+        ))
+        self.assertEqual(len(espn_db.statements), 1)
+        sql = " ".join(str(espn_db.statements[0].compile(dialect=postgresql.dialect())).split())
+        return bet, espn_db, sql
+
+    def test_bet_and_selection_in_one_statement(self):
+        bet, espn_db, sql = self._compile({"selected_team_id": 13})
+        self.assertTrue(sql.startswith("WITH b AS (INSERT INTO espn.bets"))
+        # El orden de los CTEs no importa: todos ven el mismo snapshot y las FK se comprueban al final
+        self.assertIn("s AS (INSERT INTO espn.bet_selections (bet_id, bet_type_code) SELECT b.id AS id, "
+                      "b.bet_type_code AS bet_type_code FROM b RETURNING", sql)
+        self.assertIn("sc AS (INSERT INTO espn.bet_selections_moneyline (bet_id, team_id) SELECT b.id AS id", sql)
+        self.assertTrue(sql.endswith("FROM b, s"))
+        self.assertNotIn("app.transactions", sql)
+        # La selección queda adjunta sin lazy load
+        self.assertEqual(bet.selection.selected_team_id, 13)
+        self.assertEqual(bet.selection.id, 10)
+        self.assertIsNone(bet.result)
+        self.assertEqual(espn_db.added, [bet.selection])
+
+    def test_ledger_row_joins_the_statement_with_a_shared_session(self):
+        _, _, sql = self._compile(None, dict(
+            user_id=7, transaction_type=TransactionType.BET_PLACED, amount=Decimal("-3.33"),
+            balance_before=Decimal("100.00"), balance_after=Decimal("96.67"), description="Bet placed",
+        ))
+        self.assertIn("t AS (INSERT INTO app.transactions (bet_id, user_id, transaction_type, amount, "
+                      "balance_before, balance_after, description) SELECT b.id AS id", sql)
+        self.assertNotIn("bet_selections", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Tests de app/core/partitions.py (creación y retención de particiones mensuales).
+
+drop_expired_partitions deduce el mes de cada partición a partir de su nombre
+(<tabla>_YYYY_MM); _create_month_partition mueve las filas del mes que ya
+estén en la partición DEFAULT. Se prueba con una conexión falsa que responde a
+las consultas de catálogo y registra el SQL emitido.
+
+Ejecutar:
+    cd Backend
+    python -m unittest tests.test_partitions -v
+"""
+
+import os
+import sys
+import unittest
+from datetime import date
+from unittest import mock
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from app.core import partitions  # noqa: E402
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalar(self):
+        return self._rows[0] if self._rows else None
+
+    def scalars(self):
+        return iter(self._rows)
+
+
+class _FakeConnection:
+    """Tabla particionada con las particiones hijas dadas; guarda el SQL ejecutado"""
+
+    def __init__(self, children=(), default_has_rows=False):
+        self.children = children
+        self.default_has_rows = default_has_rows
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "pg_partitioned_table" in sql:
+            return _Result([1])
+        if "pg_inherits" in sql:
+            return _Result(list(self.children))
+        if "to_regclass" in sql:
+            exists = params["name"].split(".", 1)[1] in self.children
+            return _Result([params["name"]] if exists else [])
+        if "SELECT EXISTS" in sql:
+            return _Result([self.default_has_rows])
+        return _Result([])
+
+    @property
+    def drops(self):
+        return [sql for sql in self.statements if sql.startswith("DROP TABLE")]
+
+
+class TestDropExpiredPartitions(unittest.TestCase):
+
+    def _drop(self, children, today, days=365):
+        conn = _FakeConnection(children)
+        with mock.patch.dict(partitions.RETENTION_DAYS, {("app", "audit_log"): days}, clear=True):
+            dropped = partitions.drop_expired_partitions(conn, today=today)
+        return dropped, conn
+
+    def test_drops_months_that_ended_before_cutoff(self):
+        # Corte: 2025-06-15 - 365 días = 2024-06-15; 2024_05 terminó el 2024-06-01
+        dropped, conn = self._drop(
+            ["audit_log_2024_04", "audit_log_2024_05", "audit_log_2024_06", "audit_log_2025_06"],
+            today=date(2025, 6, 15),
+        )
+        self.assertEqual(dropped, ["app.audit_log_2024_04", "app.audit_log_2024_05"])
+        self.assertEqual(conn.drops, [
+            "DROP TABLE IF EXISTS app.audit_log_2024_04",
+            "DROP TABLE IF EXISTS app.audit_log_2024_05",
+        ])
+
+    def test_keeps_partition_containing_cutoff(self):
+        dropped, _ = self._drop(["audit_log_2024_06"], today=date(2025, 6, 15))
+        self.assertEqual(dropped, [])
+
+    def test_december_partition_ends_next_year(self):
+        dropped, _ = self._drop(["audit_log_2023_12"], today=date(2025, 1, 1))
+        self.assertEqual(dropped, ["app.audit_log_2023_12"])
+
+    def test_ignores_default_and_unrelated_names(self):
+        dropped, conn = self._drop(
+            ["audit_log_default", "audit_log_old", "audit_log_20x4_01"],
+            today=date(2030, 1, 1),
+        )
+        self.assertEqual(dropped, [])
+        self.assertEqual(conn.drops, [])
+
+    def test_zero_retention_disables_dropping(self):
+        dropped, conn = self._drop(["audit_log_2000_01"], today=date(2030, 1, 1), days=0)
+        self.assertEqual(dropped, [])
+        self.assertEqual(conn.statements, [])
+
+
+class TestPartitionsByDatabase(unittest.TestCase):
+    """espn.game_odds vive en NBA_DATABASE_URL: cada conexión solo toca las tablas de su base"""
+
+    def _defaults(self, database):
+        conn = _FakeConnection()
+        partitions.ensure_monthly_partitions(conn, database, months_ahead=0)
+        return [
+            sql.split()[5] for sql in conn.statements
+            if sql.startswith("CREATE TABLE IF NOT EXISTS") and sql.endswith(" DEFAULT")
+        ]
+
+    def test_espn_connection_only_handles_game_odds(self):
+        self.assertEqual(self._defaults("espn"), ["espn.game_odds_default"])
+
+    def test_app_connection_skips_espn_tables(self):
+        self.assertEqual(self._defaults("app"), [
+            "app.odds_lines_default", "app.transactions_default", "app.audit_log_default",
+        ])
+
+    def test_retention_only_applies_to_own_database(self):
+        conn = _FakeConnection(["audit_log_2000_01"])
+        with mock.patch.dict(partitions.RETENTION_DAYS, {("app", "audit_log"): 30}, clear=True):
+            self.assertEqual(partitions.drop_expired_partitions(conn, "espn", today=date(2030, 1, 1)), [])
+            self.assertEqual(
+                partitions.drop_expired_partitions(conn, "app", today=date(2030, 1, 1)),
+                ["app.audit_log_2000_01"],
+            )
+
+
+class TestCreateMonthPartition(unittest.TestCase):
+
+    def _create(self, conn):
+        partitions._create_month_partition(conn, "app", "audit_log", "created_at", date(2025, 3, 1))
+        return [sql for sql in conn.statements if not sql.lstrip().startswith("SELECT")]
+
+    def test_existing_partition_is_left_alone(self):
+        conn = _FakeConnection(["audit_log_2025_03"], default_has_rows=True)
+        self.assertEqual(self._create(conn), [])
+
+    def test_creates_partition_when_default_has_no_rows(self):
+        statements = self._create(_FakeConnection())
+        self.assertEqual(statements, [
+            "CREATE TABLE app.audit_log_2025_03 PARTITION OF app.audit_log "
+            "FOR VALUES FROM ('2025-03-01') TO ('2025-04-01')",
+        ])
+
+    def test_moves_default_rows_into_new_partition(self):
+        statements = self._create(_FakeConnection(default_has_rows=True))
+        self.assertEqual(len(statements), 4)
+        self.assertEqual(statements[0], "ALTER TABLE app.audit_log DETACH PARTITION app.audit_log_default")
+        self.assertTrue(statements[1].startswith("CREATE TABLE app.audit_log_2025_03 PARTITION OF app.audit_log"))
+        self.assertIn("DELETE FROM app.audit_log_default WHERE created_at >= :start AND created_at < :end", statements[2])
+        self.assertIn("INSERT INTO app.audit_log_2025_03 SELECT * FROM moved", statements[2])
+        self.assertEqual(statements[3], "ALTER TABLE app.audit_log ATTACH PARTITION app.audit_log_default DEFAULT")
+
+
+class TestAddMonths(unittest.TestCase):
+
+    def test_rolls_over_year(self):
+        self.assertEqual(partitions._add_months(date(2024, 11, 1), 2), date(2025, 1, 1))
+        self.assertEqual(partitions._add_months(date(2024, 12, 1), 1), date(2025, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
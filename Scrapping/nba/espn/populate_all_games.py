@@ -155,16 +155,12 @@ def get_existing_game_ids(engine, espn_schema: str) -> set[str]:
 
 
 def insert_game(conn, espn_schema: str, g: dict):
-    """Inserta un partido nuevo en espn.games."""
-    home_win = None
-    if g["completed"] and g["home_score"] > 0:
-        home_win = 1 if g["home_score"] > g["away_score"] else 0
-
+    """Inserta un partido nuevo en espn.games (home_win/point_diff son columnas generadas)."""
     conn.execute(text(f"""
         INSERT INTO {espn_schema}.games
-            (game_id, fecha, home_team, away_team, home_score, away_score, home_win, game_type)
+            (game_id, fecha, home_team, away_team, home_score, away_score, game_type)
         VALUES
-            (:gid, :fecha, :ht, :at, :hs, :as_, :hw, :gt)
+            (:gid, :fecha, :ht, :at, :hs, :as_, :gt)
         ON CONFLICT (game_id) DO NOTHING
     """), {
         "gid":   g["game_id"],
@@ -173,7 +169,6 @@ def insert_game(conn, espn_schema: str, g: dict):
         "at":    g["away_team"],
         "hs":    g["home_score"] if g["completed"] else 0,
         "as_":   g["away_score"] if g["completed"] else 0,
-        "hw":    home_win,
         "gt":    g["game_type"],
     })
 
@@ -307,13 +302,10 @@ def populate_season(
             try:
                 if not has_game_type:
                     # Insertar sin columna game_type
-                    home_win = None
-                    if summary["completed"] and summary["home_score"] > 0:
-                        home_win = 1 if summary["home_score"] > summary["away_score"] else 0
                     conn.execute(text(f"""
                         INSERT INTO {espn_schema}.games
-                            (game_id, fecha, home_team, away_team, home_score, away_score, home_win)
-                        VALUES (:gid, :fecha, :ht, :at, :hs, :as_, :hw)
+                            (game_id, fecha, home_team, away_team, home_score, away_score)
+                        VALUES (:gid, :fecha, :ht, :at, :hs, :as_)
                         ON CONFLICT (game_id) DO NOTHING
                     """), {
                         "gid":  summary["game_id"],
@@ -322,7 +314,6 @@ def populate_season(
                         "at":   summary["away_team"],
                         "hs":   summary["home_score"] if summary["completed"] else 0,
                         "as_":  summary["away_score"] if summary["completed"] else 0,
-                        "hw":   home_win,
                     })
                 else:
                     insert_game(conn, espn_schema, summary)
@@ -108,16 +108,14 @@ def get_missing_games(engine, espn_schema: str, since: str) -> pd.DataFrame:
 
 
 def update_scores(conn, espn_schema: str, game_id: str, home_score: int, away_score: int):
-    """Actualiza scores y home_win en espn.games y ml_ready_games."""
-    # home_win es bigint en la BD → pasar 1/0 en lugar de True/False
-    home_win_int = 1 if home_score > away_score else 0
+    """Actualiza scores en espn.games y scores + home_win en ml_ready_games."""
+    # En espn.games home_win/point_diff son columnas generadas a partir de los scores
     conn.execute(text(f"""
         UPDATE {espn_schema}.games
         SET home_score = :hs,
-            away_score = :as_,
-            home_win   = :hw
+            away_score = :as_
         WHERE game_id::text = :gid
-    """), {"hs": home_score, "as_": away_score, "hw": home_win_int, "gid": game_id})
+    """), {"hs": home_score, "as_": away_score, "gid": game_id})
 
     # También actualiza ml_ready_games (home_win aquí es boolean)
     conn.execute(text(f"""
@@ -126,7 +124,7 @@ def update_scores(conn, espn_schema: str, game_id: str, home_score: int, away_sc
             away_score = :as_,
             home_win   = :hw
         WHERE game_id::text = :gid
-    """), {"hs": home_score, "as_": away_score, "hw": bool(home_win_int), "gid": game_id})
+    """), {"hs": home_score, "as_": away_score, "hw": home_score > away_score, "gid": game_id})
 
 
 # ---------------------------------------------------------------------------
@@ -1308,6 +1308,15 @@ class DataLoader:
             """, (self.config.schema, table_name))
             all_db_columns = [row[0] for row in cursor.fetchall()]
             
+            # Columnas generadas (GENERATED ALWAYS AS ... STORED, p.ej. home_win, point_diff en games):
+            # Postgres las calcula y rechaza valores explícitos
+            cursor.execute(f"""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name = %s AND is_generated = 'ALWAYS'
+            """, (self.config.schema, table_name))
+            generated_columns = {row[0] for row in cursor.fetchall()}
+            
             # Agregar columnas faltantes del CSV a la tabla
             columns_info = table_meta.get('columns', {})
             for col in columns:
@@ -1390,10 +1399,11 @@ class DataLoader:
             
             # Agregar columnas faltantes de la DB al DataFrame con None
             for col in all_db_columns:
-                if col not in df.columns:
+                if col not in df.columns and col not in generated_columns:
                     df[col] = None
             
-            # Usar TODAS las columnas del DataFrame (no solo las de la DB)
+            # Usar TODAS las columnas del DataFrame (no solo las de la DB), salvo las generadas
+            df = df.drop(columns=[col for col in df.columns if col in generated_columns])
             columns = list(df.columns)
         
         # Crear tabla temporal para cargar datos
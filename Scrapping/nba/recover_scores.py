@@ -121,13 +121,11 @@ def recover_scores(dry_run: bool = False):
                 conn.execute(text(f"""
                     UPDATE {schema}.games
                     SET home_score = :hs,
-                        away_score = :as_,
-                        home_win = :hw
+                        away_score = :as_
                     WHERE game_id = :gid
                 """), {
                     "hs": result["home_score"],
                     "as_": result["away_score"],
-                    "hw": result["home_win"],
                     "gid": gid,
                 })
             print("OK")
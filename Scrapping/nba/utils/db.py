@@ -136,9 +136,9 @@ def prepare_games_data(df):
     """
     try:
         # Seleccionar columnas relevantes para tabla games
+        # (home_win, point_diff y los *_diff son columnas generadas: Postgres las calcula)
         games_columns = [
             'game_id', 'fecha', 'home_team', 'away_team', 'home_score', 'away_score',
-            'home_win', 'point_diff', 'net_rating_diff', 'reb_diff', 'ast_diff', 'tov_diff',
             'home_fg_pct', 'home_3p_pct', 'home_ft_pct', 'home_reb', 'home_ast', 'home_stl', 'home_blk', 'home_to', 'home_pf', 'home_pts',
             'away_fg_pct', 'away_3p_pct', 'away_ft_pct', 'away_reb', 'away_ast', 'away_stl', 'away_blk', 'away_to', 'away_pf', 'away_pts'
         ]